@@ -1,3 +1,4 @@
+import argparse
 import os
 import platform
 import PyInstaller.__main__
@@ -7,6 +8,21 @@ project_root = os.path.dirname(os.path.abspath(__file__))
 # detect the correct path separator
 sep = ";" if platform.system() == "Windows" else ":"
 
+# Modules pygame can pull in that the game never uses. NumPy (via pygame.surfarray) and
+# pkg_resources (via pygame.pkgdata) alone account for over half of the import time.
+EXCLUDED_MODULES = [
+    "numpy",
+    "pkg_resources",
+    "setuptools",
+    "tkinter",
+]
+
+parser = argparse.ArgumentParser(description="Build the Tetris BOOM! executable.")
+parser.add_argument("--onedir", action="store_true",
+                    help="Build a folder instead of a single file. Starts faster, since nothing "
+                         "has to be unpacked to a temp directory on each launch")
+options = parser.parse_args()
+
 # construct the add-data arguments
 add_data = [
     f"{os.path.join(project_root, 'tetris_boom', 'assets')}{sep}tetris_boom/assets",
@@ -16,11 +32,15 @@ add_data = [
 # build arguments
 args = [
     f"{os.path.join(project_root, 'tetris_boom', 'main.py')}",
-    "--onefile",
+    "--onedir" if options.onedir else "--onefile",
     "--noconsole",
     "--name=TetrisBOOM",
 ]
 
+# leave out unused modules
+for module in EXCLUDED_MODULES:
+    args.append(f"--exclude-module={module}")
+
 # add folders
 for data in add_data:
     args.append(f"--add-data={data}")
@@ -28,4 +48,7 @@ for data in add_data:
 # run PyInstaller
 PyInstaller.__main__.run(args)
 
-print("\nBuild complete! Executable is in the 'dist' folder.\n")
+if options.onedir:
+    print("\nBuild complete! Executable is in the 'dist/TetrisBOOM' folder.\n")
+else:
+    print("\nBuild complete! Executable is in the 'dist' folder.\n")
@@ -0,0 +1,59 @@
+import io
+import csv
+import json
+import pytest
+from game.simulation.batch_runner import play_game, run_batch, ResultWriter, summarize, RESULT_FIELDS
+from game.simulation.policies import Policy, RandomPolicy
+
+
+class TestBatchRunner:
+    def test_play_game_is_reproducible(self):
+        assert play_game(3, base_seed=100) == play_game(3, base_seed=100)
+
+    def test_play_game_reports_all_fields(self):
+        result = play_game(0, max_steps=50)
+        assert set(result) == set(RESULT_FIELDS)
+        assert result["seed"] == 0
+        assert result["steps"] <= 50
+
+    def test_shape_weights_and_bomb_chance_are_applied(self):
+        weights = [0] * 13
+        weights[8] = 1  # only 2x2 squares
+        result = play_game(0, shape_weights=weights, bomb_chance=1.0, max_steps=200)
+        assert result["bombs_triggered"] == result["blocks_placed"]
+
+    def test_jsonl_stream(self):
+        stream = io.StringIO()
+        summary = run_batch(4, workers=1, writer=ResultWriter(stream, "jsonl"), max_steps=100)
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 4
+        assert [json.loads(line)["game_id"] for line in lines] == [0, 1, 2, 3]
+        assert summary["games"] == 4
+
+    def test_csv_stream(self):
+        stream = io.StringIO()
+        run_batch(2, workers=1, writer=ResultWriter(stream, "csv"), max_steps=100)
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        assert len(rows) == 2
+        assert list(rows[0]) == RESULT_FIELDS
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError):
+            ResultWriter(io.StringIO(), "xml")
+
+    def test_process_pool_matches_single_process(self):
+        stream_pool = io.StringIO()
+        stream_single = io.StringIO()
+        run_batch(6, base_seed=9, workers=2, writer=ResultWriter(stream_pool), max_steps=200)
+        run_batch(6, base_seed=9, workers=1, writer=ResultWriter(stream_single), max_steps=200)
+        assert sorted(stream_pool.getvalue().splitlines()) == sorted(stream_single.getvalue().splitlines())
+
+    def test_summarize_empty(self):
+        assert summarize([]) == {"games": 0}
+
+    def test_policy_without_choose_action_cannot_be_created(self):
+        class IdlePolicy(Policy):
+            pass
+
+        with pytest.raises(TypeError):
+            IdlePolicy()
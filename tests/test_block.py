@@ -113,3 +113,25 @@ class TestBlock:
         assert copied.screen_x == 0
         assert copied.screen_y == 0
 
+    def test_block_explicit_attributes(self):
+        block = Block(1, 2, shape=4, color_index=3, rotation=2, is_bomb=True)
+        assert (block.shape, block.color_index, block.rotation, block.is_bomb) == (4, 3, 2, True)
+
+    def test_block_copy_keeps_bomb(self):
+        block = Block(0, 0, shape=5, is_bomb=True)
+        assert block.copy().is_bomb is True
+
+    def test_block_has_no_instance_dict(self):
+        block = Block(0, 0)
+        assert not hasattr(block, "__dict__")
+        assert (block.screen_x, block.screen_y) == (0, 0)
+        with pytest.raises(AttributeError):
+            block.velocity = 1
+
+    def test_block_copy_is_independent(self):
+        block = Block(3, 4, shape=1, rotation=1)
+        copied = block.copy()
+        copied.move(1, 1)
+        copied.rotate()
+        copied.screen_x = 50
+        assert (block.x, block.y, block.rotation, block.screen_x) == (3, 4, 1, 0)
@@ -1,3 +1,4 @@
+import random
 import pytest
 from game.block_factory import BlockFactory
 from game.block import Block
@@ -36,3 +37,64 @@ class TestBlockFactory:
         block = factory.create_block()
         assert block.color_index >= 1
 
+    def test_create_block_uses_custom_weights(self):
+        weights = [0] * len(SHAPES)
+        weights[8] = 1
+        factory = BlockFactory(shape_weights=weights, bomb_chance=1.0)
+        for _ in range(20):
+            block = factory.create_block()
+            assert block.shape == 8
+            assert block.is_bomb is True
+
+    def test_wrong_number_of_weights_raises(self):
+        with pytest.raises(ValueError):
+            BlockFactory(shape_weights=[1, 2, 3])
+
+    def _signature(self, block):
+        return (block.shape, block.color_index, block.rotation, block.is_bomb)
+
+    def test_same_seed_gives_same_blocks(self):
+        first = BlockFactory(seed=42)
+        second = BlockFactory(seed=42)
+        assert [self._signature(first.create_block()) for _ in range(50)] == \
+            [self._signature(second.create_block()) for _ in range(50)]
+
+    def test_reseed_restarts_sequence(self):
+        factory = BlockFactory(seed=1)
+        sequence = [self._signature(factory.create_block()) for _ in range(10)]
+        factory.seed(1)
+        assert [self._signature(factory.create_block()) for _ in range(10)] == sequence
+
+    def test_injected_rng_is_used(self):
+        rng = random.Random(7)
+        factory = BlockFactory(rng=rng)
+        assert factory.rng is rng
+        expected = BlockFactory(seed=7)
+        assert self._signature(factory.create_block()) == self._signature(expected.create_block())
+
+    def test_peek_does_not_consume(self):
+        factory = BlockFactory(seed=3)
+        upcoming = [self._signature(block) for block in factory.peek(5)]
+        assert [self._signature(block) for block in factory.peek(5)] == upcoming
+        assert [self._signature(factory.create_block()) for _ in range(5)] == upcoming
+
+    def test_peek_beyond_one_batch(self):
+        factory = BlockFactory(seed=3)
+        upcoming = [self._signature(block) for block in factory.peek(200)]
+        assert len(upcoming) == 200
+        assert [self._signature(factory.create_block()) for _ in range(200)] == upcoming
+
+    def test_reseed_drops_pregenerated_blocks(self):
+        factory = BlockFactory(seed=2)
+        factory.peek(10)
+        factory.create_block()
+        factory.seed(2)
+        assert self._signature(factory.create_block()) == self._signature(BlockFactory(seed=2).create_block())
+
+    def test_rotation_within_range_over_many_blocks(self):
+        factory = BlockFactory(seed=0)
+        for _ in range(500):
+            block = factory.create_block()
+            assert 0 <= block.rotation < len(SHAPES[block.shape])
+            assert 1 <= block.color_index < 6
+
@@ -0,0 +1,277 @@
+import os
+import subprocess
+import sys
+import pytest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock
+from game.board import Board
+from game.block import Block
+from game.block_factory import BlockFactory
+from game.gamestate import GameState
+from game.score_manager import ScoreManager
+from game.modes.blockblast_mode import BlockBlastMode
+from game.modes.tetris_mode import TetrisMode
+from game.input_handlers.blockblast_input_handler import BlockBlastInputHandler
+from game.bots.blockblast_solver import BlockBlastSolver, legal_positions, move_fits
+from game.bots.blockblast_bot_driver import BlockBlastBotDriver
+from game.simulation.headless_engine import HeadlessEngine, BLOCKBLAST, place
+from game.simulation.policies import BotPolicy
+
+
+def fill_row(board, y, skip=()):
+    for x in range(board.cols):
+        if x not in skip:
+            board.grid[y][x] = 1
+
+
+class TestBlockBlastSolver:
+    def test_module_does_not_import_pygame(self):
+        game_dir = os.path.join(os.path.dirname(__file__), '..', 'tetris_boom')
+        code = (
+            "import sys; sys.path.insert(0, %r); "
+            "import game.bots.blockblast_solver; "
+            "assert 'pygame' not in sys.modules" % game_dir
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"objective": "speed"}, {"time_budget": 0}, {"beam_width": 0}, {"workers": 0}
+    ])
+    def test_invalid_arguments_raise(self, kwargs):
+        with pytest.raises(ValueError):
+            BlockBlastSolver(**kwargs)
+
+    def test_legal_positions_match_board_fits(self):
+        board = Board()
+        fill_row(board, 19)
+        block = Block(0, 0, shape=3)
+        positions = legal_positions(board, block)
+        assert positions
+        for x, y in positions:
+            block.x, block.y = x, y
+            assert board.is_valid_position(block)
+        assert all(y + block.get_shape_info().max_y < 19 for _, y in positions)
+
+    def test_move_fits_checks_index_and_position(self):
+        board = Board()
+        fill_row(board, 19)
+        tray = [Block(0, 0, shape=1)]
+        x, y = legal_positions(board, tray[0])[0]
+        assert move_fits(board, tray, (0, x, y))
+        assert not move_fits(board, tray, (1, x, y))
+        assert not move_fits(board, tray, (0, 0, 19))
+
+    def test_does_not_modify_board_or_tray(self):
+        board = Board()
+        fill_row(board, 19, skip=(0,))
+        tray = [Block(5, 5, shape=0), Block(5, 5, shape=3), Block(5, 5, shape=1)]
+        grid = [list(row) for row in board.grid]
+        BlockBlastSolver().solve(board, tray)
+        assert [list(row) for row in board.grid] == grid
+        assert all((block.x, block.y) == (5, 5) for block in tray)
+
+    def test_completes_a_row(self):
+        board = Board()
+        fill_row(board, 19, skip=(3, 4, 5, 6))
+        tray = [Block(0, 0, shape=1), Block(0, 0, shape=1), Block(0, 0, shape=0)]
+        solution = BlockBlastSolver().solve(board, tray)
+        assert solution.complete
+        assert solution.points >= 1
+        assert not solution.timed_out
+
+    def test_moves_replay_with_tray_indices(self):
+        engine = HeadlessEngine(seed=5, start_mode=BLOCKBLAST, switch_modes=False)
+        solution = BlockBlastSolver().solve(engine.board, engine.next_blocks[:3])
+        assert len(solution.moves) == 3
+        score = engine.score
+        for move in solution.moves:
+            result = engine.step(place(*move))
+            assert result.action_applied
+        assert engine.score - score == solution.points
+
+    def test_incomplete_when_pieces_do_not_fit(self):
+        board = Board(rows=4, cols=4)
+        for y in range(4):
+            fill_row(board, y)
+        board.grid[0][0] = 0
+        tray = [Block(0, 0, shape=3), Block(0, 0, shape=3), Block(0, 0, shape=3)]
+        solution = BlockBlastSolver().solve(board, tray)
+        assert solution.moves == []
+        assert not solution.complete
+
+    def test_returns_within_time_budget(self):
+        ticks = iter(range(1000))
+        solver = BlockBlastSolver(time_budget=3, clock=lambda: next(ticks))
+        engine = HeadlessEngine(seed=2, start_mode=BLOCKBLAST, switch_modes=False)
+        solution = solver.solve(engine.board, engine.next_blocks[:3])
+        assert solution.timed_out
+        assert solution.moves
+
+    def test_process_pool_finds_a_full_sequence(self):
+        engine = HeadlessEngine(seed=3, start_mode=BLOCKBLAST, switch_modes=False)
+        solver = BlockBlastSolver(time_budget=10, workers=2, beam_width=3)
+        try:
+            solution = solver.solve(engine.board, engine.next_blocks[:3])
+        finally:
+            solver.close()
+        serial = BlockBlastSolver(time_budget=10, beam_width=3).solve(engine.board, engine.next_blocks[:3])
+        assert solution.complete
+        assert solution.value == pytest.approx(serial.value)
+
+    def test_solve_async_matches_solve(self):
+        engine = HeadlessEngine(seed=4, start_mode=BLOCKBLAST, switch_modes=False)
+        solver = BlockBlastSolver(time_budget=10)
+        try:
+            future = solver.solve_async(engine.board, engine.next_blocks[:3])
+            engine.board.grid[0][0] = 1 - engine.board.grid[0][0]
+            solution = future.result()
+        finally:
+            solver.close()
+        engine.board.grid[0][0] = 1 - engine.board.grid[0][0]
+        expected = BlockBlastSolver(time_budget=10).solve(engine.board, engine.next_blocks[:3])
+        assert solution.moves == expected.moves
+        assert solution.value == pytest.approx(expected.value)
+
+    def test_broken_pool_result_is_none_and_pool_restarts(self):
+        engine = HeadlessEngine(seed=4, start_mode=BLOCKBLAST, switch_modes=False)
+        solver = BlockBlastSolver(time_budget=10)
+        try:
+            solver.solve_async(engine.board, engine.next_blocks[:3]).result()
+            broken = Future()
+            broken.set_exception(BrokenProcessPool())
+            assert solver.result(broken) is None
+            assert solver._executor is None
+            cancelled = Future()
+            cancelled.cancel()
+            assert solver.result(cancelled) is None
+            future = solver.solve_async(engine.board, engine.next_blocks[:3])
+            assert solver.result(future).moves
+        finally:
+            solver.close()
+
+    def test_transpositions_hit_the_table(self):
+        engine = HeadlessEngine(seed=5, start_mode=BLOCKBLAST, switch_modes=False)
+        solver = BlockBlastSolver(time_budget=10)
+        first = solver.solve(engine.board, engine.next_blocks[:3])
+        assert solver.table.hits > 0
+        hits = solver.table.hits
+        again = solver.solve(engine.board, engine.next_blocks[:3])
+        assert solver.table.hits == hits + 1
+        assert again.moves == first.moves
+        assert again.value == first.value
+
+    def test_table_size_bounds_the_table(self):
+        engine = HeadlessEngine(seed=5, start_mode=BLOCKBLAST, switch_modes=False)
+        solver = BlockBlastSolver(time_budget=10, table_size=50)
+        solution = solver.solve(engine.board, engine.next_blocks[:3])
+        assert solution.complete
+        assert len(solver.table) == 50
+        assert solver.table.evictions > 0
+
+    def test_policy_outlives_random_play(self):
+        policy = BotPolicy()
+        policy.reset(0)
+        engine = HeadlessEngine(seed=0, start_mode=BLOCKBLAST, switch_modes=False)
+        for _ in range(90):
+            action = policy.choose_action(engine)
+            if action is None:
+                break
+            engine.step(action)
+        assert not engine.game_over
+        assert engine.score > 0
+
+
+class TestBlockBlastHintAndDriver:
+    @pytest.fixture
+    def mode(self):
+        score_manager = MagicMock(spec=ScoreManager)
+        state = GameState(Board(), BlockFactory(seed=4), score_manager, MagicMock())
+        mode = BlockBlastMode(MagicMock(), state, MagicMock())
+        mode.input_handler = BlockBlastInputHandler(mode)
+        return mode
+
+    def test_place_block_refills_tray(self, mode):
+        handler = mode.input_handler
+        block = mode.state.next_blocks[1]
+        x, y = legal_positions(mode.state.board, block)[0]
+        assert handler.place_block(1, x, y)
+        assert block not in mode.state.next_blocks
+        assert len(mode.state.next_blocks) == 3
+        mode.state.score_manager.add_points.assert_called_once()
+
+    def test_place_block_rejects_bad_moves(self, mode):
+        handler = mode.input_handler
+        block = mode.state.next_blocks[0]
+        position = (block.x, block.y)
+        assert not handler.place_block(0, -5, 0)
+        assert not handler.place_block(3, 0, 0)
+        assert (block.x, block.y) == position
+        assert mode.state.board.version == 0
+
+    def test_hint_points_at_a_tray_piece(self, mode):
+        handler = mode.input_handler
+        handler.show_hint()
+        assert handler.hint is None
+        handler.update_hint(wait=True)
+        block, x, y = handler.hint
+        assert block in mode.state.next_blocks[:3]
+        assert mode.state.board.fits(block.shape, block.rotation, x, y)
+        handler.reset()
+        assert handler.hint is None
+
+    def test_mode_update_picks_up_hint(self, mode):
+        handler = mode.input_handler
+        handler.show_hint()
+        handler._hint_request[2].result()
+        mode.update()
+        assert handler.hint is not None
+
+    def test_hint_is_dropped_if_board_changed(self, mode):
+        handler = mode.input_handler
+        handler.show_hint()
+        mode.state.board.grid[0][0] = 1
+        handler.update_hint(wait=True)
+        assert handler.hint is None
+
+    def test_driver_places_one_piece_per_interval(self, mode):
+        driver = BlockBlastBotDriver(place_interval=0.5)
+        driver.update(mode, 0.3)
+        assert driver._request is None
+        driver.update(mode, 0.3)
+        assert mode.state.board.version == 0
+        driver._request[2].result()
+        driver.update(mode, 0.0)
+        assert mode.state.board.version > 0
+        assert len(driver._moves) == 2
+        driver.update(mode, 0.3)
+        assert len(driver._moves) == 2
+
+    def test_driver_waits_outside_blockblast_and_on_game_over(self, mode):
+        driver = BlockBlastBotDriver(place_interval=0)
+        mode.game_over = True
+        driver.update(mode, 1.0)
+        tetris_mode = TetrisMode(MagicMock(), mode.state, MagicMock())
+        driver.update(tetris_mode, 1.0)
+        assert mode.state.board.version == 0
+
+    def test_hint_is_dropped_if_worker_died(self, mode):
+        handler = mode.input_handler
+        handler.show_hint()
+        handler._hint_request[2].result()
+        broken = Future()
+        broken.set_exception(BrokenProcessPool())
+        handler._hint_request = handler._hint_request[:2] + (broken,)
+        handler.update_hint()
+        assert handler.hint is None
+        assert handler._hint_request is None
+        assert handler.solver._executor is None
+
+    def test_mode_close_shuts_down_hint_solver(self, mode):
+        mode.close()
+        handler = mode.input_handler
+        handler.show_hint()
+        assert handler.solver._executor is not None
+        mode.close()
+        assert handler.solver._executor is None
+        assert handler._hint_request is None
@@ -1,5 +1,6 @@
+import random
 import pytest
-from game.board import Board
+from game.board import Board, BOARD_BACKENDS
 from game.block import Block
 from game.data import SHAPES
 
@@ -65,6 +66,15 @@ class TestBoard:
         block2.rotation = 0
         assert board.is_valid_position(block2) is False
 
+    def test_fits_matches_is_valid_position(self):
+        board = Board()
+        board.grid[10][3] = 1
+        block = Block(0, 0, shape=1, rotation=1)
+        for y in range(-2, board.rows + 1):
+            for x in range(-2, board.cols + 1):
+                block.x, block.y = x, y
+                assert board.fits(1, 1, x, y) == board.is_valid_position(block)
+
     def test_freeze_block(self):
         board = Board()
         block = Block(4, 5)
@@ -157,3 +167,597 @@ class TestBoard:
         block.rotation = 0
         assert board.has_space_for_block(block) is False
 
+
+class TestBitboardBackend:
+    def _random_grid(self, rows, cols, seed):
+        rng = random.Random(seed)
+        return [[rng.randint(1, 5) if rng.random() < 0.4 else 0 for _ in range(cols)] for _ in range(rows)]
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            Board(backend="abacus")
+
+    def test_bitboard_tracks_direct_grid_writes(self):
+        board = Board(rows=5, cols=5, backend="bitboard")
+        board.grid[2][3] = 4
+        assert board.backend.row_masks[2] == 1 << 3
+        board.grid[2][3] = 0
+        assert board.backend.row_masks[2] == 0
+
+    def test_bitboard_rebuilds_on_grid_assignment(self):
+        board = Board(rows=3, cols=3, backend="bitboard")
+        board.grid = [[1, 0, 1], [0, 0, 0], [1, 1, 1]]
+        assert board.backend.row_masks == [0b101, 0, 0b111]
+
+    def test_is_valid_position_matches_list_backend(self):
+        list_board = Board()
+        bit_board = Board(backend="bitboard")
+        grid = self._random_grid(list_board.rows, list_board.cols, seed=7)
+        list_board.grid = grid
+        bit_board.grid = grid
+        block = Block(0, 0)
+        for shape in range(len(SHAPES)):
+            for rotation in range(len(SHAPES[shape])):
+                block.shape = shape
+                block.rotation = rotation
+                for y in range(-4, list_board.rows + 1):
+                    for x in range(-4, list_board.cols + 1):
+                        block.x = x
+                        block.y = y
+                        assert bit_board.is_valid_position(block) == list_board.is_valid_position(block)
+
+    def test_break_lines_matches_list_backend(self):
+        list_board = Board(rows=6, cols=6)
+        bit_board = Board(rows=6, cols=6, backend="bitboard")
+        for board in (list_board, bit_board):
+            for j in range(6):
+                board.grid[1][j] = 2
+                board.grid[4][j] = 3
+            for i in range(6):
+                board.grid[i][0] = 1
+            board.grid[2][3] = 5
+        assert bit_board.break_lines() == list_board.break_lines() == 3
+        assert bit_board.grid == list_board.grid
+        assert bit_board.backend.row_masks == [
+            sum(1 << j for j, cell in enumerate(row) if cell > 0) for row in list_board.grid
+        ]
+
+    def test_freeze_and_explode_keep_masks_in_sync(self):
+        board = Board(backend="bitboard")
+        block = Block(4, 5)
+        block.shape = 0
+        block.rotation = 0
+        board.freeze(block)
+        assert all(board.backend.row_masks[y] == 1 << 5 for y in range(5, 9))
+        board.explode_area(5, 6, radius=1)
+        assert board.backend.row_masks[5] == 0
+        assert board.backend.row_masks[8] == 1 << 5
+
+
+class TestGridTracking:
+    @pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+    def test_row_assignment_is_tracked(self, backend):
+        board = Board(backend=backend)
+        board.grid[19] = [1] * 10
+        board.grid[-2] = [0] * 9 + [2]
+        assert board.version == 2
+        assert board.row_counts[18:] == [1, 10]
+        assert board.col_heights[9] == 2
+        assert board.grid[19].y == 19 and board.grid[18].y == 18
+        assert board.break_lines() == 1
+        assert board.grid[19] == [0] * 9 + [2]
+        board.grid[19][0] = 3
+        assert board.row_counts[19] == 2
+
+    def test_slice_assignment_is_tracked(self):
+        board = Board(rows=4, cols=3, backend="bitboard")
+        board.grid[2:] = [[1, 1, 1], [0, 1, 0]]
+        assert board.backend.row_masks == [0, 0, 0b111, 0b010]
+        assert [row.y for row in board.grid] == [0, 1, 2, 3]
+        board.grid.reverse()
+        assert board.backend.row_masks == [0b010, 0b111, 0, 0]
+        assert board.grid[0].y == 0
+        board.grid[1].reverse()
+        board.grid[0][:] = [1, 0, 0]
+        assert board.backend.row_masks[:2] == [0b001, 0b111]
+
+    @pytest.mark.parametrize("mutate", [
+        lambda grid: grid.append([0] * 3),
+        lambda grid: grid.pop(),
+        lambda grid: grid.__delitem__(0),
+        lambda grid: grid.__iadd__([[0] * 3]),
+        lambda grid: grid.clear(),
+        lambda grid: grid[0].append(1),
+        lambda grid: grid[0].pop(),
+        lambda grid: grid[0].__delitem__(0),
+        lambda grid: grid[0].__iadd__([1]),
+        lambda grid: grid[0].insert(0, 1),
+    ])
+    def test_resizing_raises(self, mutate):
+        board = Board(rows=4, cols=3)
+        board.grid[0][0] = 1
+        with pytest.raises(TypeError):
+            mutate(board.grid)
+        assert len(board.grid) == 4 and all(len(row) == 3 for row in board.grid)
+        assert board.row_counts[0] == 1
+
+    @pytest.mark.parametrize("mutate", [
+        lambda grid: grid.__setitem__(slice(0, 2), [[0] * 3]),
+        lambda grid: grid.__setitem__(0, [0] * 4),
+        lambda grid: grid[0].__setitem__(slice(0, 1), [1, 1]),
+    ])
+    def test_reshaping_assignment_raises(self, mutate):
+        board = Board(rows=4, cols=3)
+        with pytest.raises(ValueError):
+            mutate(board.grid)
+        assert len(board.grid) == 4 and all(len(row) == 3 for row in board.grid)
+
+
+class TestPlacementIndex:
+    def _brute_force(self, board, shape, rotation):
+        block = Block(0, 0)
+        block.shape = shape
+        block.rotation = rotation
+        for y in range(-4, board.rows):
+            for x in range(-4, board.cols):
+                block.x = x
+                block.y = y
+                cells_on_board = all(0 <= py < board.rows for _, py in block.get_board_positions())
+                if cells_on_board and board.is_valid_position(block):
+                    return True
+        return False
+
+    def test_has_space_does_not_move_block(self):
+        board = Board()
+        block = Block(3, 0)
+        block.shape = 0
+        assert board.has_space_for_block(block) is True
+        assert (block.x, block.y) == (3, 0)
+
+    def test_shape_fits_only_in_first_column(self):
+        board = Board(rows=4, cols=4)
+        for i in range(4):
+            for j in range(1, 4):
+                board.grid[i][j] = 1
+        assert board.placement_index.find_position(0, 0) == (-1, 0)
+
+    def test_cached_false_stays_false_until_cells_are_cleared(self):
+        board = Board(rows=4, cols=4)
+        for i in range(4):
+            for j in range(4):
+                board.grid[i][j] = 1
+        assert board.placement_index.has_space(8, 0) is False
+        board.grid[0][0] = 2
+        assert board.placement_index.has_space(8, 0) is False
+        board.explode_area(1, 1, radius=1)
+        assert board.placement_index.has_space(8, 0) is True
+
+    def test_witness_is_revalidated_after_freeze(self):
+        board = Board(rows=4, cols=4)
+        x, y = board.placement_index.find_position(8, 0)
+        blocker = Block(x, y)
+        blocker.shape = 8
+        board.freeze(blocker)
+        new_position = board.placement_index.find_position(8, 0)
+        assert new_position is not None
+        assert new_position != (x, y)
+
+    @pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+    def test_matches_brute_force_on_random_boards(self, backend):
+        rng = random.Random(3)
+        board = Board(rows=8, cols=8, backend=backend)
+        for _ in range(30):
+            i, j = rng.randrange(8), rng.randrange(8)
+            board.grid[i][j] = 0 if board.grid[i][j] else 1
+            for shape in range(len(SHAPES)):
+                for rotation in range(len(SHAPES[shape])):
+                    assert board.placement_index.has_space(shape, rotation) == self._brute_force(board, shape, rotation)
+
+
+class TestBoardChanges:
+    def test_new_board_starts_at_version_zero(self):
+        board = Board()
+        assert board.version == 0
+        assert len(board.change_log) == 0
+
+    def test_freeze_records_one_change(self):
+        board = Board()
+        received = []
+        board.subscribe(received.append)
+        block = Block(4, 5)
+        block.shape = 0
+        block.rotation = 0
+        board.freeze(block)
+        assert board.version == 1
+        assert len(received) == 1
+        change = received[0]
+        assert change.action == "freeze"
+        assert change.version == 1
+        assert change.set_cells == {(5, 5), (5, 6), (5, 7), (5, 8)}
+        assert change.cleared_cells == set()
+
+    def test_explode_bomb_is_a_single_change(self):
+        board = Board(rows=5, cols=5)
+        board.grid[2][2] = 1
+        version = board.version
+        bomb = Block(1, 1)
+        bomb.shape = 6
+        bomb.is_bomb = True
+        board.explode_bomb(bomb)
+        assert board.version == version + 1
+        change = board.change_log[-1]
+        assert change.action == "explode_bomb"
+        assert change.cleared_cells == {(2, 2)}
+
+    def test_break_lines_reports_rows_cols_and_shift(self):
+        board = Board(rows=5, cols=5)
+        for j in range(5):
+            board.grid[3][j] = 1
+        board.grid[1][4] = 2
+        board.break_lines()
+        change = board.change_log[-1]
+        assert change.action == "break_lines"
+        assert change.cleared_rows == [3]
+        assert change.cleared_cols == []
+        assert change.shifted_rows == [1, 2, 3]
+        assert change.set_cells == change.cleared_cells == set()
+        assert {(4, 1), (4, 2), (0, 3)} <= change.dirty_cells()
+        assert change.dirty_rows() == {1, 2, 3}
+
+    def test_no_op_does_not_bump_version(self):
+        board = Board()
+        board.break_lines()
+        board.explode_area(5, 5)
+        assert board.version == 0
+
+    def test_changes_since(self):
+        board = Board()
+        board.grid[0][0] = 1
+        board.grid[0][1] = 1
+        board.grid[0][0] = 0
+        changes = board.changes_since(1)
+        assert [change.version for change in changes] == [2, 3]
+        assert board.changes_since(board.version) == []
+
+    def test_changes_since_returns_none_when_log_is_exhausted(self):
+        board = Board()
+        for i in range(100):
+            board.grid[0][0] = i % 2 + 1
+        assert board.changes_since(0) is None
+
+    def test_unsubscribe(self):
+        board = Board()
+        received = []
+        board.subscribe(received.append)
+        board.unsubscribe(received.append)
+        board.grid[0][0] = 1
+        assert received == []
+
+
+class TestOccupancyCounters:
+    def _reference_break_lines(self, grid, rows, cols):
+        rows_to_clear = [i for i, row in enumerate(grid) if all(cell > 0 for cell in row)]
+        cols_to_clear = [j for j in range(cols) if all(grid[i][j] > 0 for i in range(rows))]
+        new_grid = [
+            [0 if j in cols_to_clear else cell for j, cell in enumerate(row)]
+            for i, row in enumerate(grid) if i not in rows_to_clear
+        ]
+        new_grid = [[0] * cols for _ in rows_to_clear] + new_grid
+        return len(rows_to_clear) + len(cols_to_clear), new_grid
+
+    def test_counters_follow_freeze_and_explosions(self):
+        board = Board()
+        block = Block(0, 0)
+        block.shape = 0
+        block.rotation = 1  # horizontal I on row 1, columns 0-3
+        board.freeze(block)
+        assert board.row_counts[1] == 4
+        assert board.col_counts[:4] == [1, 1, 1, 1]
+        board.explode_area(0, 1, radius=1)
+        assert board.row_counts[1] == 2
+        assert board.col_counts[:4] == [0, 0, 1, 1]
+
+    def test_counters_rebuilt_on_grid_assignment(self):
+        board = Board(rows=2, cols=3)
+        board.grid = [[1, 0, 1], [1, 1, 1]]
+        assert board.row_counts == [2, 3]
+        assert board.col_counts == [2, 1, 2]
+
+    def test_rows_below_cleared_lines_are_untouched(self):
+        board = Board(rows=6, cols=4)
+        for j in range(4):
+            board.grid[2][j] = 1
+        board.grid[5][0] = 3
+        board.grid[0][1] = 2
+        board.break_lines()
+        change = board.change_log[-1]
+        assert all(y <= 2 for _, y in change.dirty_cells())
+        assert board.grid[5][0] == 3
+        assert board.grid[1][1] == 2
+
+    @pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+    @pytest.mark.parametrize("rows, cols", [(5, 5), (20, 10), (40, 30)])
+    def test_break_lines_matches_reference(self, backend, rows, cols):
+        rng = random.Random(rows * cols)
+        for _ in range(20):
+            grid = [[rng.randint(1, 5) if rng.random() < 0.85 else 0 for _ in range(cols)] for _ in range(rows)]
+            for i in rng.sample(range(rows), 3):
+                grid[i] = [1] * cols
+            for j in rng.sample(range(cols), 2):
+                for i in range(rows):
+                    grid[i][j] = grid[i][j] or 2
+            expected_lines, expected_grid = self._reference_break_lines(grid, rows, cols)
+
+            board = Board(rows=rows, cols=cols, backend=backend)
+            board.grid = grid
+            assert board.break_lines() == expected_lines
+            assert board.grid == expected_grid
+            assert board.row_counts == [sum(1 for cell in row if cell > 0) for row in expected_grid]
+            assert board.col_counts == [sum(1 for row in expected_grid if row[j] > 0) for j in range(cols)]
+
+            reference = Board(rows=rows, cols=cols, backend=backend)
+            reference.grid = expected_grid
+            assert board.col_heights == reference.col_heights
+            assert board.zobrist_hash == reference.zobrist_hash
+            assert [row.y for row in board.grid] == list(range(rows))
+            assert all(
+                board.fits(1, 0, x, y) == reference.fits(1, 0, x, y)
+                for y in range(-1, rows) for x in range(-1, cols)
+            )
+
+    @pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+    def test_moved_rows_stay_tracked(self, backend):
+        board = Board(rows=6, cols=4, backend=backend)
+        board.grid[3][:] = [1] * 4
+        board.grid[1][2] = 2
+        moved = board.grid[1]
+        board.break_lines()
+        assert board.grid[2] is moved
+        board.grid[2][0] = 3
+        assert board.row_counts[2] == 2
+        assert board.col_heights[0] == 4
+        assert board.fits(0, 1, 0, 0) and not board.fits(0, 1, 0, 1)
+        assert board.change_log[-1].set_cells == {(0, 2)}
+
+
+class TestDropDistance:
+    def _reference_drop_distance(self, board, block):
+        if not board.is_valid_position(block):
+            return 0
+        probe = block.copy()
+        while board.is_valid_position(probe):
+            probe.move(0, 1)
+        return probe.y - 1 - block.y
+
+    def test_column_heights_follow_writes(self):
+        board = Board(rows=6, cols=3)
+        board.grid[4][0] = 1
+        board.grid[2][0] = 1
+        assert board.col_heights == [4, 0, 0]
+        board.grid[2][0] = 0
+        assert board.col_heights == [2, 0, 0]
+        board.grid[4][0] = 0
+        assert board.col_heights == [0, 0, 0]
+
+    def test_column_heights_rebuilt_on_grid_assignment(self):
+        board = Board(rows=3, cols=3)
+        board.grid = [[0, 1, 0], [0, 0, 0], [1, 1, 0]]
+        assert board.col_heights == [1, 3, 0]
+
+    def test_drop_to_floor_and_onto_stack(self):
+        board = Board()
+        block = Block(4, 0, shape=0, rotation=0)  # vertical I in column 5
+        assert board.drop_distance(block) == board.rows - 4
+        board.grid[15][5] = 1
+        assert board.drop_distance(block) == 11
+        assert (block.x, block.y) == (4, 0)
+
+    def test_block_under_an_overhang(self):
+        board = Board(rows=10, cols=4)
+        for x in range(3):
+            board.grid[2][x] = 1
+        block = Block(0, 4, shape=0, rotation=0)  # vertical I in column 1, below the ledge
+        assert board.drop_distance(block) == 2
+
+    def test_invalid_position_cannot_drop(self):
+        board = Board()
+        board.grid[1][5] = 1
+        assert board.drop_distance(Block(4, 0, shape=0, rotation=0)) == 0
+
+    @pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+    def test_matches_row_by_row_search(self, backend):
+        rng = random.Random(11)
+        for _ in range(10):
+            board = Board(backend=backend)
+            board.grid = [[1 if rng.random() < 0.25 and y > 6 else 0 for _ in range(10)] for y in range(20)]
+            for _ in range(rng.randint(0, 5)):
+                board.break_lines()
+                board.grid[rng.randrange(20)][rng.randrange(10)] = 0
+            block = Block(0, 0)
+            for shape in range(len(SHAPES)):
+                for rotation in range(len(SHAPES[shape])):
+                    block.shape, block.rotation = shape, rotation
+                    for y in range(-3, 20):
+                        for x in range(-3, 10):
+                            block.x, block.y = x, y
+                            assert board.drop_distance(block) == self._reference_drop_distance(board, block)
+            assert board.col_heights == [
+                next((20 - y for y in range(20) if board.grid[y][x] > 0), 0) for x in range(10)
+            ]
+
+
+class TestBoardCopy:
+    @pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+    def test_copy_is_independent(self, backend):
+        board = Board(rows=6, cols=4, backend=backend)
+        board.grid = [[0] * 4 for _ in range(4)] + [[2, 0, 0, 0], [1, 1, 1, 0]]
+        listener = []
+        board.subscribe(listener.append)
+        copy = board.copy()
+
+        assert copy.grid == board.grid
+        assert (copy.row_counts, copy.col_counts, copy.col_heights) == (board.row_counts, board.col_counts, board.col_heights)
+        assert copy.fits(0, 1, 0, 3) == board.fits(0, 1, 0, 3)
+
+        copy.grid[5][3] = 1
+        assert copy.break_lines() == 1
+        assert board.grid[5] == [1, 1, 1, 0]
+        assert board.row_counts[5] == 3
+        assert listener == []
+
+
+class TestZobristHash:
+    def _recomputed(self, board):
+        copy = Board(board.rows, board.cols)
+        copy.grid = [list(row) for row in board.grid]
+        return copy.zobrist_hash
+
+    def test_empty_boards_hash_to_zero(self):
+        assert Board().zobrist_hash == 0
+
+    @pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+    def test_incremental_hash_matches_recomputed(self, backend):
+        board = Board(backend=backend)
+        rng = random.Random(7)
+        for _ in range(200):
+            block = Block(rng.randrange(-1, 9), rng.randrange(0, 18), shape=rng.randrange(len(SHAPES)),
+                          is_bomb=rng.random() < 0.1)
+            if not board.is_valid_position(block):
+                continue
+            board.freeze(block)
+            if block.is_bomb:
+                board.explode_bomb(block)
+            board.break_lines()
+            assert board.zobrist_hash == self._recomputed(board)
+        board.explode_area(4, 15, 2)
+        assert board.zobrist_hash == self._recomputed(board)
+
+    def test_hash_tracks_occupancy_not_history_or_color(self):
+        first = Board()
+        first.freeze(Block(0, 0, shape=1, color_index=1))
+        first.freeze(Block(4, 4, shape=2, color_index=2))
+        second = Board()
+        second.freeze(Block(4, 4, shape=2, color_index=5))
+        second.freeze(Block(0, 0, shape=1, color_index=3))
+        assert first.zobrist_hash == second.zobrist_hash != 0
+
+        first.grid[19][0] = 1
+        assert first.zobrist_hash != second.zobrist_hash
+        first.grid[19][0] = 0
+        assert first.zobrist_hash == second.zobrist_hash
+
+    def test_copy_keeps_hash_and_diverges(self):
+        board = Board()
+        board.freeze(Block(3, 10, shape=0))
+        copy = board.copy()
+        assert copy.zobrist_hash == board.zobrist_hash
+        copy.grid[0][0] = 1
+        assert copy.zobrist_hash != board.zobrist_hash
+
+
+class TestExplosionBackends:
+    def _reference_explode(self, grid, rows, cols, centers, radius):
+        grid = [row[:] for row in grid]
+        cleared = 0
+        for center_x, center_y in centers:
+            for dy in range(-radius, radius + 1):
+                for dx in range(-radius, radius + 1):
+                    x = center_x + dx
+                    y = center_y + dy
+                    if 0 <= x < cols and 0 <= y < rows:
+                        if grid[y][x] > 0:
+                            cleared += 1
+                        grid[y][x] = 0
+        return cleared, grid
+
+    @pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+    def test_explode_bomb_matches_reference(self, backend):
+        rng = random.Random(11)
+        for _ in range(40):
+            grid = [[rng.randint(1, 5) if rng.random() < 0.7 else 0 for _ in range(12)] for _ in range(15)]
+            bomb = Block(rng.randint(-2, 10), rng.randint(-2, 13))
+            bomb.shape = rng.randrange(len(SHAPES))
+            bomb.rotation = rng.randrange(len(SHAPES[bomb.shape]))
+            bomb.is_bomb = True
+            centers = [
+                (x, y) for x, y in bomb.get_board_positions()
+                if 0 <= y < 15 and 0 <= x < 12
+            ]
+            expected_cleared, expected_grid = self._reference_explode(
+                grid, 15, 12, centers, bomb.get_explosion_radius()
+            )
+
+            board = Board(rows=15, cols=12, backend=backend)
+            board.grid = grid
+            assert board.explode_bomb(bomb) == expected_cleared
+            assert board.grid == expected_grid
+
+    @pytest.mark.parametrize("backend", sorted(BOARD_BACKENDS))
+    @pytest.mark.parametrize("center", [(0, 0), (-1, 2), (6, -2), (9, 4), (12, 12)])
+    def test_explode_area_off_board_centers(self, backend, center):
+        grid = [[1] * 8 for _ in range(6)]
+        expected_cleared, expected_grid = self._reference_explode(grid, 6, 8, [center], 2)
+        board = Board(rows=6, cols=8, backend=backend)
+        board.grid = grid
+        assert board.explode_area(center[0], center[1], radius=2) == expected_cleared
+        assert board.grid == expected_grid
+
+
+class TestNumpyBackend:
+    def test_numpy_mirror_tracks_writes(self):
+        pytest.importorskip("numpy")
+        board = Board(rows=4, cols=4, backend="numpy")
+        board.grid[1][2] = 3
+        assert board.backend.cells[1, 2]
+        board.break_lines()
+        board.grid[1][2] = 0
+        assert not board.backend.cells.any()
+
+    def test_is_valid_position_matches_list_backend(self):
+        pytest.importorskip("numpy")
+        rng = random.Random(5)
+        grid = [[1 if rng.random() < 0.3 else 0 for _ in range(10)] for _ in range(20)]
+        list_board = Board()
+        numpy_board = Board(backend="numpy")
+        list_board.grid = grid
+        numpy_board.grid = grid
+        block = Block(0, 0)
+        for shape in range(len(SHAPES)):
+            for rotation in range(len(SHAPES[shape])):
+                block.shape = shape
+                block.rotation = rotation
+                for y in range(-4, 21):
+                    for x in range(-4, 11):
+                        block.x = x
+                        block.y = y
+                        assert numpy_board.is_valid_position(block) == list_board.is_valid_position(block)
+
+    def test_bulk_writes_match_list_backend(self):
+        pytest.importorskip("numpy")
+        list_board = Board(rows=12, cols=9)
+        numpy_board = Board(rows=12, cols=9, backend="numpy")
+        rng = random.Random(9)
+        for _ in range(150):
+            block = Block(rng.randrange(-1, 8), rng.randrange(-1, 11), shape=rng.randrange(len(SHAPES)),
+                          is_bomb=rng.random() < 0.2, color_index=rng.randint(1, 5))
+            if not list_board.is_valid_position(block):
+                continue
+            for board in (list_board, numpy_board):
+                board.freeze(block)
+                if block.is_bomb:
+                    board.explode_bomb(block)
+                board.break_lines()
+            assert numpy_board.change_log[-1].dirty_cells() == list_board.change_log[-1].dirty_cells()
+            for name in ("grid", "row_counts", "col_counts", "col_heights", "zobrist_hash"):
+                assert getattr(numpy_board, name) == getattr(list_board, name)
+            assert numpy_board.backend.cells.tolist() == [[cell > 0 for cell in row] for row in list_board.grid]
+
+    def test_freeze_over_filled_cells_only_recolors(self):
+        pytest.importorskip("numpy")
+        board = Board(rows=6, cols=6, backend="numpy")
+        board.grid[2][3] = 1
+        board.freeze(Block(2, 1, shape=0, rotation=1, color_index=4))  # row 2, columns 2-5
+        assert board.grid[2][2:6] == [4, 4, 4, 4]
+        assert board.row_counts[2] == 4
+        assert board.col_counts == [0, 0, 1, 1, 1, 1]
+        assert board.change_log[-1].set_cells == {(2, 2), (3, 2), (4, 2), (5, 2)}
@@ -0,0 +1,160 @@
+import os
+import random
+import pytest
+import pygame
+from unittest.mock import MagicMock, patch
+from game.board import Board
+from game.block import Block
+from game.block_factory import BlockFactory
+from game.score_manager import ScoreManager
+from game.gamestate import GameState
+from game.modes.tetris_mode import TetrisMode
+from game.modes.blockblast_mode import BlockBlastMode
+from game.renderers.tetris_renderer import TetrisRenderer
+from game.renderers.blockblast_renderer import BlockBlastRenderer
+from game.input_handlers.blockblast_input_handler import BlockBlastInputHandler
+
+
+@pytest.fixture
+def display():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((500, 500))
+    yield screen
+    pygame.display.quit()
+
+
+@pytest.fixture
+def state():
+    sound_manager = MagicMock()
+    score_manager = MagicMock(spec=ScoreManager)
+    score_manager.get_score.return_value = 0
+    score_manager.get_highscore.return_value = 10
+    score_manager.get_highscore_player.return_value = "Player"
+    score_manager.player_name = "Player"
+    score_manager.get_leaderboard.return_value = [{"name": "Player", "score": 10}]
+    return GameState(Board(), BlockFactory(seed=3), score_manager, sound_manager)
+
+
+def make_renderers(renderer_class, mode, display):
+    """A dirty-rect renderer on the display and a full-redraw reference on an offscreen surface."""
+    dirty = renderer_class(display, mode)
+    reference = renderer_class(pygame.Surface(display.get_size()), mode)
+    reference.dirty_rendering = False
+    return dirty, reference
+
+
+def assert_same_frame(dirty, reference, ticks):
+    with patch("pygame.time.get_ticks", return_value=ticks):
+        dirty.render()
+        reference.render()
+    assert pygame.image.tostring(dirty.screen, "RGB") == pygame.image.tostring(reference.screen, "RGB")
+
+
+class TestDirtyRendering:
+    def test_tetris_frames_match_full_redraw(self, display, state):
+        mode = TetrisMode(display, state, None)
+        dirty, reference = make_renderers(TetrisRenderer, mode, display)
+        mode.renderer = dirty
+        mode.pressing_down = True
+        rng = random.Random(1)
+
+        for frame in range(300):
+            action = rng.random()
+            block = state.current_block
+            if action < 0.2:
+                dx = rng.choice([-1, 1])
+                block.move(dx, 0)
+                if not state.board.is_valid_position(block):
+                    block.move(-dx, 0)
+            elif action < 0.3:
+                state.current_block = Block(block.x, block.y, shape=block.shape, color_index=block.color_index,
+                                            rotation=block.rotation, is_bomb=not block.is_bomb)
+            if frame == 150:
+                dirty.toggle_theme()
+                reference.toggle_theme()
+            if frame % 25 == 0:
+                state.score_manager.get_score.return_value += 7
+            mode.update()
+            if mode.game_over:
+                break
+            assert_same_frame(dirty, reference, frame * 40)
+
+    def test_blockblast_frames_match_full_redraw(self, display, state):
+        mode = BlockBlastMode(display, state, None)
+        dirty, reference = make_renderers(BlockBlastRenderer, mode, display)
+        mode.renderer = dirty
+        mode.input_handler = BlockBlastInputHandler(mode)
+        state.next_blocks[0] = Block(0, 0, shape=1, color_index=2, is_bomb=True)
+
+        for frame, (x, y) in enumerate([(200, 200), (220, 260), (240, 300), (240, 300), (100, 400)]):
+            mode.input_handler.dragging_block = state.next_blocks[0] if frame < 4 else None
+            with patch("pygame.mouse.get_pos", return_value=(x, y)):
+                assert_same_frame(dirty, reference, frame * 150)
+
+        for y in range(3):
+            for x in range(10):
+                state.board.grid[y][x] = 1
+        state.board.break_lines()
+        assert_same_frame(dirty, reference, 0)
+
+    def test_unchanged_frame_updates_nothing(self, display, state):
+        mode = TetrisMode(display, state, None)
+        renderer = TetrisRenderer(display, mode)
+        with patch("pygame.display.flip") as flip, patch("pygame.display.update") as update:
+            renderer.render()
+            renderer.render()
+        assert flip.call_count == 1
+        update.assert_not_called()
+
+    def test_falling_block_only_updates_its_old_and_new_cells(self, display, state):
+        mode = TetrisMode(display, state, None)
+        renderer = TetrisRenderer(display, mode)
+        renderer.render()
+        state.current_block.y += 1
+        with patch("pygame.display.update") as update:
+            renderer.render()
+        rects = update.call_args[0][0]
+        assert sum(rect.width * rect.height for rect in rects) < display.get_width() * display.get_height() // 10
+
+    def test_ghost_piece_marks_landing_row(self, display, state):
+        mode = TetrisMode(display, state, None)
+        renderer = TetrisRenderer(display, mode)
+        block = state.current_block
+        distance = state.board.drop_distance(block)
+        renderer.render()
+        ghost = dict(renderer._frame_sprites)["ghost"]
+        landing_y = renderer.offset_y + (block.y + distance) * 20
+        assert min(y for _, _, _, y in ghost) == landing_y + block.get_shape_info().min_y * 20
+
+        block.move(0, distance)
+        renderer.render()
+        assert dict(renderer._frame_sprites)["ghost"] == ()
+
+    def test_hint_outlines_suggested_placement(self, display, state):
+        mode = BlockBlastMode(display, state, None)
+        dirty, reference = make_renderers(BlockBlastRenderer, mode, display)
+        mode.renderer = dirty
+        mode.input_handler = BlockBlastInputHandler(mode)
+        mode.input_handler.show_hint()
+        mode.input_handler.update_hint(wait=True)
+        block, x, y = mode.input_handler.hint
+        assert_same_frame(dirty, reference, 0)
+        hint = dict(dirty._frame_sprites)["hint"]
+        assert min(tile[3] for tile in hint) == dirty.offset_y + (y + block.get_shape_info().min_y) * 20
+
+        assert mode.input_handler.place_block(state.next_blocks.index(block), x, y)
+        assert_same_frame(dirty, reference, 0)
+        assert dict(dirty._frame_sprites)["hint"] == ()
+
+    def test_game_over_and_theme_changes_redraw_everything(self, display, state):
+        mode = TetrisMode(display, state, None)
+        renderer = TetrisRenderer(display, mode)
+        renderer.render()
+        with patch("pygame.display.flip") as flip:
+            renderer.toggle_theme()
+            renderer.render()
+            mode.game_over = True
+            renderer.render()
+        assert flip.call_count == 2
@@ -0,0 +1,20 @@
+import pygame
+from game.renderers.font_cache import get_font, clear_fonts
+
+
+class TestFontCache:
+    def setup_method(self):
+        pygame.font.init()
+        clear_fonts()
+
+    def test_same_font_is_created_once(self):
+        assert get_font("Calibri", 20, True) is get_font("Calibri", 20, True)
+
+    def test_different_styles_are_separate_fonts(self):
+        assert get_font("Calibri", 20, True) is not get_font("Calibri", 20, False)
+        assert get_font("Calibri", 20, True) is not get_font("Calibri", 35, True)
+
+    def test_clear_fonts_drops_cached_fonts(self):
+        font = get_font("Calibri", 20)
+        clear_fonts()
+        assert get_font("Calibri", 20) is not font
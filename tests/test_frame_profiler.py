@@ -0,0 +1,108 @@
+import io
+import json
+import pygame
+import pytest
+from unittest.mock import MagicMock
+from game.frame_profiler import FrameProfiler, PHASES, percentile
+from game.renderers.profiler_overlay import ProfilerOverlay
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000.0
+
+
+def record_frame(profiler, clock, **phase_ms):
+    profiler.begin_frame()
+    for phase in PHASES:
+        clock.advance(phase_ms.get(phase, 0.0))
+        profiler.mark(phase)
+    profiler.end_frame()
+
+
+class TestFrameProfiler:
+    def test_phase_times_are_recorded(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(target_fps=30, clock=clock)
+        record_frame(profiler, clock, events=1, update=2, render=3, flip=4, tick=20)
+        frame = profiler.frames[0]
+        assert frame["events"] == pytest.approx(1)
+        assert frame["render"] == pytest.approx(3)
+        assert frame["total"] == pytest.approx(30)
+
+    def test_ring_buffer_keeps_latest_frames(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(target_fps=30, capacity=3, clock=clock)
+        for ms in range(5):
+            record_frame(profiler, clock, update=ms)
+        assert [frame["frame"] for frame in profiler.frames] == [2, 3, 4]
+        assert profiler.frame_count == 5
+
+    def test_percentiles(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(target_fps=30, clock=clock)
+        for ms in range(1, 101):
+            record_frame(profiler, clock, render=ms)
+        assert profiler.percentile(50) == pytest.approx(50)
+        assert profiler.percentile(95) == pytest.approx(95)
+        assert profiler.percentile(99, "render") == pytest.approx(99)
+        assert FrameProfiler(target_fps=30).percentile(50) == 0.0
+
+    def test_dropped_frames_ignore_tick_wait(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(target_fps=30, clock=clock)
+        record_frame(profiler, clock, render=10, tick=23)
+        record_frame(profiler, clock, render=40)
+        assert profiler.dropped_frames() == 1
+        assert profiler.summary()["dropped"] == 1
+
+    def test_dump_writes_one_json_line_per_frame(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(target_fps=30, clock=clock)
+        record_frame(profiler, clock, update=1)
+        record_frame(profiler, clock, update=50)
+        stream = io.StringIO()
+        profiler.dump(stream)
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [record["frame"] for record in records] == [0, 1]
+        assert records[1]["dropped"] is True
+        assert set(PHASES) <= set(records[0])
+
+    def test_unknown_phase_raises(self):
+        profiler = FrameProfiler(target_fps=30)
+        profiler.begin_frame()
+        with pytest.raises(ValueError):
+            profiler.mark("physics")
+
+    def test_percentile_uses_nearest_rank(self):
+        values = [1.0, 2.0, 3.0, 4.0]
+        assert percentile(values, 50) == 2.0
+        assert percentile(values, 51) == 3.0
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 100) == 4.0
+
+
+class TestProfilerOverlay:
+    def test_text_is_rendered_only_when_numbers_change(self):
+        pygame.font.init()
+        clock = FakeClock()
+        profiler = FrameProfiler(target_fps=30, clock=clock)
+        record_frame(profiler, clock, render=10)
+        overlay = ProfilerOverlay(profiler)
+        overlay.font = MagicMock()
+        overlay.font.render.side_effect = lambda text, antialias, color: pygame.Surface((10, 10))
+        screen = pygame.Surface((400, 300))
+
+        overlay.draw(screen)
+        overlay.draw(screen)
+        assert overlay.font.render.call_count == 3
+
+        record_frame(profiler, clock, render=10)
+        overlay.draw(screen)
+        assert overlay.font.render.call_count == 4
@@ -0,0 +1,143 @@
+import os
+import subprocess
+import sys
+import pytest
+from game.simulation.headless_engine import (
+    HeadlessEngine, TETRIS, BLOCKBLAST, MOVE_LEFT, MOVE_RIGHT, ROTATE, SOFT_DROP, HARD_DROP, place
+)
+from game.block import Block
+
+
+class StubFactory:
+    """Hands out copies of a fixed block so tests are deterministic."""
+    def __init__(self, shape=8, rotation=0, is_bomb=False, spawn_x=3):
+        self.shape = shape
+        self.spawn_x = spawn_x
+        self.rotation = rotation
+        self.is_bomb = is_bomb
+
+    def create_block(self, x=None, y=0):
+        block = Block(self.spawn_x if x is None else x, y)
+        block.shape = self.shape
+        block.rotation = self.rotation
+        block.color_index = 1
+        block.is_bomb = self.is_bomb
+        return block
+
+
+class TestHeadlessEngine:
+    def test_module_does_not_import_pygame(self):
+        game_dir = os.path.join(os.path.dirname(__file__), '..', 'tetris_boom')
+        code = (
+            "import sys; sys.path.insert(0, %r); "
+            "import game.simulation.headless_engine; "
+            "assert 'pygame' not in sys.modules" % game_dir
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_move_and_rotate(self):
+        engine = HeadlessEngine(block_factory=StubFactory(shape=0))
+        assert engine.step(MOVE_LEFT).action_applied is True
+        assert engine.current_block.x == 2
+        engine.step(MOVE_RIGHT)
+        engine.step(ROTATE)
+        assert engine.current_block.rotation == 1
+
+    def test_move_into_wall_is_rejected(self):
+        engine = HeadlessEngine(block_factory=StubFactory(shape=8))
+        for _ in range(10):
+            engine.step(MOVE_LEFT)
+        assert engine.current_block.x == -1
+        assert engine.step(MOVE_LEFT).action_applied is False
+
+    def test_gravity_uses_explicit_time(self):
+        engine = HeadlessEngine(block_factory=StubFactory())
+        engine.step(dt=0.5)
+        assert engine.current_block.y == 0
+        engine.step(dt=0.2)
+        assert engine.current_block.y == 1
+        engine.step(dt=3 / 1.5)
+        assert engine.current_block.y == 4
+
+    def test_hard_drop_locks_and_spawns(self):
+        engine = HeadlessEngine(block_factory=StubFactory())
+        result = engine.step(HARD_DROP)
+        assert result.blocks_placed == 1
+        assert engine.board.grid[19][4] == 1
+        assert engine.board.grid[18][5] == 1
+        assert engine.current_block.y == 0
+
+    def test_soft_drop_moves_one_row(self):
+        engine = HeadlessEngine(block_factory=StubFactory())
+        engine.step(SOFT_DROP)
+        assert engine.current_block.y == 1
+
+    def test_line_clear_scores_points(self):
+        engine = HeadlessEngine(rows=4, cols=4, block_factory=StubFactory(spawn_x=-1), switch_modes=False)
+        engine.step(HARD_DROP)
+        engine.step(MOVE_RIGHT)
+        engine.step(MOVE_RIGHT)
+        result = engine.step(HARD_DROP)
+        assert result.lines_cleared == 2
+        assert result.points == 4
+        assert engine.score == 4
+        assert all(cell == 0 for row in engine.board.grid for cell in row)
+
+    def test_game_over_when_spawn_is_blocked(self):
+        engine = HeadlessEngine(rows=5, cols=10, block_factory=StubFactory(shape=10))
+        result = engine.step(HARD_DROP)
+        assert result.game_over is True
+        assert engine.step(HARD_DROP).blocks_placed == 0
+
+    def test_bomb_counts(self):
+        engine = HeadlessEngine(block_factory=StubFactory(is_bomb=True))
+        engine.board.grid[19][4] = 2
+        result = engine.step(HARD_DROP)
+        assert result.bombs_triggered == 1
+        assert result.cells_exploded == 1
+
+    def test_mode_switch_on_checkpoint(self):
+        engine = HeadlessEngine(rows=4, cols=4, block_factory=StubFactory(spawn_x=-1), checkpoint_interval=4)
+        engine.step(HARD_DROP)
+        engine.step(MOVE_RIGHT)
+        engine.step(MOVE_RIGHT)
+        result = engine.step(HARD_DROP)
+        assert result.mode_switched is True
+        assert result.mode == BLOCKBLAST
+        assert engine.mode_switches == 1
+
+    def test_blockblast_place(self):
+        engine = HeadlessEngine(start_mode=BLOCKBLAST, block_factory=StubFactory())
+        assert (-1, 0) in engine.legal_placements(0)
+        result = engine.step(place(0, -1, 0))
+        assert result.action_applied is True
+        assert engine.board.grid[0][0] == 1
+        assert len(engine.next_blocks) == 3
+        assert engine.step(place(0, -1, 0)).action_applied is False
+
+    def test_blockblast_game_over_when_tray_does_not_fit(self):
+        engine = HeadlessEngine(rows=3, cols=3, start_mode=BLOCKBLAST, block_factory=StubFactory())
+        result = engine.step(place(0, -1, 0))
+        assert result.game_over is True
+
+    def test_blocked_spawn_on_reset_is_game_over(self):
+        engine = HeadlessEngine(rows=3, cols=3, block_factory=StubFactory(shape=10))
+        assert engine.game_over is True
+
+    def test_same_seed_and_actions_replay_identically(self):
+        actions = [MOVE_LEFT, ROTATE, HARD_DROP, None, MOVE_RIGHT, MOVE_RIGHT, HARD_DROP] * 10
+
+        def play(engine):
+            for action in actions:
+                engine.step(action, dt=1 / 30)
+            return engine.score, engine.blocks_placed, [list(row) for row in engine.board.grid]
+
+        first = play(HeadlessEngine(seed=123))
+        engine = HeadlessEngine(seed=5)
+        engine.reset(seed=123)
+        assert play(engine) == first
+
+    def test_unknown_action_raises(self):
+        engine = HeadlessEngine(block_factory=StubFactory())
+        with pytest.raises(ValueError):
+            engine.step(("teleport",))
@@ -0,0 +1,91 @@
+import json
+import pytest
+from game.leaderboard.json_leaderboard import JsonLeaderboard
+from game.leaderboard.sqlite_leaderboard import SqliteLeaderboard
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        leaderboard = JsonLeaderboard(str(tmp_path / "highscore.json"), capacity=100)
+    else:
+        leaderboard = SqliteLeaderboard(str(tmp_path / "highscore.db"))
+    leaderboard.load()
+    yield leaderboard
+    leaderboard.close()
+
+
+class TestLeaderboardStores:
+    def test_empty_store(self, store):
+        assert store.top_k(3) == []
+        assert store.rank("Nobody") is None
+        assert store.personal_best("Nobody") == 0
+
+    def test_upsert_keeps_best_score(self, store):
+        assert store.upsert("Alice", 50) is True
+        assert store.upsert("Alice", 30) is False
+        assert store.personal_best("Alice") == 50
+        assert store.upsert("Alice", 80) is True
+        assert store.personal_best("Alice") == 80
+
+    def test_zero_scores_are_ignored(self, store):
+        assert store.upsert("Alice", 0) is False
+        assert store.top_k(3) == []
+
+    def test_top_k_and_rank(self, store):
+        for name, score in [("Alice", 50), ("Bob", 90), ("Carol", 70), ("Dave", 10)]:
+            store.upsert(name, score)
+        assert store.top_k(2) == [{"name": "Bob", "score": 90}, {"name": "Carol", "score": 70}]
+        assert store.rank("Bob") == 1
+        assert store.rank("Alice") == 3
+        assert store.rank("Dave") == 4
+
+    def test_scores_survive_reload(self, store):
+        store.upsert("Alice", 50)
+        store.save()
+        store.close()
+        store.load()
+        assert store.personal_best("Alice") == 50
+
+
+class TestJsonLeaderboard:
+    def test_keeps_only_capacity_entries(self, tmp_path):
+        store = JsonLeaderboard(str(tmp_path / "highscore.json"))
+        for i in range(5):
+            store.upsert(f"Player{i}", 100 - i * 10)
+        assert [entry["score"] for entry in store.top_k(10)] == [100, 90, 80]
+        assert store.rank("Player4") is None
+
+    def test_corrupted_file_loads_empty(self, tmp_path):
+        path = tmp_path / "highscore.json"
+        path.write_text("{not json")
+        store = JsonLeaderboard(str(path))
+        store.load()
+        assert store.top_k(3) == []
+
+    def test_save_writes_json_list(self, tmp_path):
+        path = tmp_path / "highscore.json"
+        store = JsonLeaderboard(str(path))
+        store.upsert("Alice", 50)
+        store.save()
+        assert json.loads(path.read_text()) == [{"name": "Alice", "score": 50}]
+
+
+class TestSqliteLeaderboard:
+    def test_handles_many_players(self, tmp_path):
+        store = SqliteLeaderboard(str(tmp_path / "highscore.db"))
+        store.load()
+        for i in range(1000):
+            store.upsert(f"Player{i}", i + 1)
+        assert store.top_k(1) == [{"name": "Player999", "score": 1000}]
+        assert store.rank("Player0") == 1000
+        assert store.personal_best("Player500") == 501
+        store.close()
+
+    def test_ties_are_ordered_by_name(self, tmp_path):
+        store = SqliteLeaderboard(str(tmp_path / "highscore.db"))
+        store.upsert("Bob", 10)
+        store.upsert("Alice", 10)
+        assert [entry["name"] for entry in store.top_k(2)] == ["Alice", "Bob"]
+        assert store.rank("Bob") == 2
+        store.close()
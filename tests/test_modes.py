@@ -9,6 +9,8 @@ from game.board import Board
 from game.block_factory import BlockFactory
 from game.score_manager import ScoreManager
 from game.sound_manager import SoundManager
+from game.input_handlers.blockblast_input_handler import BlockBlastInputHandler
+from game.data import NEXT_BLOCKS_COUNT, UPDATE_STEP
 
 
 class TestTetrisMode:
@@ -50,6 +52,77 @@ class TestTetrisMode:
         mode.update()
         assert mode.fall_timer == initial_fall_timer
 
+    def test_game_over_commits_score_once(self, mock_screen, mock_state, mock_renderer):
+        mode = TetrisMode(mock_screen, mock_state, mock_renderer)
+        mode._handle_game_over()
+        mode._handle_game_over()
+        mock_state.score_manager.commit_game.assert_called_once()
+
+    def test_activate_resets_per_mode_state(self, mock_screen, mock_state, mock_renderer):
+        mode = TetrisMode(mock_screen, mock_state, mock_renderer)
+        mode.input_handler = MagicMock()
+        mode.fall_timer = 0.5
+        mode.pressing_down = True
+        mode.activate(dark_mode=True)
+        assert mode.fall_timer == 0.0
+        assert mode.pressing_down is False
+        mock_renderer.activate.assert_called_once_with(True)
+        mode.input_handler.reset.assert_called_once()
+
+    def test_fall_speed_does_not_depend_on_step_size(self, mock_screen, mock_state, mock_renderer):
+        mock_state.current_block.is_bomb = False
+        coarse = TetrisMode(mock_screen, mock_state, mock_renderer)
+        start_y = mock_state.current_block.y
+        coarse.update(2.2)
+        coarse_y = mock_state.current_block.y
+
+        mock_state.current_block.y = start_y
+        fine = TetrisMode(mock_screen, mock_state, mock_renderer)
+        for _ in range(66):
+            fine.update(1 / 30)
+        assert mock_state.current_block.y == coarse_y == start_y + 3
+
+    def test_update_defaults_to_one_logic_step(self, mock_screen, mock_state, mock_renderer):
+        mode = TetrisMode(mock_screen, mock_state, mock_renderer)
+        mode.update()
+        assert mode.fall_timer == pytest.approx(UPDATE_STEP)
+
+    def test_fall_offset_interpolates_towards_next_row(self, mock_screen, mock_state, mock_renderer):
+        mode = TetrisMode(mock_screen, mock_state, mock_renderer)
+        assert mode.get_fall_offset() == 0.0
+        mode.fall_timer = mode._drop_interval() / 2
+        assert mode.get_fall_offset() == pytest.approx(0.5)
+        assert mode.get_fall_offset(alpha=1.0) > 0.5
+
+    def test_pressing_soft_drop_mid_fall_moves_at_most_one_row_per_step(self, mock_screen, mock_state, mock_renderer):
+        mock_state.current_block.is_bomb = False
+        mode = TetrisMode(mock_screen, mock_state, mock_renderer)
+        mode.update(0.63)
+        start_y = mock_state.current_block.y
+        mode.pressing_down = True
+        for _ in range(5):
+            y = mock_state.current_block.y
+            mode.update()
+            assert mock_state.current_block.y - y <= 1
+        assert mock_state.current_block.y - start_y <= 2
+
+    def test_fall_offset_keeps_progress_when_interval_changes(self, mock_screen, mock_state, mock_renderer):
+        mock_state.current_block.is_bomb = False
+        mode = TetrisMode(mock_screen, mock_state, mock_renderer)
+        mode.fall_timer = mode._drop_interval() / 2
+        assert mode.get_fall_offset() == pytest.approx(0.5)
+        mode.pressing_down = True
+        assert mode.get_fall_offset() == pytest.approx(0.5)
+        mode.pressing_down = False
+        assert mode.get_fall_offset() == pytest.approx(0.5)
+
+    def test_fall_offset_is_zero_when_block_rests(self, mock_screen, mock_state, mock_renderer):
+        mode = TetrisMode(mock_screen, mock_state, mock_renderer)
+        block = mock_state.current_block
+        block.y = mock_state.board.rows - block.get_shape_info().max_y - 1
+        mode.fall_timer = mode._drop_interval() / 2
+        assert mode.get_fall_offset() == 0.0
+
     def test_tetris_mode_spawn_block(self, mock_screen, mock_state, mock_renderer):
         mode = TetrisMode(mock_screen, mock_state, mock_renderer)
         old_block = mode.state.current_block
@@ -91,6 +164,33 @@ class TestBlockBlastMode:
         mode.spawn_block()
         assert True
 
+    def test_activate_refills_next_blocks_and_clears_drag(self, mock_screen, mock_state, mock_renderer):
+        mode = BlockBlastMode(mock_screen, mock_state, mock_renderer)
+        mode.input_handler = BlockBlastInputHandler(mode)
+        mode.input_handler.dragging_block = mode.state.next_blocks[0]
+        mode.state.next_blocks = []
+        mode.game_over = True
+        mode.activate()
+        assert len(mode.state.next_blocks) == NEXT_BLOCKS_COUNT
+        assert mode.input_handler.dragging_block is None
+        assert mode.game_over is False
+
+    def test_drag_preview_does_not_copy_block(self, mock_screen, mock_state, mock_renderer, monkeypatch):
+        mode = BlockBlastMode(mock_screen, mock_state, mock_renderer)
+        mode.input_handler = BlockBlastInputHandler(mode)
+        mock_renderer.offset_x = 0
+        mock_renderer.offset_y = 0
+        block = mode.state.next_blocks[0]
+        mode.input_handler.dragging_block = block
+        monkeypatch.setattr(type(block), "copy", Mock(side_effect=AssertionError("copied")))
+
+        inside = pygame.event.Event(pygame.MOUSEMOTION, pos=(90, 90))
+        mode.input_handler.handle(inside)
+        assert mode.input_handler.preview_pos == (4, 4)
+        outside = pygame.event.Event(pygame.MOUSEMOTION, pos=(-500, -500))
+        mode.input_handler.handle(outside)
+        assert mode.input_handler.preview_pos is None
+
     def test_blockblast_mode_update_game_over_when_no_space(self, mock_screen, mock_state, mock_renderer):
         mode = BlockBlastMode(mock_screen, mock_state, mock_renderer)
         for i in range(mode.state.board.rows):
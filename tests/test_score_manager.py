@@ -214,3 +214,90 @@ class TestScoreManager:
                                  if call[0][0] == "highscore"]
                 assert len(highscore_calls) == 0
 
+
+    def test_commit_game_writes_leaderboard_once(self, mock_sound_manager, temp_leaderboard_file):
+        with patch('game.score_manager.getattr', return_value=False):
+            with patch('game.score_manager.resource_path', return_value=temp_leaderboard_file):
+                manager = ScoreManager(mock_sound_manager)
+                manager.set_player_name("TestPlayer")
+                manager.score = 100
+                with patch.object(manager, '_record_score', wraps=manager._record_score) as save:
+                    manager.commit_game()
+                    manager.commit_game()
+                    manager.close()
+                assert save.call_count == 1
+
+                with open(temp_leaderboard_file, 'r') as f:
+                    data = json.load(f)
+                assert data == [{"name": "TestPlayer", "score": 100}]
+
+    def test_commit_game_updates_leaderboard_immediately(self, mock_sound_manager, temp_leaderboard_file):
+        with patch('game.score_manager.getattr', return_value=False):
+            with patch('game.score_manager.resource_path', return_value=temp_leaderboard_file):
+                manager = ScoreManager(mock_sound_manager)
+                manager.set_player_name("TestPlayer")
+                manager.score = 100
+                manager.commit_game()
+                assert manager.get_highscore() == 100
+                assert manager.get_highscore_player() == "TestPlayer"
+                manager.close()
+
+    def test_commit_game_skipped_when_not_recording(self, mock_sound_manager, temp_leaderboard_file):
+        with patch('game.score_manager.getattr', return_value=False):
+            with patch('game.score_manager.resource_path', return_value=temp_leaderboard_file):
+                manager = ScoreManager(mock_sound_manager, record_scores=False)
+                manager.set_player_name("Bot")
+                manager.score = 100
+                with patch.object(manager, '_record_score') as save:
+                    manager.commit_game()
+                    manager.close()
+                save.assert_not_called()
+                assert manager.get_highscore() == 0
+
+    def test_commit_game_allowed_again_after_reset(self, mock_sound_manager, temp_leaderboard_file):
+        with patch('game.score_manager.getattr', return_value=False):
+            with patch('game.score_manager.resource_path', return_value=temp_leaderboard_file):
+                manager = ScoreManager(mock_sound_manager)
+                manager.set_player_name("First")
+                manager.score = 50
+                manager.commit_game()
+                manager.reset()
+                manager.set_player_name("Second")
+                manager.score = 80
+                manager.commit_game()
+                manager.close()
+
+                with open(temp_leaderboard_file, 'r') as f:
+                    data = json.load(f)
+                assert [entry["name"] for entry in data] == ["Second", "First"]
+
+    def test_save_leaderboard_leaves_no_temp_files(self, mock_sound_manager, temp_leaderboard_file):
+        with patch('game.score_manager.getattr', return_value=False):
+            with patch('game.score_manager.resource_path', return_value=temp_leaderboard_file):
+                manager = ScoreManager(mock_sound_manager)
+                manager.set_player_name("TestPlayer")
+                manager.score = 100
+                manager.update_leaderboard()
+
+                save_dir = os.path.dirname(temp_leaderboard_file)
+                leftovers = [name for name in os.listdir(save_dir) if name.startswith(".highscore-")]
+                assert leftovers == []
+
+    def test_unknown_leaderboard_backend_raises(self, mock_sound_manager):
+        with pytest.raises(ValueError):
+            ScoreManager(mock_sound_manager, leaderboard_backend="csv")
+
+    def test_sqlite_backend_ranks_beyond_top_3(self, mock_sound_manager, tmp_path):
+        with patch('game.score_manager.getattr', return_value=False):
+            with patch('game.score_manager.resource_path', return_value=str(tmp_path / "highscore.json")):
+                manager = ScoreManager(mock_sound_manager, leaderboard_backend="sqlite")
+                for i in range(5):
+                    manager.reset()
+                    manager.set_player_name(f"Player{i}")
+                    manager.score = 100 - i * 10
+                    manager.commit_game()
+                assert len(manager.get_leaderboard()) == 3
+                assert manager.get_player_rank() == 5
+                assert manager.get_personal_best() == 60
+                manager.close()
+                assert (tmp_path / "highscore.db").exists()
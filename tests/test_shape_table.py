@@ -0,0 +1,38 @@
+import pytest
+from game.shape_table import SHAPE_TABLE, get_shape_info
+from game.data import SHAPES
+
+
+class TestShapeTable:
+    def test_table_covers_every_rotation(self):
+        assert len(SHAPE_TABLE) == len(SHAPES)
+        for shape, rotations in enumerate(SHAPES):
+            assert len(SHAPE_TABLE[shape]) == len(rotations)
+
+    def test_cells_match_flat_indices(self):
+        for shape, rotations in enumerate(SHAPES):
+            for rotation, indices in enumerate(rotations):
+                info = get_shape_info(shape, rotation)
+                assert sorted(dy * 4 + dx for dx, dy in info.cells) == sorted(indices)
+                assert info.cell_set == frozenset(info.cells)
+                assert info.cell_count == len(indices)
+
+    def test_bounding_box(self):
+        info = get_shape_info(0, 0)  # vertical I
+        assert (info.min_x, info.min_y, info.max_x, info.max_y) == (1, 0, 1, 3)
+        assert info.width == 1
+        assert info.height == 4
+
+    def test_row_masks(self):
+        info = get_shape_info(1, 0)  # Z: cells 4, 5, 9, 10
+        assert info.row_masks == ((1, 0b0011), (2, 0b0110))
+
+    def test_bottom_profile(self):
+        info = get_shape_info(1, 0)  # Z: cells 4, 5, 9, 10
+        assert info.bottom_profile == ((0, 1), (1, 2), (2, 2))
+        for shape_rotations in SHAPE_TABLE:
+            for info in shape_rotations:
+                columns = {dx for dx, _ in info.cells}
+                assert [dx for dx, _ in info.bottom_profile] == sorted(columns)
+                for dx, dy in info.bottom_profile:
+                    assert dy == max(cy for cx, cy in info.cells if cx == dx)
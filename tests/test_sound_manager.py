@@ -0,0 +1,75 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from game.sound_manager import SoundManager, SOUND_EFFECTS, MUSIC_TRACKS, audio_disabled_by_env
+
+
+class TestSoundManager:
+    @pytest.fixture
+    def mock_pygame(self):
+        with patch('game.sound_manager.pygame') as mock_pygame:
+            mock_pygame.mixer.get_init.return_value = (44100, -16, 2)
+            mock_pygame.mixer.Sound.side_effect = lambda path: MagicMock(name=path)
+            yield mock_pygame
+
+    def test_lazy_mode_loads_nothing_up_front(self, mock_pygame):
+        manager = SoundManager(preload=False)
+        assert manager.sounds == {}
+        mock_pygame.mixer.Sound.assert_not_called()
+
+    def test_sound_effect_is_loaded_on_first_play_only(self, mock_pygame):
+        manager = SoundManager(preload=False)
+        manager.play("bomb")
+        manager.play("bomb")
+        assert mock_pygame.mixer.Sound.call_count == 1
+        assert manager.sounds["bomb"].play.call_count == 2
+
+    def test_preload_decodes_every_effect_in_background(self, mock_pygame):
+        manager = SoundManager()
+        for name in SOUND_EFFECTS:
+            manager.play(name)
+        manager.close()
+        assert mock_pygame.mixer.Sound.call_count == len(SOUND_EFFECTS)
+        assert set(manager.sounds) == set(SOUND_EFFECTS)
+
+    def test_music_is_streamed_not_decoded(self, mock_pygame):
+        manager = SoundManager(preload=False)
+        manager.play("music_1_loop", loop=True)
+        mock_pygame.mixer.Sound.assert_not_called()
+        mock_pygame.mixer.music.load.assert_called_once()
+        mock_pygame.mixer.music.play.assert_called_once_with(loops=-1)
+        assert manager.current_music == "music_1_loop"
+
+    def test_stopping_music_only_stops_the_current_track(self, mock_pygame):
+        manager = SoundManager(preload=False)
+        manager.play("music_1_loop", loop=True)
+        manager.stop("music_1")
+        mock_pygame.mixer.music.stop.assert_not_called()
+        manager.stop("music_1_loop")
+        mock_pygame.mixer.music.stop.assert_called_once()
+        assert manager.current_music is None
+
+    def test_unknown_sound_is_ignored(self, mock_pygame):
+        manager = SoundManager(preload=False)
+        manager.play("does_not_exist")
+        mock_pygame.mixer.Sound.assert_not_called()
+
+    def test_disabled_manager_never_touches_the_mixer(self, mock_pygame):
+        manager = SoundManager(enabled=False)
+        for name in SOUND_EFFECTS + MUSIC_TRACKS:
+            manager.play(name)
+            manager.stop(name)
+        manager.stop_all()
+        manager.set_master_volume(0.5)
+        assert mock_pygame.mixer.mock_calls == []
+
+    def test_audio_is_disabled_without_a_mixer(self, mock_pygame):
+        mock_pygame.mixer.get_init.return_value = None
+        manager = SoundManager()
+        assert manager.enabled is False
+        manager.play("bomb")
+        mock_pygame.mixer.Sound.assert_not_called()
+
+    @pytest.mark.parametrize("value, disabled", [("", False), ("0", False), ("1", True), ("yes", True)])
+    def test_no_audio_environment_variable(self, monkeypatch, value, disabled):
+        monkeypatch.setenv("TETRIS_BOOM_NO_AUDIO", value)
+        assert audio_disabled_by_env() is disabled
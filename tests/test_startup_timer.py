@@ -0,0 +1,114 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import pytest
+from game.startup_timer import StartupTimer, STARTUP_PHASES
+
+GAME_DIR = os.path.join(os.path.dirname(__file__), '..', 'tetris_boom')
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000.0
+
+
+def loaded_modules(statement):
+    """Runs an import in a fresh interpreter and returns the names of the modules it loaded."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=GAME_DIR, capture_output=True,
+                            text=True, check=True).stdout
+    return set(output.split())
+
+
+class TestStartupTimer:
+    def test_phases_get_time_since_previous_mark(self):
+        clock = FakeClock()
+        timer = StartupTimer(clock=clock)
+        for ms, phase in zip((100, 30, 2, 5, 8), STARTUP_PHASES):
+            clock.advance(ms)
+            timer.mark(phase)
+
+        report = timer.report()
+        assert list(report) == list(STARTUP_PHASES) + ["total"]
+        assert report["import"] == pytest.approx(100)
+        assert report["first_frame"] == pytest.approx(8)
+        assert report["total"] == pytest.approx(145)
+
+    def test_marking_twice_keeps_first_time(self):
+        clock = FakeClock()
+        timer = StartupTimer(clock=clock)
+        clock.advance(10)
+        timer.mark("first_frame")
+        clock.advance(50)
+        timer.mark("first_frame")
+        assert timer.report() == {"first_frame": pytest.approx(10), "total": pytest.approx(10)}
+
+    def test_unknown_phase_raises(self):
+        with pytest.raises(ValueError):
+            StartupTimer().mark("loading")
+
+    def test_listeners_run_once_on_first_frame(self):
+        timer = StartupTimer(clock=FakeClock())
+        calls = []
+        timer.subscribe(calls.append)
+        timer.mark("import")
+        assert calls == []
+        timer.mark("first_frame")
+        timer.mark("first_frame")
+        assert calls == [timer]
+
+    def test_dump_writes_one_json_line(self):
+        clock = FakeClock()
+        timer = StartupTimer(clock=clock)
+        clock.advance(12.5)
+        timer.mark("import")
+        stream = io.StringIO()
+        timer.dump(stream)
+        assert stream.getvalue().count("\n") == 1
+        assert json.loads(stream.getvalue()) == {"import": 12.5, "total": 12.5}
+
+
+class TestLazyImports:
+    def test_board_does_not_import_numpy(self):
+        modules = loaded_modules("import game.board")
+        assert "numpy" not in modules
+        assert "game.board_backends.numpy_backend" not in modules
+
+    def test_controller_does_not_import_blockblast(self):
+        modules = loaded_modules("import game.controller")
+        assert "game.modes.blockblast_mode" not in modules
+        assert "game.renderers.blockblast_renderer" not in modules
+        assert "game.input_handlers.blockblast_input_handler" not in modules
+
+    def test_score_manager_does_not_import_sqlite(self):
+        modules = loaded_modules("import game.score_manager")
+        assert "sqlite3" not in modules
+        assert "game.leaderboard.sqlite_leaderboard" not in modules
+
+
+class TestStartupReportOutput:
+    def test_stdout_report_falls_back_to_file_without_console(self, monkeypatch, tmp_path):
+        import main
+        monkeypatch.setattr(sys, "stdout", None)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        timer = StartupTimer(clock=FakeClock())
+        timer.mark("import")
+        main._write_startup_report("-")(timer)
+        with open(tmp_path / ".tetris_boom" / "startup.jsonl") as f:
+            assert json.loads(f.readline())["import"] == 0.0
+
+    def test_stdout_report_goes_to_stdout(self, monkeypatch):
+        import main
+        stream = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stream)
+        main._write_startup_report("-")(StartupTimer(clock=FakeClock()))
+        assert json.loads(stream.getvalue())["total"] == 0.0
@@ -0,0 +1,155 @@
+import os
+import subprocess
+import sys
+import pytest
+import pygame
+from unittest.mock import MagicMock, patch
+from game.board import Board
+from game.block import Block
+from game.block_factory import BlockFactory
+from game.gamestate import GameState
+from game.score_manager import ScoreManager
+from game.modes.tetris_mode import TetrisMode
+from game.bots.tetris_bot import TetrisBot
+from game.bots.tetris_bot_driver import TetrisBotDriver
+from game.bots.benchmark import run_benchmark
+from game.simulation.headless_engine import HeadlessEngine, MOVE_LEFT, MOVE_RIGHT, ROTATE, HARD_DROP
+from game.simulation.policies import BotPolicy
+
+
+def apply(block, action):
+    if action == ROTATE:
+        block.rotate()
+    else:
+        block.move(action[1], 0)
+
+
+class TestTetrisBot:
+    def test_module_does_not_import_pygame(self):
+        game_dir = os.path.join(os.path.dirname(__file__), '..', 'tetris_boom')
+        code = (
+            "import sys; sys.path.insert(0, %r); "
+            "import game.bots.tetris_bot; "
+            "assert 'pygame' not in sys.modules" % game_dir
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_weight_raises(self):
+        with pytest.raises(ValueError):
+            TetrisBot({"height": 1.0})
+
+    def test_reachable_positions_cover_both_walls(self):
+        board = Board()
+        block = Block(3, 0, shape=0)  # I
+        paths = TetrisBot().reachable_positions(board, block)
+        assert (0, -1) in paths and (0, 8) in paths
+        assert (1, 0) in paths and (1, 6) in paths
+        for (rotation, x), path in paths.items():
+            probe = block.copy()
+            for action in path:
+                apply(probe, action)
+                assert board.is_valid_position(probe)
+            assert (probe.rotation, probe.x) == (rotation, x)
+
+    def test_walls_block_reachability(self):
+        board = Board()
+        for y in range(board.rows):
+            board.grid[y][6] = 1
+        paths = TetrisBot().reachable_positions(board, Block(3, 0, shape=6))  # 1x1 block
+        assert max(x for _, x in paths) + 1 < 6
+
+    def test_completes_a_line_when_possible(self):
+        board = Board()
+        for x in range(board.cols):
+            if x != 7:
+                board.grid[19][x] = 1
+        placement = TetrisBot().choose_placement(board, Block(3, 0, shape=0))
+        assert placement.lines_cleared == 1
+        assert placement.y + 3 == 19
+
+    def test_avoids_covering_holes(self):
+        board = Board(rows=6, cols=4)
+        board.grid[5][0] = 1
+        board.grid[5][1] = 1
+        placement = TetrisBot().choose_placement(board, Block(0, 0, shape=6))  # 1x1 block
+        assert placement.x + 1 in (2, 3)
+
+    def test_next_action_follows_placement_then_drops(self):
+        board = Board()
+        bot = TetrisBot()
+        block = Block(3, 0, shape=3)
+        placement = bot.choose_placement(board, block)
+        actions = []
+        while True:
+            action = bot.next_action(board, block, placement)
+            actions.append(action)
+            if action == HARD_DROP:
+                break
+            apply(block, action)
+        assert (block.rotation, block.x) == (placement.rotation, placement.x)
+        assert tuple(actions[:-1]) == placement.moves
+
+    def test_policy_plays_headless_games(self):
+        policy = BotPolicy()
+        policy.reset(1)
+        engine = HeadlessEngine(seed=1, switch_modes=False)
+        for _ in range(400):
+            engine.step(policy.choose_action(engine))
+        assert engine.blocks_placed > 20
+        assert engine.lines_cleared > 0
+
+
+class TestTetrisBotBenchmark:
+    def test_reports_decision_times(self):
+        result = run_benchmark(pieces=30, seed=2, fps=60)
+        assert result["pieces"] == 30
+        assert 0 <= result["p50_ms"] <= result["p95_ms"] <= result["max_ms"]
+        assert result["frame_budget_ms"] == pytest.approx(1000 / 60, abs=0.001)
+        assert 0 <= result["over_budget"] <= 30
+
+    def test_pieces_must_be_positive(self):
+        with pytest.raises(ValueError):
+            run_benchmark(pieces=0)
+
+
+class TestTetrisBotDriver:
+    @pytest.fixture
+    def mode(self):
+        score_manager = MagicMock(spec=ScoreManager)
+        state = GameState(Board(), BlockFactory(seed=4), score_manager, MagicMock())
+        mode = TetrisMode(MagicMock(), state, MagicMock())
+        return mode
+
+    def test_posts_one_key_per_interval(self, mode):
+        driver = TetrisBotDriver(move_interval=0.1)
+        with patch("pygame.event.post") as post:
+            driver.update(mode, 0.05)
+            assert post.call_count == 0
+            driver.update(mode, 0.05)
+            assert post.call_count == 1
+        event = post.call_args[0][0]
+        assert event.type == pygame.KEYDOWN
+        assert event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_SPACE)
+
+    def test_keys_drive_the_input_handler(self, mode):
+        from game.input_handlers.tetris_input_handler import TetrisInputHandler
+        mode.input_handler = TetrisInputHandler(mode)
+        driver = TetrisBotDriver(move_interval=0)
+        first_block = mode.state.current_block
+        with patch("pygame.event.post") as post:
+            for _ in range(20):
+                driver.update(mode, 0.0)
+                mode.handle_input(post.call_args[0][0])
+                if mode.state.current_block is not first_block:
+                    break
+        assert mode.state.current_block is not first_block
+        assert mode.state.board.version > 0
+
+    def test_restarts_after_game_over(self, mode):
+        driver = TetrisBotDriver(restart_delay=1.0)
+        mode.game_over = True
+        with patch("pygame.event.post") as post:
+            driver.update(mode, 0.6)
+            assert post.call_count == 0
+            driver.update(mode, 0.6)
+        assert post.call_args[0][0].key == pygame.K_r
@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import MagicMock
+from game.renderers.text_cache import TextCache
+
+
+class TestTextCache:
+    @pytest.fixture
+    def font(self):
+        font = MagicMock()
+        font.render.side_effect = lambda text, antialias, color: MagicMock(name=text)
+        return font
+
+    def test_same_text_is_rendered_once(self, font):
+        cache = TextCache()
+        first = cache.render(font, "Score: 1", (255, 255, 255))
+        second = cache.render(font, "Score: 1", (255, 255, 255))
+        assert first is second
+        assert font.render.call_count == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_includes_color_and_antialias(self, font):
+        cache = TextCache()
+        cache.render(font, "Score: 1", (255, 255, 255))
+        cache.render(font, "Score: 1", (0, 0, 0))
+        cache.render(font, "Score: 1", (0, 0, 0), antialias=False)
+        assert font.render.call_count == 3
+
+    def test_least_recently_used_entry_is_evicted(self, font):
+        cache = TextCache(max_size=2)
+        cache.render(font, "a", (0, 0, 0))
+        cache.render(font, "b", (0, 0, 0))
+        cache.render(font, "a", (0, 0, 0))
+        cache.render(font, "c", (0, 0, 0))
+        assert len(cache) == 2
+        cache.render(font, "a", (0, 0, 0))
+        assert font.render.call_count == 3
+        cache.render(font, "b", (0, 0, 0))
+        assert font.render.call_count == 4
+
+    def test_invalid_size_raises(self):
+        with pytest.raises(ValueError):
+            TextCache(max_size=0)
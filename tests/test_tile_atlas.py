@@ -0,0 +1,49 @@
+import pygame
+from game.data import BLOCK_SIZE, LIGHT_THEME, DARK_THEME, LIGHT_BLOCK_COLORS, DARK_BLOCK_COLORS, RED, WHITE
+from game.renderers.tile_atlas import (TileAtlas, BOARD_TILE, FALLING_TILE, TRAY_TILE, GHOST_TILE,
+                                      TILE_STYLES, BOMB_RED, BOMB_WHITE)
+
+
+class TestTileAtlas:
+    def test_every_style_has_every_color_and_bomb_frame(self):
+        atlas = TileAtlas(False, LIGHT_THEME)
+        for style in TILE_STYLES:
+            for key in list(LIGHT_BLOCK_COLORS) + [BOMB_RED, BOMB_WHITE]:
+                source, dest, area = atlas.blit_item(style, key, 0, 0)
+                assert source is atlas.surface
+                assert atlas.surface.get_rect().contains(area)
+
+    def test_board_tiles_are_inset_by_one_pixel(self):
+        atlas = TileAtlas(False, LIGHT_THEME)
+        _, dest, area = atlas.blit_item(BOARD_TILE, 1, 100, 40)
+        assert dest == (101, 41)
+        assert area.size == (BLOCK_SIZE - 2, BLOCK_SIZE - 2)
+
+    def test_tray_tiles_cover_the_whole_cell(self):
+        atlas = TileAtlas(False, LIGHT_THEME)
+        _, dest, area = atlas.blit_item(TRAY_TILE, 1, 100, 40)
+        assert dest == (100, 40)
+        assert area.size == (BLOCK_SIZE, BLOCK_SIZE)
+
+    def test_tiles_use_theme_colors(self):
+        light = TileAtlas(False, LIGHT_THEME)
+        dark = TileAtlas(True, DARK_THEME)
+        _, _, area = light.blit_item(BOARD_TILE, 1, 0, 0)
+        assert light.surface.get_at(area.center)[:3] == LIGHT_BLOCK_COLORS[1]
+        _, _, area = dark.blit_item(BOARD_TILE, 1, 0, 0)
+        assert dark.surface.get_at(area.center)[:3] == DARK_BLOCK_COLORS[1]
+
+    def test_bomb_flash_frames(self):
+        atlas = TileAtlas(False, LIGHT_THEME)
+        _, _, area = atlas.blit_item(FALLING_TILE, BOMB_RED, 0, 0)
+        assert atlas.surface.get_at(area.center)[:3] == RED
+        _, _, area = atlas.blit_item(FALLING_TILE, BOMB_WHITE, 0, 0)
+        assert atlas.surface.get_at(area.center)[:3] == WHITE
+        assert atlas.surface.get_at(area.topleft)[:3] == RED
+
+    def test_ghost_tiles_are_outlines(self):
+        atlas = TileAtlas(False, LIGHT_THEME)
+        _, dest, area = atlas.blit_item(GHOST_TILE, 1, 100, 40)
+        assert dest == (101, 41)
+        assert atlas.surface.get_at(area.topleft)[:3] == LIGHT_BLOCK_COLORS[1]
+        assert atlas.surface.get_at(area.center)[:3] == LIGHT_THEME["background"]
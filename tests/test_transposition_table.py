@@ -0,0 +1,68 @@
+import pytest
+from game.transposition_table import TranspositionTable
+
+
+class TestTranspositionTable:
+    def test_max_entries_must_be_positive(self):
+        with pytest.raises(ValueError):
+            TranspositionTable(0)
+
+    def test_get_and_put(self):
+        table = TranspositionTable()
+        assert table.get(1, ("I",)) is None
+        table.put(1, ("I",), (3.0, 1, ()))
+        assert table.get(1, ("I",)) == (3.0, 1, ())
+        assert table.get(1, ("O",)) is None
+        assert table.get(2, ("I",)) is None
+        assert len(table) == 1
+
+    def test_counts_hits_and_misses(self):
+        table = TranspositionTable()
+        table.put(1, (), 1.0)
+        table.get(1, ())
+        table.get(1, ())
+        table.get(2, ())
+        assert (table.hits, table.misses) == (2, 1)
+        assert table.hit_rate() == pytest.approx(2 / 3)
+        table.reset_stats()
+        assert table.hit_rate() == 0.0
+
+    def test_evicts_least_recently_used(self):
+        table = TranspositionTable(max_entries=2)
+        table.put(1, (), "a")
+        table.put(2, (), "b")
+        table.get(1, ())
+        table.put(3, (), "c")
+        assert table.get(2, ()) is None
+        assert table.get(1, ()) == "a"
+        assert table.get(3, ()) == "c"
+        assert table.evictions == 1
+        assert len(table) == 2
+
+    def test_overwriting_does_not_evict(self):
+        table = TranspositionTable(max_entries=1)
+        table.put(1, (), "a")
+        table.put(1, (), "b")
+        assert table.get(1, ()) == "b"
+        assert table.evictions == 0
+
+    def test_memory_usage_follows_entries(self):
+        table = TranspositionTable()
+        empty = table.memory_usage()
+        for board_hash in range(100):
+            table.put(board_hash, ((0, 0, False),), (1.0, 0, ((0, 1, 2),)))
+        assert table.memory_usage() > empty
+        table.clear()
+        assert table.memory_usage() == empty
+        assert len(table) == 0
+
+    def test_stats(self):
+        table = TranspositionTable(max_entries=5)
+        table.put(1, (), 1.0)
+        table.get(1, ())
+        stats = table.stats()
+        assert stats["entries"] == 1
+        assert stats["max_entries"] == 5
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 1.0
+        assert stats["memory_bytes"] == table.memory_usage()
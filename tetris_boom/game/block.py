@@ -1,22 +1,31 @@
-import random
-from game.data import SHAPES, SHAPE_WEIGHTS, BLOCK_COLORS
+from game.data import SHAPES, BLOCK_COLORS
+from game.shape_table import SHAPE_TABLE
 
 class Block:
-    def __init__(self, x: int, y: int):
+    __slots__ = ("x", "y", "shape", "color_index", "rotation", "is_bomb", "screen_x", "screen_y")
+
+    def __init__(self, x: int, y: int, shape: int = 0, color_index: int = 1,
+                 rotation: int = 0, is_bomb: bool = False):
         """
         Initializes a new Tetris block at the given coordinates.
+        Blocks never draw random values themselves; use BlockFactory for random blocks.
 
         :param x: Horizontal position on the board
         :param y: Vertical position on the board
-        """
+        :param shape: Index into SHAPES
+        :param color_index: Key into the block color tables
+        :param rotation: Index into the rotations of the shape
+        :param is_bomb: Whether the block explodes instead of freezing
+        """
+        # Screen position while the block is dragged in BlockBlast mode
+        self.screen_x = 0
+        self.screen_y = 0
         self.x = x
         self.y = y
-
-        self.shape = random.choices(range(len(SHAPES)), weights=SHAPE_WEIGHTS, k=1)[0]
-        self.color_index = random.randint(1, len(BLOCK_COLORS) - 1)
-
-        self.rotation = 0
-        self.is_bomb = False
+        self.shape = shape
+        self.color_index = color_index
+        self.rotation = rotation
+        self.is_bomb = is_bomb
 
     def move(self, dx: int, dy: int):
         """
@@ -49,6 +58,12 @@ class Block:
         """
         return SHAPES[self.shape][self.rotation]
 
+    def get_shape_info(self):
+        """
+        Returns the precompiled ShapeInfo (offsets, bounds, masks) for the current rotation.
+        """
+        return SHAPE_TABLE[self.shape][self.rotation]
+
     def get_color(self, theme_colors=None):
         """
         Returns the color associated with this block.
@@ -64,7 +79,7 @@ class Block:
         Returns the number of cells in the current block shape.
         Used to determine explosion size for bombs.
         """
-        return len(self.get_shape())
+        return SHAPE_TABLE[self.shape][self.rotation].cell_count
 
     def get_explosion_radius(self):
         """
@@ -80,20 +95,22 @@ class Block:
         """
         Returns a list of (x, y) board coordinates for all cells in this block.
         """
-        positions = []
-        shape_indices = self.get_shape()
-        for idx in shape_indices:
-            r = idx // 4
-            c = idx % 4
-            positions.append((self.x + c, self.y + r))
-        return positions
+        x = self.x
+        y = self.y
+        return [(x + dx, y + dy) for dx, dy in SHAPE_TABLE[self.shape][self.rotation].cells]
 
     def copy(self):
-        new_block = Block(self.x, self.y)
+        """
+        Returns a copy of the block, including its drag position.
+        The copy is filled in slot by slot without going through __init__.
+        """
+        new_block = Block.__new__(Block)
+        new_block.x = self.x
+        new_block.y = self.y
         new_block.shape = self.shape
         new_block.color_index = self.color_index
         new_block.rotation = self.rotation
         new_block.is_bomb = self.is_bomb
-        new_block.screen_x = getattr(self, 'screen_x', 0)
-        new_block.screen_y = getattr(self, 'screen_y', 0)
+        new_block.screen_x = self.screen_x
+        new_block.screen_y = self.screen_y
         return new_block
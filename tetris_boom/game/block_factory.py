@@ -1,9 +1,46 @@
 import random
+from collections import deque
+from itertools import accumulate, islice
+
 from game.block import Block
-from game.data import BOMB_CHANCE, SHAPES
+from game.data import BOMB_CHANCE, SHAPES, SHAPE_WEIGHTS, BLOCK_COLORS
+
+BATCH_SIZE = 64
 
 
 class BlockFactory:
+    def __init__(self, seed=None, rng: random.Random = None, shape_weights=None, bomb_chance: float = None):
+        """
+        Creates random blocks from a random generator owned by the factory,
+        so the same seed always produces the same sequence of blocks.
+
+        Blocks are generated BATCH_SIZE at a time into a queue, which lets
+        callers preview upcoming blocks with peek() at no extra cost.
+
+        :param seed: Seed for a new random.Random (ignored if rng is given)
+        :param rng: Random generator to draw from (default: a new random.Random(seed))
+        :param shape_weights: Relative weight of every shape in SHAPES (default: SHAPE_WEIGHTS)
+        :param bomb_chance: Probability that a block is a bomb (default: BOMB_CHANCE)
+        """
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.shape_weights = list(shape_weights) if shape_weights is not None else SHAPE_WEIGHTS
+        self.bomb_chance = BOMB_CHANCE if bomb_chance is None else bomb_chance
+        if len(self.shape_weights) != len(SHAPES):
+            raise ValueError(f"Expected {len(SHAPES)} shape weights, got {len(self.shape_weights)}")
+
+        self._shape_indices = range(len(SHAPES))
+        self._cum_weights = list(accumulate(self.shape_weights))
+        self._color_indices = range(1, len(BLOCK_COLORS))
+        self._rotation_counts = [len(rotations) for rotations in SHAPES]
+        self._queue = deque()
+
+    def seed(self, seed):
+        """
+        Reseeds the factory's random generator and drops any pre-generated blocks.
+        """
+        self.rng.seed(seed)
+        self._queue.clear()
+
     def create_block(self, x: int = 3, y: int = 0) -> Block:
         """
         Creates a new Tetris block at the given position.
@@ -12,11 +49,36 @@ class BlockFactory:
         :param y: The starting y-coordinate on the board (default: 0)
         :return: A new Block instance
         """
-        block = Block(x, y)
-        num_rotations = len(SHAPES[block.shape])
-        block.rotate(random.randint(0, num_rotations - 1))
-        
-        if random.random() < BOMB_CHANCE:
-            block.is_bomb = True
-        
+        if not self._queue:
+            self._generate_batch()
+        block = self._queue.popleft()
+        block.x = x
+        block.y = y
         return block
+
+    def peek(self, count: int = 1) -> list:
+        """
+        Returns the next `count` blocks that create_block() will hand out, without consuming them.
+        The returned blocks are the queued instances themselves and must not be modified.
+
+        :param count: Number of upcoming blocks to preview
+        """
+        while len(self._queue) < count:
+            self._generate_batch()
+        return list(islice(self._queue, count))
+
+    def _generate_batch(self, count: int = BATCH_SIZE):
+        """
+        Draws `count` blocks at once using the precomputed cumulative shape weights.
+        """
+        rng = self.rng
+        random_value = rng.random
+        rotation_counts = self._rotation_counts
+        bomb_chance = self.bomb_chance
+
+        shapes = rng.choices(self._shape_indices, cum_weights=self._cum_weights, k=count)
+        colors = rng.choices(self._color_indices, k=count)
+        self._queue.extend(
+            Block(3, 0, shape, color_index, int(random_value() * rotation_counts[shape]), random_value() < bomb_chance)
+            for shape, color_index in zip(shapes, colors)
+        )
@@ -1,18 +1,336 @@
+import importlib.util
+import random
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+
 from game.block import BLOCK_COLORS
-from game.data import BLOCK_GRID_SIZE
+from game.board_change import BoardChange
+from game.shape_table import SHAPE_TABLE
+from game.board_backends.list_backend import ListBackend
+from game.board_backends.bitboard_backend import BitboardBackend
+from game.placement_index import PlacementIndex
+
+BOARD_BACKENDS = {
+    "list": ListBackend,
+    "bitboard": BitboardBackend
+}
+
+
+def _numpy_backend(board):
+    """
+    Creates a NumpyBackend, importing NumPy only when the backend is actually chosen.
+    NumPy alone takes longer to import than the rest of the game, so startup never pays for it.
+    """
+    from game.board_backends.numpy_backend import NumpyBackend
+    return NumpyBackend(board)
+
+
+# NumPy is optional; the "numpy" backend is only offered when it is installed
+if importlib.util.find_spec("numpy") is not None:
+    BOARD_BACKENDS["numpy"] = _numpy_backend
+
+CHANGE_LOG_SIZE = 64
+ZOBRIST_SEED = 0x7E7B0
+
+
+@lru_cache(maxsize=None)
+def _zobrist_keys(rows: int, cols: int):
+    """
+    Returns one random 64-bit key per cell, as keys[y][x], shared by every board of this size.
+    The keys come from a fixed seed, so a board's hash is the same in every process.
+    """
+    rng = random.Random(ZOBRIST_SEED ^ (rows << 16) ^ cols)
+    return tuple(tuple(rng.getrandbits(64) for _ in range(cols)) for _ in range(rows))
+
+
+class BoardRow(list):
+    """
+    A single row of Board.grid. Behaves like a normal list, but routes cell
+    writes through the board so its backend always stays in sync. The row
+    keeps the board's width, so operations that add or remove cells raise TypeError.
+    """
+    __slots__ = ("board", "y")
+
+    def __init__(self, board, y: int, cells):
+        super().__init__(cells)
+        if len(self) != board.cols:
+            raise ValueError(f"A board row needs {board.cols} cells, got {len(self)}")
+        self.board = board
+        self.y = y
+
+    def __setitem__(self, x, value):
+        if isinstance(x, slice):
+            value = list(value)
+            if len(range(*x.indices(len(self)))) != len(value):
+                raise ValueError("Slice assignment would change the width of the board")
+            super().__setitem__(x, value)
+            self.board._rebuild()
+        else:
+            self.board._set_cell(x, self.y, value)
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.board._rebuild()
+
+    def reverse(self):
+        super().reverse()
+        self.board._rebuild()
+
+    def _resize(self, *args, **kwargs):
+        raise TypeError("Board rows have a fixed number of cells")
+
+    append = extend = insert = pop = remove = clear = __delitem__ = __iadd__ = __imul__ = _resize
+
+
+class BoardGrid(list):
+    """
+    The list of rows behind Board.grid. Assigning a row (or a slice of rows) wraps the
+    new rows in BoardRow and resyncs the board, like assigning board.grid does. The grid
+    keeps the board's height, so operations that add or remove rows raise TypeError.
+    """
+    __slots__ = ("board",)
+
+    def __init__(self, board, rows):
+        super().__init__(BoardRow(board, y, row) for y, row in enumerate(rows))
+        if len(self) != board.rows:
+            raise ValueError(f"A board grid needs {board.rows} rows, got {len(self)}")
+        self.board = board
+
+    def __setitem__(self, y, value):
+        if isinstance(y, slice):
+            value = list(value)
+            if len(range(*y.indices(len(self)))) != len(value):
+                raise ValueError("Slice assignment would change the height of the board")
+            super().__setitem__(y, [BoardRow(self.board, 0, row) for row in value])
+            self._renumber()
+        else:
+            y = range(len(self))[y]
+            super().__setitem__(y, BoardRow(self.board, y, value))
+        self.board._rebuild()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._renumber()
+        self.board._rebuild()
+
+    def reverse(self):
+        super().reverse()
+        self._renumber()
+        self.board._rebuild()
+
+    def _renumber(self):
+        for y, row in enumerate(self):
+            row.y = y
+
+    def _resize(self, *args, **kwargs):
+        raise TypeError("The board grid has a fixed number of rows")
+
+    append = extend = insert = pop = remove = clear = __delitem__ = __iadd__ = __imul__ = _resize
+
 
 class Board:
-    def __init__(self, rows=20, cols=10):
+    def __init__(self, rows=20, cols=10, backend="list"):
         """
         Initializes the game board with specified rows and columns.
 
         :param rows: The number of rows on the board (default is 20)
         :param cols: The number of columns on the board (default is 10)
+        :param backend: Name of the occupancy backend, one of BOARD_BACKENDS (default is "list").
+                        "bitboard" is fastest for collision checks, "numpy" (if installed)
+                        for explosions and line clears on large boards.
         """
+        if backend not in BOARD_BACKENDS:
+            available = ", ".join(sorted(BOARD_BACKENDS))
+            raise ValueError(f"Unknown board backend '{backend}' (available: {available})")
+
         self.rows = rows
         self.cols = cols
         self.BLOCK_COLORS = BLOCK_COLORS
-        self.grid = [[0 for _ in range(cols)] for _ in range(rows)]
+        self.backend_name = backend
+        self.version = 0
+        self.last_clear_version = 0
+        self.change_log = deque(maxlen=CHANGE_LOG_SIZE)
+        self._listeners = []
+        self._change = None
+        self._change_depth = 0
+        self._zobrist_keys = _zobrist_keys(rows, cols)
+        self.zobrist_hash = 0
+        self._grid = BoardGrid(self, ([0] * cols for _ in range(rows)))
+        self.row_counts = [0] * rows
+        self.col_counts = [0] * cols
+        self.col_heights = [0] * cols
+        self.backend = BOARD_BACKENDS[backend](self)
+        self.backend.reset()
+        self.placement_index = PlacementIndex(self)
+
+    @property
+    def grid(self):
+        return self._grid
+
+    @grid.setter
+    def grid(self, rows):
+        """
+        Replaces the whole grid and rebuilds the backend from it.
+        """
+        self._grid = BoardGrid(self, rows)
+        self._rebuild()
+
+    def copy(self):
+        """
+        Returns an independent board with the same cells, counters and backend type.
+        The copy starts with an empty change log and no subscribers, which makes it
+        cheap enough for bots to try out placements on.
+        """
+        board = Board(self.rows, self.cols, backend=self.backend_name)
+        board._grid = BoardGrid(board, self._grid)
+        board.row_counts = self.row_counts[:]
+        board.col_counts = self.col_counts[:]
+        board.col_heights = self.col_heights[:]
+        board.zobrist_hash = self.zobrist_hash
+        board.backend.reset()
+        return board
+
+    def _rebuild(self):
+        """
+        Resyncs the backend after an untracked bulk change to the grid.
+        """
+        with self._track_changes("reset") as change:
+            self._recount()
+            self.backend.reset()
+            change.full_refresh = True
+
+    def _recount(self):
+        """
+        Recomputes the per-row and per-column occupancy counters, the column
+        heights and the Zobrist hash from the grid.
+        """
+        self.row_counts = [0] * self.rows
+        self.col_counts = [0] * self.cols
+        self.col_heights = [0] * self.cols
+        self.zobrist_hash = 0
+        for y, row in enumerate(self._grid):
+            for x, cell in enumerate(row):
+                if cell > 0:
+                    self.zobrist_hash ^= self._zobrist_keys[y][x]
+                    self.row_counts[y] += 1
+                    self.col_counts[x] += 1
+                    if self.col_heights[x] == 0:
+                        self.col_heights[x] = self.rows - y
+
+    def _update_col_height(self, x: int, y: int, filled: bool):
+        """
+        Keeps col_heights in sync after cell (x, y) was filled or emptied.
+        Emptying the top cell of a column scans down for the next filled one.
+        """
+        height = self.rows - y
+        if filled:
+            if height > self.col_heights[x]:
+                self.col_heights[x] = height
+        elif height == self.col_heights[x]:
+            grid = self._grid
+            for below in range(y + 1, self.rows):
+                if grid[below][x] > 0:
+                    self.col_heights[x] = self.rows - below
+                    return
+            self.col_heights[x] = 0
+
+    def subscribe(self, listener):
+        """
+        Registers a callable that receives every BoardChange after it is committed.
+
+        :param listener: Callable taking a single BoardChange argument
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        """
+        Removes a listener registered with subscribe().
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def changes_since(self, version: int):
+        """
+        Returns the logged changes newer than the given version, oldest first.
+
+        :param version: A value previously read from board.version
+        :return: A list of BoardChange, or None if the log no longer reaches back that far
+        """
+        if version == self.version:
+            return []
+        if not self.change_log or self.change_log[0].version > version + 1:
+            return None
+        return [change for change in self.change_log if change.version > version]
+
+    @contextmanager
+    def _track_changes(self, action: str):
+        """
+        Groups every cell write inside the block into a single BoardChange.
+        Nested operations (explode_bomb calling explode_area) join the outer change.
+        """
+        if self._change_depth == 0:
+            self._change = BoardChange(action, self.cols)
+        self._change_depth += 1
+        try:
+            yield self._change
+        finally:
+            self._change_depth -= 1
+            if self._change_depth == 0:
+                change = self._change
+                self._change = None
+                self._commit_change(change)
+
+    def _commit_change(self, change: BoardChange):
+        """
+        Bumps the version, logs the change and notifies subscribers.
+        """
+        if change.is_empty():
+            return
+        self.version += 1
+        change.version = self.version
+        if change.cleared_cells or change.shifted_rows or change.full_refresh:
+            self.last_clear_version = self.version
+        self.change_log.append(change)
+        for listener in list(self._listeners):
+            listener(change)
+
+    def _set_cell(self, x: int, y: int, value: int):
+        """
+        Writes a single cell, records it in the current change and updates
+        the occupancy counters, Zobrist hash and backend if its occupancy changed.
+        """
+        change = self._change
+        if change is None:
+            with self._track_changes("set"):
+                self._set_cell(x, y, value)
+            return
+
+        row = self._grid[y]
+        if x < 0:
+            x += self.cols
+        old_value = row[x]
+        if old_value == value:
+            return
+        list.__setitem__(row, x, value)
+
+        cell = (x, row.y)
+        if value > 0:
+            change.set_cells.add(cell)
+            change.cleared_cells.discard(cell)
+        else:
+            change.cleared_cells.add(cell)
+            change.set_cells.discard(cell)
+
+        filled = value > 0
+        if (old_value > 0) != filled:
+            delta = 1 if filled else -1
+            self.row_counts[row.y] += delta
+            self.col_counts[x] += delta
+            self._update_col_height(x, row.y, filled)
+            self.zobrist_hash ^= self._zobrist_keys[row.y][x]
+            self.backend.cell_changed(x, row.y, filled)
 
     def is_valid_position(self, block):
         """
@@ -21,16 +339,54 @@ class Board:
         :param block: The block to check
         :return: True if the block's position is valid, otherwise False
         """
-        for i in range(BLOCK_GRID_SIZE):
-            for j in range(BLOCK_GRID_SIZE):
-                if i * BLOCK_GRID_SIZE + j in block.get_shape():
-                    x = block.x + j
-                    y = block.y + i
-                    if x < 0 or x >= self.cols or y >= self.rows:
-                        return False
-                    if y >= 0 and self.grid[y][x] > 0:
-                        return False
-        return True
+        return self.backend.fits(block.shape, block.rotation, block.x, block.y)
+
+    def fits(self, shape: int, rotation: int, x: int, y: int) -> bool:
+        """
+        Checks if a shape rotation fits at the given position, without needing a Block.
+        Use this for what-if queries such as drag previews instead of copying a block.
+
+        :param shape: Index into SHAPES
+        :param rotation: Index into the rotations of the shape
+        :param x: Board column of the shape's origin
+        :param y: Board row of the shape's origin
+        :return: True if every cell is on the board and empty, otherwise False
+        """
+        return self.backend.fits(shape, rotation, x, y)
+
+    def drop_distance(self, block) -> int:
+        """
+        Returns how many rows the block can fall from its position before it lands.
+
+        Computed from the column heights and the shape's bottom profile in one pass over
+        its columns. If the block sits below an overhang in any of its columns, the heights
+        say nothing about the gap it is in, so the rows are checked one by one instead.
+
+        :param block: The block to drop (it is not moved)
+        :return: The number of free rows below the block, 0 if it cannot fall or is not in a valid position
+        """
+        if not self.backend.fits(block.shape, block.rotation, block.x, block.y):
+            return 0
+        rows = self.rows
+        heights = self.col_heights
+        distances = []
+        for dx, dy in SHAPE_TABLE[block.shape][block.rotation].bottom_profile:
+            surface = rows - heights[block.x + dx]
+            lowest = block.y + dy
+            if lowest >= surface:
+                return self._scan_drop_distance(block)
+            distances.append(surface - 1 - lowest)
+        return min(distances)
+
+    def _scan_drop_distance(self, block) -> int:
+        """
+        Counts the free rows below the block by checking each row in turn.
+        """
+        fits = self.backend.fits
+        distance = 0
+        while fits(block.shape, block.rotation, block.x, block.y + distance + 1):
+            distance += 1
+        return distance
 
     def freeze(self, block):
         """
@@ -38,13 +394,13 @@ class Board:
 
         :param block: The block to freeze
         """
-        for i in range(BLOCK_GRID_SIZE):
-            for j in range(BLOCK_GRID_SIZE):
-                if i * BLOCK_GRID_SIZE + j in block.get_shape():
-                    x = block.x + j
-                    y = block.y + i
-                    if y >= 0:
-                        self.grid[y][x] = block.color_index
+        cells = [
+            (block.x + dx, block.y + dy)
+            for dx, dy in SHAPE_TABLE[block.shape][block.rotation].cells
+            if block.y + dy >= 0
+        ]
+        with self._track_changes("freeze"):
+            self.backend.write_cells(cells, block.color_index)
 
     def break_lines(self):
         """
@@ -52,80 +408,109 @@ class Board:
 
         :return: The number of lines cleared
         """
-        lines_cleared = 0
-        
-        rows_to_clear = []
-        for i, row in enumerate(self.grid):
-            if all(cell > 0 for cell in row):
-                rows_to_clear.append(i)
-                lines_cleared += 1
-        
-        cols_to_clear = []
-        for j in range(self.cols):
-            if all(self.grid[i][j] > 0 for i in range(self.rows)):
-                cols_to_clear.append(j)
-                lines_cleared += 1
-        
-        new_grid = []
-        for i, row in enumerate(self.grid):
-            if i not in rows_to_clear:
-                new_row = [0 if j in cols_to_clear else cell for j, cell in enumerate(row)]
-                new_grid.append(new_row)
-        
-        for _ in range(len(rows_to_clear)):
-            new_grid.insert(0, [0 for _ in range(self.cols)])
-        
-        self.grid = new_grid
+        rows_to_clear = self.backend.full_rows()
+        cols_to_clear = self.backend.full_cols()
+        lines_cleared = len(rows_to_clear) + len(cols_to_clear)
+        if not lines_cleared:
+            return 0
+
+        with self._track_changes("break_lines") as change:
+            change.cleared_rows = rows_to_clear
+            change.cleared_cols = cols_to_clear
+
+            cleared_row_set = set(rows_to_clear)
+            if cols_to_clear:
+                self.backend.clear_cols(cols_to_clear, cleared_row_set)
+
+            if rows_to_clear:
+                self._shift_rows_down(max(rows_to_clear), cleared_row_set, change)
+
         return lines_cleared
-    
+
+    def _shift_rows_down(self, lowest: int, cleared_rows: set, change: BoardChange):
+        """
+        Removes the cleared rows by moving the BoardRow objects above them down instead
+        of copying cells: the cleared rows are deleted, as many empty rows are inserted
+        at the top and the moved rows are renumbered. Rows below `lowest` are never touched.
+        Counters, column heights, the hash and the backend are then updated in one pass,
+        and the shift is recorded once in change.shifted_rows.
+        """
+        grid = self._grid
+        row_counts = self.row_counts
+        keys = self._zobrist_keys
+        cols = self.cols
+        top = next(y for y in range(lowest + 1) if row_counts[y])
+
+        zobrist_hash = self.zobrist_hash
+        dest = lowest
+        for src in range(lowest, top - 1, -1):
+            old_keys = keys[src]
+            if src in cleared_rows:
+                for x in range(cols):
+                    zobrist_hash ^= old_keys[x]
+                continue
+            if src != dest and row_counts[src]:
+                new_keys = keys[dest]
+                row = grid[src]
+                for x in range(cols):
+                    if row[x] > 0:
+                        zobrist_hash ^= old_keys[x] ^ new_keys[x]
+            dest -= 1
+        self.zobrist_hash = zobrist_hash
+
+        removed = sorted(cleared_rows)
+        kept = [y for y in range(lowest + 1) if y not in cleared_rows]
+        fresh = [BoardRow(self, y, [0] * cols) for y in range(len(removed))]
+        # list.__setitem__ skips BoardGrid's rebuild, the counters are updated below
+        list.__setitem__(grid, slice(0, lowest + 1), fresh + [grid[y] for y in kept])
+        row_counts[:lowest + 1] = [0] * len(removed) + [row_counts[y] for y in kept]
+        for y in range(len(removed), lowest + 1):
+            grid[y].y = y
+
+        # Cleared rows were full, so every column loses one cell per row
+        self.col_counts = [count - len(removed) for count in self.col_counts]
+        for x in range(cols):
+            if self.col_heights[x] >= self.rows - lowest:
+                self.col_heights[x] = next(
+                    (self.rows - y for y in range(self.rows) if grid[y][x] > 0), 0
+                )
+        self.backend.rows_removed(removed)
+        change.shifted_rows = list(range(top, lowest + 1))
+
     def has_space_for_block(self, block):
         """
         Checks if the given block can be placed anywhere on the board.
+        The answer is served from the placement index, and the block itself is not moved.
         """
-        for y in range(self.rows):
-            for x in range(self.cols):
-                block.x = x
-                block.y = y
-                if self.is_valid_position(block):
-                    return True
-        return False
+        return self.placement_index.has_space(block.shape, block.rotation)
 
     def explode_area(self, center_x: int, center_y: int, radius: int = 1):
         """
         Clears an area centered on the given coordinates.
         The area is (2*radius + 1) x (2*radius + 1).
-        
+
         :param center_x: X coordinate of explosion center
         :param center_y: Y coordinate of explosion center
         :param radius: Explosion radius (default 1 for 3x3 area)
         :return: Number of blocks cleared
         """
-        blocks_cleared = 0
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                x = center_x + dx
-                y = center_y + dy
-                if 0 <= x < self.cols and 0 <= y < self.rows:
-                    if self.grid[y][x] > 0:
-                        blocks_cleared += 1
-                    self.grid[y][x] = 0
-        return blocks_cleared
+        with self._track_changes("explode_area"):
+            return self.backend.clear_explosion([(center_x, center_y)], radius)
 
     def explode_bomb(self, block):
         """
         Explodes a bomb block, clearing areas around each cell in the block.
-        
+        The areas are merged into one union first, so overlapping squares are cleared once.
+
         :param block: The bomb block to explode
         :return: Total number of blocks cleared
         """
         if not block.is_bomb:
             return 0
-        
-        explosion_radius = block.get_explosion_radius()
-        total_cleared = 0
-        
-        for center_x, center_y in block.get_board_positions():
-            if 0 <= center_y < self.rows and 0 <= center_x < self.cols:
-                total_cleared += self.explode_area(center_x, center_y, explosion_radius)
-        
-        return total_cleared
+
+        centers = [
+            (center_x, center_y) for center_x, center_y in block.get_board_positions()
+            if 0 <= center_y < self.rows and 0 <= center_x < self.cols
+        ]
+        with self._track_changes("explode_bomb"):
+            return self.backend.clear_explosion(centers, block.get_explosion_radius())
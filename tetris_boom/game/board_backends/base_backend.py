@@ -0,0 +1,122 @@
+from abc import ABC, abstractmethod
+
+
+class BoardBackend(ABC):
+    def __init__(self, board):
+        """
+        Base class for the occupancy index a Board keeps next to its grid.
+
+        Every cell write on the board is reported to the backend through
+        cell_changed(), so the backend never has to rescan the grid itself.
+        Freezes, explosions and column clears go through write_cells(),
+        clear_explosion() and clear_cols(), which a backend may override to
+        apply them in bulk.
+
+        :param board: The Board instance this backend serves
+        """
+        self.board = board
+
+    @abstractmethod
+    def reset(self):
+        """
+        Rebuilds the backend state from scratch out of board.grid.
+        """
+        pass
+
+    @abstractmethod
+    def cell_changed(self, x: int, y: int, filled: bool):
+        """
+        Called whenever a cell switches between empty and filled.
+
+        :param x: Column of the cell
+        :param y: Row of the cell
+        :param filled: True if the cell is now occupied
+        """
+        pass
+
+    @abstractmethod
+    def fits(self, shape: int, rotation: int, x: int, y: int) -> bool:
+        """
+        Checks if a shape in the given rotation fits at (x, y).
+        Cells above the board (y < 0) are allowed, like in Board.is_valid_position.
+        """
+        pass
+
+    @abstractmethod
+    def full_rows(self) -> list:
+        """
+        Returns the indices of all completely filled rows.
+        """
+        pass
+
+    @abstractmethod
+    def full_cols(self) -> list:
+        """
+        Returns the indices of all completely filled columns.
+        """
+        pass
+
+    def explosion_cells(self, centers, radius: int) -> list:
+        """
+        Returns the filled cells inside the union of the (2*radius + 1) squares
+        around each center. Overlapping squares are only counted once.
+
+        :param centers: Iterable of (x, y) explosion centers on the board
+        :param radius: Explosion radius shared by every center
+        :return: List of (x, y) cells that the explosion clears
+        """
+        board = self.board
+        grid = board.grid
+        cells = set()
+        for center_x, center_y in centers:
+            for y in range(max(0, center_y - radius), min(board.rows, center_y + radius + 1)):
+                row = grid[y]
+                for x in range(max(0, center_x - radius), min(board.cols, center_x + radius + 1)):
+                    if row[x] > 0:
+                        cells.add((x, y))
+        return list(cells)
+
+    def rows_removed(self, rows):
+        """
+        Called after a line clear deleted the given rows from board.grid and inserted
+        as many empty rows at the top. The default rebuilds from the grid.
+
+        :param rows: The deleted row indices, ascending
+        """
+        self.reset()
+
+    def write_cells(self, cells, value: int):
+        """
+        Writes value into distinct (x, y) board cells, inside the board's current change.
+        The default goes through Board._set_cell cell by cell; backends that can update
+        the grid, counters and hash in bulk override it.
+
+        :param cells: Iterable of (x, y) cells on the board
+        :param value: Color index to write, 0 to empty the cells
+        """
+        set_cell = self.board._set_cell
+        for x, y in cells:
+            set_cell(x, y, value)
+
+    def clear_explosion(self, centers, radius: int) -> int:
+        """
+        Empties the cells explosion_cells() finds, inside the board's current change.
+
+        :return: Number of cells cleared
+        """
+        cells = self.explosion_cells(centers, radius)
+        self.write_cells(cells, 0)
+        return len(cells)
+
+    def clear_cols(self, cols, skip_rows):
+        """
+        Empties whole columns except the given rows, inside the board's current change.
+
+        :param cols: Column indices to clear
+        :param skip_rows: Set of row indices to leave alone
+        """
+        grid = self.board.grid
+        self.write_cells(
+            [(x, y) for x in cols for y in range(self.board.rows) if y not in skip_rows and grid[y][x] > 0],
+            0
+        )
@@ -0,0 +1,80 @@
+from game.board_backends.base_backend import BoardBackend
+from game.shape_table import SHAPE_TABLE
+
+
+class BitboardBackend(BoardBackend):
+    """
+    Keeps one int bitmask per board row (bit x set means column x is filled),
+    so collision and full-line checks become a few shifts and ANDs.
+    """
+
+    def __init__(self, board):
+        super().__init__(board)
+        self.row_masks = []
+        self.full_mask = 0
+
+    def reset(self):
+        self.full_mask = (1 << self.board.cols) - 1
+        self.row_masks = []
+        for row in self.board.grid:
+            mask = 0
+            for x, cell in enumerate(row):
+                if cell > 0:
+                    mask |= 1 << x
+            self.row_masks.append(mask)
+
+    def cell_changed(self, x: int, y: int, filled: bool):
+        if filled:
+            self.row_masks[y] |= 1 << x
+        else:
+            self.row_masks[y] &= ~(1 << x)
+
+    def rows_removed(self, rows):
+        for y in reversed(rows):
+            del self.row_masks[y]
+        self.row_masks[0:0] = [0] * len(rows)
+
+    def fits(self, shape: int, rotation: int, x: int, y: int) -> bool:
+        info = SHAPE_TABLE[shape][rotation]
+        if x + info.min_x < 0 or x + info.max_x >= self.board.cols or y + info.max_y >= self.board.rows:
+            return False
+
+        row_masks = self.row_masks
+        for dy, mask in info.row_masks:
+            row = y + dy
+            if row < 0:
+                continue
+            if row_masks[row] & (mask << x if x >= 0 else mask >> -x):
+                return False
+        return True
+
+    def explosion_cells(self, centers, radius: int) -> list:
+        board = self.board
+        window = (1 << (2 * radius + 1)) - 1
+        row_windows = {}
+        for center_x, center_y in centers:
+            shift = center_x - radius
+            mask = window << shift if shift >= 0 else window >> -shift
+            for y in range(max(0, center_y - radius), min(board.rows, center_y + radius + 1)):
+                row_windows[y] = row_windows.get(y, 0) | mask
+
+        cells = []
+        for y, mask in row_windows.items():
+            hits = self.row_masks[y] & mask & self.full_mask
+            while hits:
+                low_bit = hits & -hits
+                cells.append((low_bit.bit_length() - 1, y))
+                hits ^= low_bit
+        return cells
+
+    def full_rows(self) -> list:
+        full_mask = self.full_mask
+        return [i for i, mask in enumerate(self.row_masks) if mask == full_mask]
+
+    def full_cols(self) -> list:
+        common = self.full_mask
+        for mask in self.row_masks:
+            common &= mask
+            if not common:
+                return []
+        return [j for j in range(self.board.cols) if common >> j & 1]
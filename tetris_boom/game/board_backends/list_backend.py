@@ -0,0 +1,35 @@
+from game.board_backends.base_backend import BoardBackend
+from game.shape_table import SHAPE_TABLE
+
+
+class ListBackend(BoardBackend):
+    """
+    Default backend: answers collision queries straight from board.grid and
+    full-line queries from the board's row and column occupancy counters.
+    """
+
+    def reset(self):
+        pass
+
+    def cell_changed(self, x: int, y: int, filled: bool):
+        pass
+
+    def fits(self, shape: int, rotation: int, x: int, y: int) -> bool:
+        board = self.board
+        grid = board.grid
+        for dx, dy in SHAPE_TABLE[shape][rotation].cells:
+            cell_x = x + dx
+            cell_y = y + dy
+            if cell_x < 0 or cell_x >= board.cols or cell_y >= board.rows:
+                return False
+            if cell_y >= 0 and grid[cell_y][cell_x] > 0:
+                return False
+        return True
+
+    def full_rows(self) -> list:
+        cols = self.board.cols
+        return [i for i, count in enumerate(self.board.row_counts) if count == cols]
+
+    def full_cols(self) -> list:
+        rows = self.board.rows
+        return [j for j, count in enumerate(self.board.col_counts) if count == rows]
@@ -0,0 +1,185 @@
+from functools import lru_cache
+
+import numpy as np
+
+from game.board import _zobrist_keys
+from game.board_backends.base_backend import BoardBackend
+from game.shape_table import SHAPE_TABLE
+
+
+def _build_shape_arrays():
+    """
+    Precomputes a boolean array of the bounding box of every shape rotation.
+    """
+    table = []
+    for rotations in SHAPE_TABLE:
+        arrays = []
+        for info in rotations:
+            array = np.zeros((info.height, info.width), dtype=bool)
+            for dx, dy in info.cells:
+                array[dy - info.min_y, dx - info.min_x] = True
+            arrays.append(array)
+        table.append(arrays)
+    return table
+
+
+SHAPE_ARRAYS = _build_shape_arrays()
+
+
+@lru_cache(maxsize=None)
+def _zobrist_array(rows: int, cols: int):
+    """
+    Returns the Zobrist keys of a board size as a (rows, cols) uint64 array.
+    """
+    return np.array(_zobrist_keys(rows, cols), dtype=np.uint64)
+
+
+class NumpyBackend(BoardBackend):
+    """
+    Mirrors the board occupancy in a boolean NumPy array so that full-line
+    checks are axis reductions and bomb explosions are a single union mask,
+    which pays off on large custom boards.
+
+    Freezes, explosions and column clears are applied to the array in one
+    fancy-index assignment, and the board's grid, counters, column heights and
+    hash are then resynced from it in bulk instead of cell by cell.
+    """
+
+    def __init__(self, board):
+        super().__init__(board)
+        self.cells = np.zeros((board.rows, board.cols), dtype=bool)
+        self._no_cells = np.zeros(0, dtype=np.intp)
+
+    def reset(self):
+        board = self.board
+        self.cells = np.array(
+            [[cell > 0 for cell in row] for row in board.grid],
+            dtype=bool
+        ).reshape(board.rows, board.cols)
+
+    def cell_changed(self, x: int, y: int, filled: bool):
+        self.cells[y, x] = filled
+
+    def rows_removed(self, rows):
+        kept = np.delete(self.cells, rows, axis=0)
+        self.cells = np.concatenate([np.zeros((len(rows), self.board.cols), dtype=bool), kept])
+
+    def fits(self, shape: int, rotation: int, x: int, y: int) -> bool:
+        info = SHAPE_TABLE[shape][rotation]
+        left = x + info.min_x
+        top = y + info.min_y
+        if left < 0 or x + info.max_x >= self.board.cols or y + info.max_y >= self.board.rows:
+            return False
+
+        shape_array = SHAPE_ARRAYS[shape][rotation]
+        if top < 0:
+            shape_array = shape_array[-top:]
+            top = 0
+        region = self.cells[top:top + shape_array.shape[0], left:left + shape_array.shape[1]]
+        return not (region & shape_array).any()
+
+    def full_rows(self) -> list:
+        return np.flatnonzero(self.cells.all(axis=1)).tolist()
+
+    def full_cols(self) -> list:
+        return np.flatnonzero(self.cells.all(axis=0)).tolist()
+
+    def write_cells(self, cells, value: int):
+        cells = np.asarray(list(cells), dtype=np.intp).reshape(-1, 2)
+        xs, ys = cells[:, 0], cells[:, 1]
+        flips = self.cells[ys, xs] != (value > 0)
+        if not flips.all():
+            # Cells that stay filled only change color, which touches no counter
+            set_cell = self.board._set_cell
+            for x, y in zip(xs[~flips].tolist(), ys[~flips].tolist()):
+                set_cell(x, y, value)
+            xs, ys = xs[flips], ys[flips]
+        self._flip(xs, ys, value)
+
+    def clear_explosion(self, centers, radius: int) -> int:
+        xs, ys = self._explosion_coords(centers, radius)
+        self._flip(xs, ys, 0)
+        return len(xs)
+
+    def clear_cols(self, cols, skip_rows):
+        mask = np.zeros_like(self.cells)
+        mask[:, cols] = True
+        mask[list(skip_rows), :] = False
+        ys, xs = np.nonzero(mask & self.cells)
+        self._flip(xs, ys, 0)
+
+    def _flip(self, xs, ys, value: int):
+        """
+        Writes value into cells whose occupancy it changes, given as coordinate arrays,
+        and resyncs the board's grid, change, counters, column heights and hash in bulk.
+        """
+        if not len(xs):
+            return
+        board = self.board
+        filled = value > 0
+        self.cells[ys, xs] = filled
+
+        grid = board.grid
+        x_list = xs.tolist()
+        y_list = ys.tolist()
+        for x, y in zip(x_list, y_list):
+            list.__setitem__(grid[y], x, value)
+
+        coords = set(zip(x_list, y_list))
+        change = board._change
+        if filled:
+            change.set_cells |= coords
+            change.cleared_cells -= coords
+        else:
+            change.cleared_cells |= coords
+            change.set_cells -= coords
+
+        delta = 1 if filled else -1
+        row_deltas = np.bincount(ys, minlength=board.rows)
+        for y in np.flatnonzero(row_deltas).tolist():
+            board.row_counts[y] += delta * int(row_deltas[y])
+        col_deltas = np.bincount(xs, minlength=board.cols)
+        touched_cols = np.flatnonzero(col_deltas)
+        for x in touched_cols.tolist():
+            board.col_counts[x] += delta * int(col_deltas[x])
+
+        columns = self.cells[:, touched_cols]
+        heights = np.where(columns.any(axis=0), board.rows - columns.argmax(axis=0), 0)
+        for x, height in zip(touched_cols.tolist(), heights.tolist()):
+            board.col_heights[x] = height
+
+        board.zobrist_hash ^= int(np.bitwise_xor.reduce(_zobrist_array(board.rows, board.cols)[ys, xs]))
+
+    def _explosion_coords(self, centers, radius: int):
+        """
+        Returns (xs, ys) arrays of the filled cells inside the union of the (2*radius + 1)
+        squares around the centers. The union mask only spans the centers' bounding box,
+        so the cost does not grow with the board.
+        """
+        board = self.board
+        centers = list(centers)
+        if not centers:
+            return self._no_cells, self._no_cells
+        left = min(x for x, _ in centers) - radius
+        top = min(y for _, y in centers) - radius
+        width = max(x for x, _ in centers) + radius + 1 - left
+        height = max(y for _, y in centers) + radius + 1 - top
+
+        blast = np.zeros((height, width), dtype=bool)
+        size = 2 * radius + 1
+        for center_x, center_y in centers:
+            blast[center_y - radius - top:center_y - radius - top + size,
+                  center_x - radius - left:center_x - radius - left + size] = True
+
+        # Clip the box to the board, centers just off the board still reach onto it
+        x0, y0 = max(left, 0), max(top, 0)
+        x1, y1 = min(left + width, board.cols), min(top + height, board.rows)
+        if x0 >= x1 or y0 >= y1:
+            return self._no_cells, self._no_cells
+        blast = blast[y0 - top:y1 - top, x0 - left:x1 - left]
+        ys, xs = np.nonzero(blast & self.cells[y0:y1, x0:x1])
+        return xs + x0, ys + y0
+
+    def explosion_cells(self, centers, radius: int) -> list:
+        xs, ys = self._explosion_coords(centers, radius)
+        return list(zip(xs.tolist(), ys.tolist()))
@@ -0,0 +1,58 @@
+class BoardChange:
+    def __init__(self, action: str, cols: int = 0):
+        """
+        Describes one mutation of a Board, as published in Board.change_log
+        and to subscribers.
+
+        Cells are (x, y) board coordinates and describe the final state of the
+        cell after the mutation, so a cell is never in both sets. Rows moved down
+        by a line clear are listed once in shifted_rows instead of cell by cell;
+        the dirty_* helpers expand them to every cell of those rows.
+
+        :param action: Name of the board operation that produced the change
+                       ("freeze", "break_lines", "explode_area", "explode_bomb",
+                       "set" for direct grid writes or "reset" for grid replacement)
+        :param cols: Width of the board, used to expand shifted rows into cells
+        """
+        self.action = action
+        self.cols = cols
+        self.version = None
+        self.set_cells = set()
+        self.cleared_cells = set()
+        self.cleared_rows = []
+        self.cleared_cols = []
+        self.shifted_rows = []
+        self.full_refresh = False
+
+    def is_empty(self) -> bool:
+        """
+        Returns True if the operation did not change anything.
+        """
+        return not (self.set_cells or self.cleared_cells or self.shifted_rows or self.full_refresh)
+
+    def dirty_cells(self) -> set:
+        """
+        Returns every cell whose value changed.
+        """
+        shifted = {(x, y) for y in self.shifted_rows for x in range(self.cols)}
+        return self.set_cells | self.cleared_cells | shifted
+
+    def dirty_rows(self) -> set:
+        """
+        Returns every row that contains at least one changed cell.
+        """
+        return {y for _, y in self.set_cells} | {y for _, y in self.cleared_cells} | set(self.shifted_rows)
+
+    def dirty_cols(self) -> set:
+        """
+        Returns every column that contains at least one changed cell.
+        """
+        shifted = set(range(self.cols)) if self.shifted_rows else set()
+        return {x for x, _ in self.set_cells} | {x for x, _ in self.cleared_cells} | shifted
+
+    def __repr__(self):
+        return (
+            f"BoardChange(version={self.version}, action={self.action!r}, "
+            f"set={len(self.set_cells)}, cleared={len(self.cleared_cells)}, "
+            f"rows={self.cleared_rows}, cols={self.cleared_cols})"
+        )
@@ -0,0 +1,84 @@
+"""
+Measures how long TetrisBot takes to choose a placement, on boards from real
+headless games, and compares it with the frame budget.
+
+Run from the tetris_boom directory, for example:
+
+    python -m game.bots.benchmark --pieces 2000
+    python -m game.bots.benchmark --pieces 500 --fps 30 --backend bitboard
+"""
+import argparse
+import json
+import sys
+import time
+
+from game.bots.tetris_bot import TetrisBot
+from game.data import DEFAULT_RENDER_FPS
+from game.frame_profiler import percentile
+from game.simulation.headless_engine import HeadlessEngine, HARD_DROP
+
+
+def run_benchmark(pieces: int = 1000, seed: int = 0, fps: int = DEFAULT_RENDER_FPS,
+                  board_backend: str = "list", bot: TetrisBot = None, clock=time.perf_counter) -> dict:
+    """
+    Lets the bot play headless Tetris games until it has placed `pieces` pieces,
+    timing every choose_placement() call. Games that end are restarted with the next seed.
+
+    :param pieces: Number of placement decisions to time
+    :param seed: Seed of the first game
+    :param fps: Frame rate whose frame budget the decisions are compared with
+    :param board_backend: Board backend name (see game.board.BOARD_BACKENDS)
+    :param bot: The bot to measure (default is TetrisBot())
+    :return: Dict with the decision time percentiles in milliseconds, the frame budget and
+             how many decisions did not fit in it
+    """
+    if pieces < 1:
+        raise ValueError("pieces must be at least 1")
+    bot = bot or TetrisBot()
+    engine = HeadlessEngine(board_backend=board_backend, seed=seed, switch_modes=False)
+    times = []
+    games = 1
+
+    while len(times) < pieces:
+        if engine.game_over:
+            engine.reset(seed + games)
+            games += 1
+        block = engine.current_block
+        started = clock()
+        placement = bot.choose_placement(engine.board, block)
+        times.append((clock() - started) * 1000.0)
+        for action in placement.moves if placement else ():
+            engine.step(action)
+        engine.step(HARD_DROP)
+
+    frame_budget_ms = 1000.0 / fps
+    times.sort()
+    return {
+        "pieces": pieces,
+        "games": games,
+        "p50_ms": round(percentile(times, 50), 3),
+        "p95_ms": round(percentile(times, 95), 3),
+        "p99_ms": round(percentile(times, 99), 3),
+        "max_ms": round(times[-1], 3),
+        "frame_budget_ms": round(frame_budget_ms, 3),
+        "over_budget": sum(1 for value in times if value > frame_budget_ms)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Tetris bot's placement search.")
+    parser.add_argument("--pieces", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fps", type=int, default=DEFAULT_RENDER_FPS,
+                        help="Frame rate to compare decision times against")
+    parser.add_argument("--backend", default="list", help="Board backend to search on")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(args.pieces, seed=args.seed, fps=args.fps, board_backend=args.backend)
+    json.dump(result, sys.stdout, indent=4)
+    sys.stdout.write("\n")
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+from game.bots.blockblast_solver import BlockBlastSolver, move_fits
+from game.data import NEXT_BLOCKS_COUNT
+from game.modes.blockblast_mode import BlockBlastMode
+
+BOT_PLACE_INTERVAL = 0.5        # Seconds between two bot placements, slow enough to follow on screen
+BOT_SOLVER_TIME_BUDGET = 0.1    # Seconds the solver may think once per tray, in a worker process
+
+
+class BlockBlastBotDriver:
+    def __init__(self, solver: BlockBlastSolver = None, place_interval: float = BOT_PLACE_INTERVAL):
+        """
+        Plays BlockBlast mode with a BlockBlastSolver. Drag-and-drop depends on the real
+        mouse position, so instead of posting events the driver calls the input handler's
+        place_block(), the same path a mouse drop ends in.
+
+        Call update() once per frame. When the driver runs out of planned moves or a planned
+        move no longer fits, the tray is solved in a worker process (solve_async()) so frames
+        keep coming; once the answer is in, one piece is placed per interval.
+        Game over screens are left to TetrisBotDriver, which restarts every mode.
+
+        :param solver: The solver planning the tray (default is BlockBlastSolver with
+                       BOT_SOLVER_TIME_BUDGET)
+        :param place_interval: Seconds between placements, 0 for one placement per frame
+        """
+        self.solver = solver or BlockBlastSolver(time_budget=BOT_SOLVER_TIME_BUDGET)
+        self.place_interval = place_interval
+        self.reset()
+
+    def reset(self):
+        self._moves = []
+        self._place_timer = 0.0
+        self._request = None
+
+    def update(self, game_mode, dt: float):
+        """
+        Advances the driver by dt seconds and places the next piece if one is due.
+        Does nothing outside BlockBlast mode or on the game over screen.
+
+        :param game_mode: The active game mode
+        :param dt: Seconds since the last call
+        """
+        if game_mode.game_over or not isinstance(game_mode, BlockBlastMode):
+            self.reset()
+            return
+
+        self._place_timer += dt
+        state = game_mode.state
+        tray = state.next_blocks[:NEXT_BLOCKS_COUNT]
+
+        if self._request is not None:
+            version, requested_tray, future = self._request
+            if not future.done():
+                return
+            self._request = None
+            solution = self.solver.result(future)
+            if solution is not None and version == state.board.version and requested_tray == tray:
+                self._moves = list(solution.moves)
+
+        if self._place_timer < self.place_interval:
+            return
+
+        if not self._moves or not move_fits(state.board, tray, self._moves[0]):
+            self._moves = []
+            self._request = (state.board.version, tray, self.solver.solve_async(state.board, tray))
+            return
+
+        self._place_timer = 0.0
+        if not game_mode.input_handler.place_block(*self._moves.pop(0)):
+            self._moves = []
+
+    def close(self):
+        """
+        Shuts down the solver's worker processes.
+        """
+        self.solver.close()
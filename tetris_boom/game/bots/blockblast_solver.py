@@ -0,0 +1,411 @@
+"""
+Lookahead solver for BlockBlast mode.
+
+Searches the orders in which the tray pieces can be placed and the positions
+for each of them, applying row/column clears and bomb explosions with the real
+game rules (rules.place_block on a copy of the board). Board states reached
+along different paths are looked up in a TranspositionTable keyed on the board's
+Zobrist hash, the search can be spread over a process pool, and it always returns
+within its time budget with the best sequence found so far. solve_async() runs the
+search in a worker process so the game keeps rendering meanwhile. This module does
+not import pygame.
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor, BrokenExecutor, CancelledError, wait
+
+from game.board import Board
+from game.rules import place_block, points_for_lines
+from game.shape_table import SHAPE_TABLE
+from game.transposition_table import TranspositionTable, TRANSPOSITION_TABLE_SIZE
+
+SOLVER_TIME_BUDGET = 0.25   # Seconds a solve() call may take
+SOLVER_BEAM_WIDTH = 8       # Placements expanded per search node, best first
+DEAD_END_PENALTY = -1000.0  # Value of every tray piece that could not be placed
+
+OBJECTIVES = {
+    # Points first, a tidy board second
+    "score": {"points": 10.0, "empty_cells": 0.1, "transitions": -0.3, "isolated_cells": -1.0},
+    # Keep the board open and unfragmented, points only break ties
+    "survival": {"points": 1.0, "empty_cells": 0.3, "transitions": -1.0, "isolated_cells": -4.0}
+}
+
+
+class Solution:
+    """
+    Best placement sequence found for a tray.
+
+    :ivar moves: List of (index, x, y). index is the piece's position in the tray at the time
+                 of the move, with earlier moves' pieces already removed (new pieces are
+                 appended at the end, so they never shift it)
+    :ivar points: Points scored by the whole sequence
+    :ivar value: Heuristic value of the sequence, higher is better
+    :ivar complete: Whether every tray piece gets placed
+    :ivar nodes: Number of search nodes expanded
+    :ivar timed_out: Whether the time budget cut the search short
+    """
+    __slots__ = ("moves", "points", "value", "complete", "nodes", "timed_out")
+
+    def __init__(self, moves, points, value, complete, nodes, timed_out):
+        self.moves = moves
+        self.points = points
+        self.value = value
+        self.complete = complete
+        self.nodes = nodes
+        self.timed_out = timed_out
+
+    def __repr__(self):
+        return (f"Solution(moves={self.moves}, points={self.points}, value={self.value:.2f}, "
+                f"complete={self.complete}, nodes={self.nodes}, timed_out={self.timed_out})")
+
+
+def legal_positions(board, block):
+    """
+    Returns every (x, y) where the block fits with all of its cells on the board.
+    """
+    info = SHAPE_TABLE[block.shape][block.rotation]
+    fits = board.fits
+    return [
+        (x, y)
+        for y in range(-info.min_y, board.rows - info.max_y)
+        for x in range(-info.min_x, board.cols - info.max_x)
+        if fits(block.shape, block.rotation, x, y)
+    ]
+
+
+def move_fits(board, tray, move) -> bool:
+    """
+    Whether a planned (index, x, y) move is still legal for the current tray, e.g. after the
+    board changed since the move was planned.
+
+    :param tray: The tray the index refers to, usually state.next_blocks[:NEXT_BLOCKS_COUNT]
+    """
+    index, x, y = move
+    if not 0 <= index < len(tray):
+        return False
+    block = tray[index]
+    return board.fits(block.shape, block.rotation, x, y)
+
+
+def _search_board(rows, cols, grid):
+    """
+    Builds the bitboard copy of a grid that the search works on.
+    """
+    board = Board(rows, cols, backend="bitboard")
+    board.grid = [list(row) for row in grid]
+    return board
+
+
+class _Search:
+    """
+    One depth-first search over a tray. Not shared between threads or processes.
+
+    Results are stored in the table under (board hash, kinds of the pieces left), with
+    moves as (kind, x, y), so they stay valid for any tray holding the same pieces.
+    """
+
+    def __init__(self, blocks, weights, beam_width, deadline, clock, table):
+        self.blocks = blocks
+        self.kinds = [(block.shape, block.rotation, block.is_bomb) for block in blocks]
+        self.weights = weights
+        self.beam_width = beam_width
+        self.deadline = deadline
+        self.clock = clock
+        self.table = table
+        self.nodes = 0
+        self.timed_out = False
+
+    def evaluate(self, board) -> float:
+        """
+        Scores how playable a board is: empty cells, filled/empty transitions along rows
+        and columns (walls count as filled) and empty cells boxed in on all four sides.
+        """
+        masks = board.backend.row_masks
+        cols = board.cols
+        full = board.backend.full_mask
+        weights = self.weights
+
+        filled = 0
+        transitions = 0
+        isolated = 0
+        above = full
+        for y, mask in enumerate(masks):
+            filled += mask.bit_count()
+            walled = (mask << 1) | 1 | (1 << (cols + 1))
+            transitions += (walled ^ (walled >> 1)).bit_count() - 1
+            transitions += (mask ^ above).bit_count()
+            below = masks[y + 1] if y + 1 < len(masks) else full
+            empty = ~mask & full
+            left = ((mask << 1) | 1) & full
+            right = (mask >> 1) | (1 << (cols - 1))
+            isolated += (empty & left & right & above & below).bit_count()
+            above = mask
+        transitions += (above ^ full).bit_count()
+
+        return (
+            weights["empty_cells"] * (board.rows * cols - filled)
+            + weights["transitions"] * transitions
+            + weights["isolated_cells"] * isolated
+        )
+
+    def candidates(self, board, remaining):
+        """
+        Returns (order_score, index, x, y) for every placement of every distinct remaining piece,
+        best first. The order score only steers the beam, it is cheap to compute and does not
+        copy the board: lines the placement completes, then how low it sits.
+        """
+        masks = board.backend.row_masks
+        full = board.backend.full_mask
+        col_counts = board.col_counts
+        seen = set()
+        found = []
+        for index in remaining:
+            block = self.blocks[index]
+            kind = self.kinds[index]
+            if kind in seen:
+                continue
+            seen.add(kind)
+            info = SHAPE_TABLE[block.shape][block.rotation]
+            for x, y in legal_positions(board, block):
+                lines = 0
+                if not block.is_bomb:
+                    for dy, mask in info.row_masks:
+                        if masks[y + dy] | (mask << x if x >= 0 else mask >> -x) == full:
+                            lines += 1
+                    column_cells = {}
+                    for dx, _ in info.cells:
+                        column_cells[dx] = column_cells.get(dx, 0) + 1
+                    for dx, count in column_cells.items():
+                        if col_counts[x + dx] + count == board.rows:
+                            lines += 1
+                found.append((lines + 0.01 * (y + info.max_y), index, x, y))
+        found.sort(key=lambda candidate: candidate[0], reverse=True)
+        return found
+
+    def search(self, board, remaining):
+        """
+        Returns (value, points, moves) of the best continuation from this board with the
+        given tray indices left, moves being (kind, x, y).
+        """
+        pieces = tuple(sorted(self.kinds[index] for index in remaining))
+        cached = self.table.get(board.zobrist_hash, pieces)
+        if cached is not None:
+            return cached
+
+        if not remaining:
+            result = (self.evaluate(board), 0, ())
+            self.table.put(board.zobrist_hash, pieces, result)
+            return result
+
+        if self.clock() > self.deadline:
+            self.timed_out = True
+            return (self.evaluate(board), 0, ())
+
+        self.nodes += 1
+        best = None
+        for _, index, x, y in self.candidates(board, remaining)[:self.beam_width]:
+            child = board.copy()
+            piece = self.blocks[index].copy()
+            piece.x = x
+            piece.y = y
+            lines_cleared, _ = place_block(child, piece)
+            points = points_for_lines(lines_cleared)
+            rest = tuple(i for i in remaining if i != index)
+            value, rest_points, rest_moves = self.search(child, rest)
+            value += self.weights["points"] * points
+            if best is None or value > best[0]:
+                best = (value, points + rest_points, ((self.kinds[index], x, y),) + rest_moves)
+
+        if best is None:
+            best = (self.evaluate(board) + DEAD_END_PENALTY * len(remaining), 0, ())
+        if not self.timed_out:
+            self.table.put(board.zobrist_hash, pieces, best)
+        return best
+
+
+def _solve_branch(rows, cols, grid, blocks, remaining, first_move, weights, beam_width, time_left, table_size):
+    """
+    Process pool task: plays first_move and searches the rest of the tray with its own table.
+    Returns (value, points, moves, nodes, timed_out).
+    """
+    board = _search_board(rows, cols, grid)
+    search = _Search(blocks, weights, beam_width, time.perf_counter() + time_left, time.perf_counter,
+                     TranspositionTable(table_size))
+    index, x, y = first_move
+    piece = blocks[index].copy()
+    piece.x = x
+    piece.y = y
+    lines_cleared, _ = place_block(board, piece)
+    points = points_for_lines(lines_cleared)
+    rest = tuple(i for i in remaining if i != index)
+    value, rest_points, rest_moves = search.search(board, rest)
+    value += weights["points"] * points
+    first = (search.kinds[index], x, y)
+    return value, points + rest_points, (first,) + rest_moves, search.nodes + 1, search.timed_out
+
+
+# Solvers living in pool worker processes, one per (time_budget, objective, beam_width, table_size),
+# so their transposition tables survive from one solve_async() call to the next
+_worker_solvers = {}
+
+
+def _solve_in_worker(settings, rows, cols, grid, blocks):
+    """
+    Process pool task behind solve_async(): solves a snapshot of the board and tray.
+    """
+    solver = _worker_solvers.get(settings)
+    if solver is None:
+        time_budget, objective, beam_width, table_size = settings
+        solver = BlockBlastSolver(time_budget, objective, beam_width, table_size=table_size)
+        _worker_solvers[settings] = solver
+    return solver.solve(_search_board(rows, cols, grid), blocks)
+
+
+class BlockBlastSolver:
+    def __init__(self, time_budget: float = SOLVER_TIME_BUDGET, objective: str = "score",
+                 beam_width: int = SOLVER_BEAM_WIDTH, workers: int = 1,
+                 table_size: int = TRANSPOSITION_TABLE_SIZE, clock=time.perf_counter):
+        """
+        :param time_budget: Seconds a solve() call may take before it returns the best sequence so far
+        :param objective: One of OBJECTIVES: "score" favors points, "survival" an open board
+        :param beam_width: Placements expanded per search node, best first
+        :param workers: Processes in the pool used by solve_async() and, if more than 1, by solve()
+                        to spread the first placement over; with 1, solve() searches in this process
+        :param table_size: Entries in the transposition table, which is kept between solve() calls
+                           (each pool task uses a table of its own)
+        :param clock: Function returning the current time in seconds (default is time.perf_counter)
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective '{objective}' (available: {', '.join(sorted(OBJECTIVES))})")
+        if time_budget <= 0:
+            raise ValueError("time_budget must be positive")
+        if beam_width < 1:
+            raise ValueError("beam_width must be at least 1")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.time_budget = time_budget
+        self.objective = objective
+        self.weights = OBJECTIVES[objective]
+        self.beam_width = beam_width
+        self.workers = workers
+        self.clock = clock
+        self.table = TranspositionTable(table_size)
+        self._executor = None
+
+    def solve(self, board, blocks) -> Solution:
+        """
+        Finds the best order and positions for placing the tray pieces.
+
+        :param board: The current Board (it is not modified)
+        :param blocks: The tray, usually state.next_blocks[:NEXT_BLOCKS_COUNT]
+        :return: A Solution; its moves are empty if no piece fits anywhere
+        """
+        blocks = [block.copy() for block in blocks]
+        root = _search_board(board.rows, board.cols, board.grid)
+        remaining = tuple(range(len(blocks)))
+        deadline = self.clock() + self.time_budget
+
+        if self.workers > 1:
+            value, points, moves, nodes, timed_out = self._solve_parallel(root, blocks, remaining, deadline)
+        else:
+            search = _Search(blocks, self.weights, self.beam_width, deadline, self.clock, self.table)
+            value, points, moves = search.search(root, remaining)
+            nodes, timed_out = search.nodes, search.timed_out
+
+        return Solution(
+            moves=self._to_tray_indices(moves, blocks),
+            points=points,
+            value=value,
+            complete=len(moves) == len(blocks),
+            nodes=nodes,
+            timed_out=timed_out
+        )
+
+    def solve_async(self, board, blocks):
+        """
+        Like solve(), but searches in a pool worker process and returns at once, so it can be
+        called from the game loop without holding up frames. The board and tray are snapshotted
+        now; later changes to them do not affect the result.
+
+        :return: A concurrent.futures.Future; read it with result()
+        """
+        settings = (self.time_budget, self.objective, self.beam_width, self.table.max_entries)
+        grid = [list(row) for row in board.grid]
+        blocks = [block.copy() for block in blocks]
+        try:
+            return self._get_executor().submit(_solve_in_worker, settings, board.rows, board.cols, grid, blocks)
+        except BrokenExecutor:
+            # A worker died since the last request; start over with a fresh pool
+            self.close()
+            return self._get_executor().submit(_solve_in_worker, settings, board.rows, board.cols, grid, blocks)
+
+    def result(self, future):
+        """
+        Returns the Solution of a finished solve_async() future, or None if the worker died,
+        the pool could not start or the request was cancelled. A broken pool is shut down,
+        so the next solve_async() starts a fresh one.
+        """
+        try:
+            return future.result()
+        except CancelledError:
+            return None
+        except BrokenExecutor:
+            self.close()
+            return None
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _solve_parallel(self, root, blocks, remaining, deadline):
+        """
+        Searches each of the best first placements in its own pool task. Tasks that miss
+        the deadline are dropped; if none finishes, the best first placement is returned alone.
+        """
+        search = _Search(blocks, self.weights, self.beam_width, deadline, self.clock, self.table)
+        first_moves = [(index, x, y) for _, index, x, y in search.candidates(root, remaining)[:self.beam_width]]
+        if not first_moves:
+            return search.evaluate(root) + DEAD_END_PENALTY * len(remaining), 0, (), 1, False
+
+        executor = self._get_executor()
+        grid = [list(row) for row in root.grid]
+        time_left = max(0.0, deadline - self.clock())
+        futures = [
+            executor.submit(_solve_branch, root.rows, root.cols, grid, blocks, remaining,
+                                  move, self.weights, self.beam_width, time_left, self.table.max_entries)
+            for move in first_moves
+        ]
+        done, not_done = wait(futures, timeout=max(0.0, deadline - self.clock()))
+        for future in not_done:
+            future.cancel()
+
+        results = [future.result() for future in done]
+        if not results:
+            index, x, y = first_moves[0]
+            return 0.0, 0, ((search.kinds[index], x, y),), 1, True
+        value, points, moves, _, _ = max(results, key=lambda result: result[0])
+        nodes = 1 + sum(result[3] for result in results)
+        timed_out = bool(not_done) or any(result[4] for result in results)
+        return value, points, moves, nodes, timed_out
+
+    @staticmethod
+    def _to_tray_indices(moves, blocks):
+        """
+        Converts (kind, x, y) moves to (index, x, y), index being the position of a piece of
+        that kind in the tray at the time of the move.
+        """
+        left = [(block.shape, block.rotation, block.is_bomb) for block in blocks]
+        converted = []
+        for kind, x, y in moves:
+            index = left.index(kind)
+            converted.append((index, x, y))
+            left.pop(index)
+        return converted
+
+    def close(self):
+        """
+        Shuts down the process pool, if one was started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
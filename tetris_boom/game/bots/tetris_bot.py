@@ -0,0 +1,144 @@
+"""
+Placement-search bot for Tetris mode.
+
+For each piece the bot enumerates every rotation and column the piece can reach
+from where it is, drops it on a copy of the board with the real game rules and
+scores the result with a weighted heuristic. Moves are expressed as headless
+engine actions, so the same bot plays HeadlessEngine directly and the pygame
+game through TetrisBotDriver. This module does not import pygame.
+"""
+from collections import deque
+
+from game.rules import place_block
+from game.shape_table import SHAPE_TABLE
+from game.simulation.headless_engine import MOVE_LEFT, MOVE_RIGHT, ROTATE, HARD_DROP
+
+# Heuristic weights, tuned for a 10 wide board (see Yiyuan Lee, "Tetris AI")
+DEFAULT_WEIGHTS = {
+    "aggregate_height": -0.510066,
+    "lines_cleared": 0.760666,
+    "holes": -0.35663,
+    "bumpiness": -0.184483,
+    "overflow": -10.0
+}
+
+
+class Placement:
+    """
+    Where the bot wants the current piece to land, and how good that is.
+
+    :ivar rotation: Target rotation of the piece
+    :ivar x: Target column of the piece's 4x4 box
+    :ivar y: Row the piece lands on when hard dropped from there
+    :ivar score: Heuristic score of the board after the drop, higher is better
+    :ivar lines_cleared: Lines cleared by the drop
+    :ivar moves: Actions that bring the piece from its position to (rotation, x), before the hard drop
+    """
+    __slots__ = ("rotation", "x", "y", "score", "lines_cleared", "moves")
+
+    def __init__(self, rotation: int, x: int, y: int, score: float, lines_cleared: int, moves: tuple):
+        self.rotation = rotation
+        self.x = x
+        self.y = y
+        self.score = score
+        self.lines_cleared = lines_cleared
+        self.moves = moves
+
+    def __repr__(self):
+        return f"Placement(rotation={self.rotation}, x={self.x}, y={self.y}, score={self.score:.3f})"
+
+
+class TetrisBot:
+    def __init__(self, weights: dict = None):
+        """
+        :param weights: Overrides for DEFAULT_WEIGHTS, keyed by feature name
+        """
+        unknown = set(weights or {}) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown heuristic features: {', '.join(sorted(unknown))}")
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+
+    def reachable_positions(self, board, block):
+        """
+        Returns every (rotation, x) the block can reach on its current row with the
+        player's moves (rotate clockwise, left, right), each mapped to the shortest
+        tuple of actions that gets there.
+        """
+        fits = board.fits
+        shape = block.shape
+        rotations = len(SHAPE_TABLE[shape])
+        y = block.y
+        start = (block.rotation, block.x)
+        paths = {start: ()}
+        if not fits(shape, block.rotation, block.x, y):
+            return paths
+
+        queue = deque([start])
+        while queue:
+            rotation, x = queue.popleft()
+            path = paths[(rotation, x)]
+            for action, state in (
+                (ROTATE, ((rotation + 1) % rotations, x)),
+                (MOVE_LEFT, (rotation, x - 1)),
+                (MOVE_RIGHT, (rotation, x + 1))
+            ):
+                if state not in paths and fits(shape, state[0], state[1], y):
+                    paths[state] = path + (action,)
+                    queue.append(state)
+        return paths
+
+    def evaluate(self, board, block, rotation: int, x: int, y: int):
+        """
+        Places a copy of the block at (rotation, x, y) on a copy of the board and scores the result.
+
+        :return: Tuple of (score, lines_cleared)
+        """
+        trial = board.copy()
+        piece = block.copy()
+        piece.rotation = rotation
+        piece.x = x
+        piece.y = y
+        overflow = sum(1 for _, dy in SHAPE_TABLE[piece.shape][rotation].cells if y + dy < 0)
+        lines_cleared, _ = place_block(trial, piece)
+
+        heights = trial.col_heights
+        counts = trial.col_counts
+        weights = self.weights
+        score = (
+            weights["aggregate_height"] * sum(heights)
+            + weights["lines_cleared"] * lines_cleared
+            + weights["holes"] * sum(height - count for height, count in zip(heights, counts))
+            + weights["bumpiness"] * sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+            + weights["overflow"] * overflow
+        )
+        return score, lines_cleared
+
+    def choose_placement(self, board, block):
+        """
+        Returns the best Placement for the block, or None if it has nowhere to go.
+        Ties keep the placement found first, which needs the fewest moves.
+        """
+        best = None
+        for (rotation, x), moves in self.reachable_positions(board, block).items():
+            probe = block.copy()
+            probe.rotation = rotation
+            probe.x = x
+            if not board.fits(probe.shape, rotation, x, probe.y):
+                continue
+            y = probe.y + board.drop_distance(probe)
+            score, lines_cleared = self.evaluate(board, block, rotation, x, y)
+            if best is None or score > best.score:
+                best = Placement(rotation, x, y, score, lines_cleared, moves)
+        return best
+
+    def next_action(self, board, block, placement: Placement):
+        """
+        Returns the next action that moves the block towards the placement from where it
+        is now, or HARD_DROP once it is there or can no longer get there.
+        Works out the path again on every call, so gravity moving the block in between
+        is taken into account.
+        """
+        path = self.reachable_positions(board, block).get((placement.rotation, placement.x))
+        if not path:
+            return HARD_DROP
+        return path[0]
@@ -0,0 +1,85 @@
+import pygame
+
+from game.bots.tetris_bot import TetrisBot
+from game.modes.tetris_mode import TetrisMode
+from game.simulation.headless_engine import MOVE_LEFT, MOVE_RIGHT, ROTATE, HARD_DROP
+
+BOT_MOVE_INTERVAL = 0.08    # Seconds between two bot key presses, slow enough to follow on screen
+BOT_RESTART_DELAY = 3.0     # Seconds the game over screen stays up before the bot restarts
+
+ACTION_KEYS = {
+    MOVE_LEFT: pygame.K_LEFT,
+    MOVE_RIGHT: pygame.K_RIGHT,
+    ROTATE: pygame.K_UP,
+    HARD_DROP: pygame.K_SPACE
+}
+
+
+class TetrisBotDriver:
+    def __init__(self, bot: TetrisBot = None, move_interval: float = BOT_MOVE_INTERVAL,
+                 restart_delay: float = BOT_RESTART_DELAY):
+        """
+        Plays the pygame game with a TetrisBot by posting the same key presses a player
+        would make, so every move goes through TetrisInputHandler like a real one.
+        Used for attract-mode demos and soak testing.
+
+        Call update() once per frame before the event queue is read. At most one key is
+        posted per call, so each move is handled before the next one is chosen.
+
+        :param bot: The bot choosing placements (default is TetrisBot())
+        :param move_interval: Seconds between key presses, 0 for one press per frame
+        :param restart_delay: Seconds to wait on the game over screen before pressing R,
+                              or None to never restart
+        """
+        self.bot = bot or TetrisBot()
+        self.move_interval = move_interval
+        self.restart_delay = restart_delay
+        self.reset()
+
+    def reset(self):
+        self._block = None
+        self._placement = None
+        self._move_timer = 0.0
+        self._game_over_timer = 0.0
+
+    def update(self, game_mode, dt: float):
+        """
+        Advances the driver by dt seconds and posts the next key press if one is due.
+        Does nothing outside Tetris mode.
+
+        :param game_mode: The active game mode
+        :param dt: Seconds since the last call
+        """
+        if game_mode.game_over:
+            self._game_over_timer += dt
+            if self.restart_delay is not None and self._game_over_timer >= self.restart_delay:
+                self._post_key(pygame.K_r)
+                self.reset()
+            return
+        self._game_over_timer = 0.0
+
+        if not isinstance(game_mode, TetrisMode):
+            return
+
+        self._move_timer += dt
+        if self._move_timer < self.move_interval:
+            return
+        self._move_timer = 0.0
+
+        action = self.next_action(game_mode.state.board, game_mode.state.current_block)
+        self._post_key(ACTION_KEYS[action])
+
+    def next_action(self, board, block):
+        """
+        Returns the next action for the falling block, choosing its placement when a new
+        block has spawned.
+        """
+        if block is not self._block:
+            self._block = block
+            self._placement = self.bot.choose_placement(board, block)
+        if self._placement is None:
+            return HARD_DROP
+        return self.bot.next_action(board, block, self._placement)
+
+    def _post_key(self, key: int):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
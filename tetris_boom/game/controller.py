@@ -1,22 +1,26 @@
+import os
 import pygame
 import game.input_overlay as Overlay
 from game.modes.tetris_mode import TetrisMode
-from game.modes.blockblast_mode import BlockBlastMode
 from game.input_handlers.tetris_input_handler import TetrisInputHandler
-from game.input_handlers.blockblast_input_handler import BlockBlastInputHandler
 from game.renderers.tetris_renderer import TetrisRenderer
-from game.renderers.blockblast_renderer import BlockBlastRenderer
 from game.gamestate import GameState
 from game.board import Board
 from game.block_factory import BlockFactory
-from game.sound_manager import SoundManager
+from game.sound_manager import SoundManager, audio_disabled_by_env
 from game.score_manager import ScoreManager
-from game.data import NEXT_BLOCKS_COUNT
+from game.data import (NEXT_BLOCKS_COUNT, SCORE_CHECKPOINT_INTERVAL, UPDATE_STEP, MAX_FRAME_TIME,
+                       DEFAULT_RENDER_FPS, MAX_RENDER_FPS)
+from game.rules import next_checkpoint
+from game.frame_profiler import FrameProfiler
+from game.renderers.profiler_overlay import ProfilerOverlay
+from game.startup_timer import startup_timer
 
 SCREEN_WIDTH = 500
 SCREEN_HEIGHT = 500
-FPS = 30
-SCORE_CHECKPOINT_INTERVAL = 5
+PROFILER_TOGGLE_KEY = pygame.K_F3
+FRAME_PROFILE_ENV = "TETRIS_BOOM_FRAME_PROFILE"
+BOT_PLAYER_NAME = "Bot"
 
 
 class GameController:
@@ -27,23 +31,59 @@ class GameController:
     game state, and managing transitions between Tetris and BlockBlast modes.
     """
 
-    def __init__(self):
+    def __init__(self, audio_enabled: bool = None, bot: bool = False):
+        """
+        :param audio_enabled: Whether to play sound. None (default) enables audio unless
+                              the TETRIS_BOOM_NO_AUDIO environment variable is set.
+        :param bot: Let the built-in bot play (attract mode). The name prompt is skipped
+                    and the bot's scores are not written to the leaderboard.
+        """
+        if audio_enabled is None:
+            audio_enabled = not audio_disabled_by_env()
+        self.audio_enabled = audio_enabled
+        self.bot_drivers = []
+        if bot:
+            from game.bots.tetris_bot_driver import TetrisBotDriver
+            from game.bots.blockblast_bot_driver import BlockBlastBotDriver
+            self.bot_drivers = [TetrisBotDriver(), BlockBlastBotDriver()]
         self._initialize_pygame()
         self._initialize_core_components()
         self._initialize_starting_mode()
         self._initialize_player()
 
     def _initialize_pygame(self):
-        """Initialize pygame and display settings."""
+        """Initialize pygame and display settings. Without audio, the mixer is never opened."""
+        if not self.audio_enabled:
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         pygame.init()
+        if not self.audio_enabled:
+            pygame.mixer.quit()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
         pygame.display.set_caption("Tetris BOOM!")
+        startup_timer.mark("pygame_init")
+        self.render_fps = self._detect_render_fps()
+        self.profiler = FrameProfiler(target_fps=self.render_fps)
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+
+    def _detect_render_fps(self):
+        """
+        Returns the frame rate to render at: the display's refresh rate when pygame
+        can report it, otherwise DEFAULT_RENDER_FPS, capped at MAX_RENDER_FPS.
+        """
+        get_refresh_rates = getattr(pygame.display, "get_desktop_refresh_rates", None)
+        rates = get_refresh_rates() if get_refresh_rates else []
+        refresh_rate = max(rates) if rates and max(rates) > 0 else DEFAULT_RENDER_FPS
+        return min(refresh_rate, MAX_RENDER_FPS)
 
     def _initialize_core_components(self):
         """Initialize all core game components."""
-        self.sound_manager = SoundManager()
-        self.score_manager = ScoreManager(sound_manager=self.sound_manager)
+        self.sound_manager = SoundManager(enabled=self.audio_enabled)
+        startup_timer.mark("sound_load")
+        self.score_manager = ScoreManager(
+            sound_manager=self.sound_manager,
+            record_scores=not self.bot_drivers
+        )
         self.board = Board()
         self.block_factory = BlockFactory()
 
@@ -60,48 +100,78 @@ class GameController:
 
         self.last_score_checkpoint = 0
         self.player_name ="" 
+        self._modes = {}
 
         self.dark_mode= False
 
     def _initialize_starting_mode(self):
         """Initialize the starting game mode using a factory method."""
         self.game_mode = self._create_mode(TetrisMode)
+        # Building the renderer is what loads the fonts
+        startup_timer.mark("font_load")
         pygame.mouse.set_visible(self.game_mode.should_show_cursor())
         self.sound_manager.play("music_1")
         self.dark_mode = False
 
     def _create_mode(self, mode_class):
         """Factory method to create any game mode with proper dependencies."""
-        mode_config = {
-            TetrisMode: (TetrisRenderer, TetrisInputHandler),
-            BlockBlastMode: (BlockBlastRenderer, BlockBlastInputHandler)
-        }
-        
-        renderer_class, input_handler_class = mode_config[mode_class]
-        
-        mode = mode_class(
-            screen=self.screen,
-            state=self.state,
-            renderer=None
-        )
-        
-        renderer = renderer_class(
-            screen=self.screen,
-            game_mode=mode
-        )
-        mode.renderer = renderer
-        
-        input_handler = input_handler_class(mode)
-        mode.input_handler = input_handler
-        
+        if mode_class is TetrisMode:
+            renderer_class, input_handler_class = TetrisRenderer, TetrisInputHandler
+        else:
+            _, input_handler_class, renderer_class = self._load_blockblast_classes()
+        return self._get_mode(mode_class, input_handler_class, renderer_class, self.dark_mode)
+
+    def _load_blockblast_classes(self):
+        """
+        Returns the BlockBlast mode, input handler and renderer classes. They are imported on
+        first use rather than at startup, since BlockBlast is only reached after the first
+        score checkpoint.
+        """
+        from game.modes.blockblast_mode import BlockBlastMode
+        from game.input_handlers.blockblast_input_handler import BlockBlastInputHandler
+        from game.renderers.blockblast_renderer import BlockBlastRenderer
+        return BlockBlastMode, BlockBlastInputHandler, BlockBlastRenderer
+
+    def _get_mode(self, mode_class, input_handler_class, renderer_class, dark_mode):
+        """
+        Returns the mode instance for the given classes, building it with its renderer and
+        input handler the first time. Later calls reuse the same objects, so switching modes
+        does not reload fonts or rebuild render caches.
+        """
+        key = (mode_class, input_handler_class, renderer_class)
+        mode = self._modes.get(key)
+        if mode is None:
+            mode = mode_class(
+                screen=self.screen,
+                state=self.state,
+                renderer=None,
+                dark_mode=dark_mode
+            )
+
+            renderer = renderer_class(
+                screen=self.screen,
+                game_mode=mode,
+                dark_mode=dark_mode
+            )
+            mode.renderer = renderer
+
+            input_handler = input_handler_class(mode)
+            mode.input_handler = input_handler
+
+            self._modes[key] = mode
         return mode
 
     def _initialize_player(self):
         """Initialize player-specific settings."""
-        self.player_name = Overlay.get_player_name(
-            screen=self.screen,
-            renderer=self.game_mode.renderer
-        )
+        if self.bot_drivers:
+            from game.globals import set_player_name
+            set_player_name(BOT_PLAYER_NAME)
+            self.player_name = BOT_PLAYER_NAME
+        else:
+            self.player_name = Overlay.get_player_name(
+                screen=self.screen,
+                renderer=self.game_mode.renderer
+            )
         from game.globals import get_player_name
         self.state.score_manager.set_player_name(get_player_name())
 
@@ -141,6 +211,7 @@ class GameController:
     def switch_mode(self, new_mode_class, input_handler_class, renderer_class, dark_mode):
         """
         Switch to a new game mode with specified components.
+        Each mode is built once and reused; switching only runs its activate() hook.
         :param new_mode_class: The class of the mode to switch to (TetrisMode or BlockBlastMode)
         :param input_handler_class: The input handler class for the new mode
         :param renderer_class: The renderer class for the new mode
@@ -149,23 +220,8 @@ class GameController:
         if self.state.current_block is None:
             self.state.current_block = self.state.block_factory.create_block()
 
-        mode = new_mode_class(
-            screen=self.screen,
-            state=self.state,
-            renderer=None,
-            dark_mode=dark_mode
-        )
-
-        renderer = renderer_class(
-            screen=self.screen,
-            game_mode = mode,
-            dark_mode=dark_mode
-        )
-
-        mode.renderer = renderer
-
-        input_handler = input_handler_class(mode)
-        mode.input_handler = input_handler
+        mode = self._get_mode(new_mode_class, input_handler_class, renderer_class, dark_mode)
+        mode.activate(dark_mode)
 
         self.game_mode = mode
         
@@ -176,14 +232,27 @@ class GameController:
         self.state.score_manager.set_player_name(get_player_name())
 
     def run_game_loop(self):
-        """Main game loop handling input, updates, and rendering."""
+        """
+        Main game loop handling input, updates, and rendering.
+
+        Game logic advances in fixed UPDATE_STEP ticks fed by an accumulator of real elapsed
+        time, so gameplay speed stays the same whatever the frame rate. Rendering runs once
+        per loop at up to render_fps, interpolating between the last two logic ticks.
+        """
         is_running = True
 
         self.sound_manager.stop("music_1")
         self.sound_manager.play("music_1_loop", loop=True)
         self.sound_manager.play("game_start")
 
+        profiler = self.profiler
+        accumulator = 0.0
+        frame_time = 0.0
+        self.clock.tick()
         while is_running:
+            profiler.begin_frame()
+            for bot_driver in self.bot_drivers:
+                bot_driver.update(self.game_mode, frame_time)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     is_running = False
@@ -191,26 +260,78 @@ class GameController:
                     if event.key == pygame.K_t:
                         self.dark_mode = not self.dark_mode
                         self.game_mode.renderer.toggle_theme()
+                    elif event.key == PROFILER_TOGGLE_KEY:
+                        self.profiler_overlay.toggle()
+                        self.game_mode.renderer.invalidate()
                 
                 command = self.game_mode.handle_input(event)
                 if command == "quit":
                     is_running = False
                 elif command == "restart":
                     self.reset_game()
+            profiler.mark("events")
+
+            accumulator += min(frame_time, MAX_FRAME_TIME)
+            while accumulator >= UPDATE_STEP:
+                self.game_mode.update(UPDATE_STEP)
+                self._check_score_checkpoint()
+                accumulator -= UPDATE_STEP
+            profiler.mark("update")
 
-            self.game_mode.update()
+            renderer = self.game_mode.renderer
+            renderer.draw(accumulator / UPDATE_STEP)
+            overlay_rects = []
+            if self.profiler_overlay.visible:
+                overlay_rects.append(self.profiler_overlay.draw(self.screen))
+            profiler.mark("render")
 
-            current_score = self.state.score_manager.get_score()
-            if current_score // SCORE_CHECKPOINT_INTERVAL > self.last_score_checkpoint:
-                self.last_score_checkpoint = current_score // SCORE_CHECKPOINT_INTERVAL
-                dark_mode_active = self.dark_mode
-                if isinstance(self.game_mode, TetrisMode):
-                    self.switch_mode(BlockBlastMode, BlockBlastInputHandler, BlockBlastRenderer, dark_mode_active)
-                else:
-                    self.switch_mode(TetrisMode, TetrisInputHandler, TetrisRenderer, dark_mode_active)
+            renderer.present(overlay_rects)
+            startup_timer.mark("first_frame")
+            profiler.mark("flip")
 
-            self.game_mode.render()
-            self.clock.tick(FPS)
+            frame_time = self.clock.tick(self.render_fps) / 1000.0
+            profiler.mark("tick")
+            profiler.end_frame()
             
             
+        self._dump_frame_profile()
+        for bot_driver in self.bot_drivers:
+            close = getattr(bot_driver, "close", None)
+            if close is not None:
+                close()
+        for mode in self._modes.values():
+            mode.close()
+        self.score_manager.close()
+        self.sound_manager.close()
         pygame.quit()
+
+    def _check_score_checkpoint(self):
+        """
+        Switches between Tetris and BlockBlast whenever the score crosses a checkpoint.
+        """
+        current_score = self.state.score_manager.get_score()
+        checkpoint = next_checkpoint(current_score, self.last_score_checkpoint, SCORE_CHECKPOINT_INTERVAL)
+        if checkpoint is not None:
+            self.last_score_checkpoint = checkpoint
+            dark_mode_active = self.dark_mode
+            if isinstance(self.game_mode, TetrisMode):
+                self.switch_mode(*self._load_blockblast_classes(), dark_mode_active)
+            else:
+                self.switch_mode(TetrisMode, TetrisInputHandler, TetrisRenderer, dark_mode_active)
+
+    def _dump_frame_profile(self):
+        """
+        Writes the recorded frame timings as JSON lines, to the path in the
+        TETRIS_BOOM_FRAME_PROFILE environment variable or ~/.tetris_boom/frame_profile.jsonl.
+        """
+        path = os.environ.get(FRAME_PROFILE_ENV) or os.path.join(
+            os.path.expanduser("~"), ".tetris_boom", "frame_profile.jsonl"
+        )
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w") as f:
+                self.profiler.dump(f)
+        except OSError:
+            pass
@@ -17,6 +17,16 @@ NEXT_BLOCKS_COUNT = 3
 BOMB_FLASH_RATE_MS = 100
 BOMB_SPEED_MULTIPLIER = 5
 BOMB_CHANCE = 0.03
+DEFAULT_GRAVITY = 1.5
+SOFT_DROP_SPEED_MULTIPLIER = 5
+SCORE_CHECKPOINT_INTERVAL = 5
+LEADERBOARD_BACKEND = "json"
+DIRTY_RECT_RENDERING = True
+UPDATE_RATE = 30
+UPDATE_STEP = 1 / UPDATE_RATE
+MAX_FRAME_TIME = 0.25
+DEFAULT_RENDER_FPS = 60
+MAX_RENDER_FPS = 144
 
 BRIGHT_PURPLE = (200, 100, 255)
 BRIGHT_TEAL = (100, 255, 255)
@@ -0,0 +1,132 @@
+import json
+import time
+from collections import deque
+
+PHASES = ("events", "update", "render", "flip", "tick")
+FRAME_HISTORY = 600
+
+
+def percentile(values, percent: float) -> float:
+    """
+    Returns a percentile of an already sorted, non-empty list, using the nearest-rank method.
+
+    :param values: The values, sorted ascending
+    :param percent: The percentile to compute, between 0 and 100
+    """
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[min(len(values), int(rank)) - 1]
+
+
+class FrameProfiler:
+    def __init__(self, target_fps: int, capacity: int = FRAME_HISTORY, clock=time.perf_counter):
+        """
+        Records how long each phase of the game loop takes, for the last `capacity` frames.
+
+        Call begin_frame() at the top of the loop, mark(phase) right after each phase
+        finishes, and end_frame() once the frame is done. Times are kept in milliseconds.
+
+        :param target_fps: The frame rate the loop is capped at, used to detect dropped frames
+        :param capacity: Number of frames kept in the ring buffer (default is FRAME_HISTORY)
+        :param clock: Function returning the current time in seconds (default is time.perf_counter)
+        """
+        if target_fps <= 0:
+            raise ValueError("target_fps must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.frame_budget_ms = 1000.0 / target_fps
+        self.frames = deque(maxlen=capacity)
+        self.frame_count = 0
+        self._clock = clock
+        self._current = None
+        self._last_mark = None
+
+    def begin_frame(self):
+        """
+        Starts timing a new frame.
+        """
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._last_mark = self._clock()
+
+    def mark(self, phase: str):
+        """
+        Ends the given phase, attributing the time since the previous mark to it.
+
+        :param phase: One of PHASES
+        """
+        if phase not in PHASES:
+            raise ValueError(f"Unknown frame phase '{phase}' (available: {', '.join(PHASES)})")
+        if self._current is None:
+            return
+        now = self._clock()
+        self._current[phase] += (now - self._last_mark) * 1000.0
+        self._last_mark = now
+
+    def end_frame(self):
+        """
+        Finishes the current frame and stores it in the ring buffer.
+        """
+        if self._current is None:
+            return
+        frame = self._current
+        frame["total"] = sum(frame[phase] for phase in PHASES)
+        frame["frame"] = self.frame_count
+        self.frames.append(frame)
+        self.frame_count += 1
+        self._current = None
+
+    def frame_times(self):
+        """
+        Returns the total time of each buffered frame, oldest first.
+        """
+        return [frame["total"] for frame in self.frames]
+
+    def is_dropped(self, frame) -> bool:
+        """
+        A frame is dropped when its work, everything except waiting in clock.tick,
+        did not fit in the frame budget.
+        """
+        return frame["total"] - frame["tick"] > self.frame_budget_ms
+
+    def dropped_frames(self) -> int:
+        """
+        Returns the number of buffered frames that were dropped.
+        """
+        return sum(1 for frame in self.frames if self.is_dropped(frame))
+
+    def percentile(self, percent: float, phase: str = "total") -> float:
+        """
+        Returns a percentile of the buffered frame times, using the nearest-rank method.
+
+        :param percent: The percentile to compute, between 0 and 100
+        :param phase: One of PHASES, or "total" for whole frames (default)
+        :return: The time in milliseconds, or 0.0 if no frames were recorded
+        """
+        if not self.frames:
+            return 0.0
+        return percentile(sorted(frame[phase] for frame in self.frames), percent)
+
+    def summary(self):
+        """
+        Returns p50/p95/p99 for whole frames and each phase, plus the dropped frame count.
+        """
+        summary = {"frames": len(self.frames), "dropped": self.dropped_frames()}
+        for phase in PHASES + ("total",):
+            summary[phase] = {
+                "p50": self.percentile(50, phase),
+                "p95": self.percentile(95, phase),
+                "p99": self.percentile(99, phase)
+            }
+        return summary
+
+    def dump(self, stream):
+        """
+        Writes the buffered frames to a stream as JSON lines, one frame per line.
+
+        :param stream: A writable text stream
+        """
+        for frame in self.frames:
+            record = {"frame": frame["frame"]}
+            record.update((phase, round(frame[phase], 3)) for phase in PHASES)
+            record["total"] = round(frame["total"], 3)
+            record["dropped"] = self.is_dropped(frame)
+            stream.write(json.dumps(record) + "\n")
@@ -20,6 +20,18 @@ class BaseInputHandler(ABC):
         """
         pass
 
+    def reset(self):
+        """
+        Clears any in-progress input, called when the handler's mode is switched to.
+        """
+        pass
+
+    def close(self):
+        """
+        Releases anything the handler holds on to, called once when the game exits.
+        """
+        pass
+
     def freeze_block(self, block):
         """
         Freeze the block on the board and update score.
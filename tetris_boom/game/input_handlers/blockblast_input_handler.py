@@ -1,16 +1,26 @@
 import pygame
-from game.data import BLOCK_SIZE
+from game.data import BLOCK_SIZE, NEXT_BLOCKS_COUNT
 from game.input_handlers.base_input_handler import BaseInputHandler
 from game.modes.base_mode import GameMode
+from game.rules import place_block
+
+HINT_KEY = pygame.K_h
+HINT_TIME_BUDGET = 0.1  # Seconds the solver may think, in a worker process, when the player asks for a hint
 
 class BlockBlastInputHandler(BaseInputHandler):
     def __init__(self, blockblast_mode: GameMode):
         super().__init__(blockblast_mode)
         self.blockblast_mode = blockblast_mode
+        self.solver = None
+        self.reset()
+
+    def reset(self):
         self.dragging_block = None
         self.drag_offset = (0, 0)
         self.original_pos = (0, 0)
         self.preview_pos = None
+        self.hint = None
+        self._hint_request = None
 
     def handle(self, event):
         renderer = self.blockblast_mode.renderer
@@ -23,7 +33,10 @@ class BlockBlastInputHandler(BaseInputHandler):
                     return "restart"
             return  # Ignore all other input when game over
         
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        if event.type == pygame.KEYDOWN and event.key == HINT_KEY:
+            self.show_hint()
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             self._start_drag(event, renderer)
 
         elif event.type == pygame.MOUSEMOTION:
@@ -36,18 +49,13 @@ class BlockBlastInputHandler(BaseInputHandler):
         for idx, block in enumerate(self.state.next_blocks[:3]):
             start_x = renderer.offset_x + self.board.cols * BLOCK_SIZE + 50
             start_y = renderer.offset_y + idx * 100
-            cells = [(k // 4, k % 4) for k in block.get_shape()]
-
-            min_i = min(i for i, j in cells)
-            min_j = min(j for i, j in cells)
-            max_i = max(i for i, j in cells)
-            max_j = max(j for i, j in cells)
+            info = block.get_shape_info()
 
             rect = pygame.Rect(
-                start_x + min_j * BLOCK_SIZE,
-                start_y + min_i * BLOCK_SIZE,
-                (max_j - min_j + 1) * BLOCK_SIZE,
-                (max_i - min_i + 1) * BLOCK_SIZE
+                start_x + info.min_x * BLOCK_SIZE,
+                start_y + info.min_y * BLOCK_SIZE,
+                info.width * BLOCK_SIZE,
+                info.height * BLOCK_SIZE
             )
 
             if rect.collidepoint(event.pos):
@@ -66,36 +74,94 @@ class BlockBlastInputHandler(BaseInputHandler):
         self.dragging_block.screen_x = event.pos[0] + self.drag_offset[0]
         self.dragging_block.screen_y = event.pos[1] + self.drag_offset[1]
 
-        grid_x = (self.dragging_block.screen_x - renderer.offset_x) // BLOCK_SIZE
-        grid_y = (self.dragging_block.screen_y - renderer.offset_y) // BLOCK_SIZE
-
-        preview_block = self.dragging_block.copy()
-        preview_block.x = grid_x
-        preview_block.y = grid_y
+        block = self.dragging_block
+        grid_x = (block.screen_x - renderer.offset_x) // BLOCK_SIZE
+        grid_y = (block.screen_y - renderer.offset_y) // BLOCK_SIZE
 
-        self.preview_pos = (grid_x, grid_y) if self.is_valid(preview_block) else None
+        fits = self.board.fits(block.shape, block.rotation, grid_x, grid_y)
+        self.preview_pos = (grid_x, grid_y) if fits else None
 
     def _drop(self, renderer):
         if not self.dragging_block:
             return
 
         grid_x, grid_y = renderer.compute_snapped_preview(self.dragging_block)
-        self.dragging_block.x = grid_x
-        self.dragging_block.y = grid_y
-
-        if self.is_valid(self.dragging_block):
-            block = self.dragging_block
-            if block.is_bomb:
-                self.board.explode_bomb(block)
-                self.sound_manager.play("bomb")
-                lines_cleared = self.board.break_lines()
-                self.state.score_manager.add_points(lines_cleared)
-            else:
-                self.freeze_block(self.dragging_block)
-            
-            self.state.next_blocks.remove(self.dragging_block)
-            self.state.next_blocks.append(self.state.block_factory.create_block())
-        else:
-            self.dragging_block.x, self.dragging_block.y = self.original_pos
-
+        index = next(
+            i for i, block in enumerate(self.state.next_blocks) if block is self.dragging_block
+        )
+        self.place_block(index, grid_x, grid_y)
         self.dragging_block = None
+
+    def place_block(self, index: int, x: int, y: int) -> bool:
+        """
+        Places tray piece `index` with its (0, 0) cell at board cell (x, y), like a drop there,
+        and refills the tray. Dropping with the mouse ends here, and so does the bot.
+
+        :return: Whether the piece fitted; if not, nothing changes
+        """
+        if not 0 <= index < min(NEXT_BLOCKS_COUNT, len(self.state.next_blocks)):
+            return False
+        block = self.state.next_blocks[index]
+        original_pos = (block.x, block.y)
+        block.x = x
+        block.y = y
+
+        if not self.is_valid(block):
+            block.x, block.y = original_pos
+            return False
+
+        lines_cleared, _ = place_block(self.board, block)
+        if block.is_bomb:
+            self.sound_manager.play("bomb")
+        self.state.score_manager.add_points(lines_cleared)
+
+        self.state.next_blocks.pop(index)
+        self.state.next_blocks.append(self.state.block_factory.create_block())
+        self.hint = None
+        self._hint_request = None
+        return True
+
+    def show_hint(self):
+        """
+        Asks the solver, in a worker process, for the best way to place the tray.
+        update_hint() picks up the answer, so the game keeps rendering while it thinks.
+        """
+        if self.solver is None:
+            from game.bots.blockblast_solver import BlockBlastSolver
+            self.solver = BlockBlastSolver(time_budget=HINT_TIME_BUDGET)
+        tray = self.state.next_blocks[:NEXT_BLOCKS_COUNT]
+        self._hint_request = (self.board.version, tray, self.solver.solve_async(self.board, tray))
+
+    def update_hint(self, wait: bool = False):
+        """
+        Once the requested solve has finished, stores its first move as self.hint, a
+        (block, x, y) tuple the renderer outlines on the board. hint stays None if no piece
+        fits anywhere, and the answer is dropped if the board or tray changed meanwhile
+        or the solver's worker failed.
+
+        :param wait: Block until the solver answers instead of checking once
+        """
+        if self._hint_request is None:
+            return
+        version, tray, future = self._hint_request
+        if not wait and not future.done():
+            return
+        self._hint_request = None
+        solution = self.solver.result(future)
+        if solution is None:
+            return
+        if version != self.board.version or tray != self.state.next_blocks[:NEXT_BLOCKS_COUNT]:
+            return
+        if not solution.moves:
+            self.hint = None
+            return
+        index, x, y = solution.moves[0]
+        self.hint = (tray[index], x, y)
+
+    def close(self):
+        """
+        Shuts down the hint solver's worker processes, if a hint was ever asked for.
+        """
+        self._hint_request = None
+        if self.solver is not None:
+            self.solver.close()
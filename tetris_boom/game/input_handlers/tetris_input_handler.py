@@ -41,10 +41,8 @@ class TetrisInputHandler(BaseInputHandler):
                     self.sound_manager.play("rotate_block")
 
             elif event.key == pygame.K_SPACE:
-                while self.is_valid(block):
-                    block.move(0, 1)
-                block.move(0, -1)
-                
+                block.move(0, self.board.drop_distance(block))
+
                 if block.is_bomb:
                     self.tetris_mode._lock_block()
                 else:
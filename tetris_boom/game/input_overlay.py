@@ -1,14 +1,16 @@
 import pygame
 from game.data import GRAY
 from game.globals import set_player_name
+from game.renderers.font_cache import get_font
+from game.startup_timer import startup_timer
 
 def get_player_name(screen, renderer):
     """
     Displays an input overlay for entering the player's name,
     while showing the game board in the background.
     """
-    font = pygame.font.SysFont("Calibri", 30, True)
-    small_font = pygame.font.SysFont("Calibri", 20, False)
+    font = get_font("Calibri", 30, True)
+    small_font = get_font("Calibri", 20, False)
 
     input_box = pygame.Rect(screen.get_width() // 2 - 150, screen.get_height() // 2, 300, 50)
     text = ""
@@ -61,4 +63,5 @@ def get_player_name(screen, renderer):
         screen.blit(info_text, (screen.get_width() // 2 - info_text.get_width() // 2, input_box.y + 60))
 
         pygame.display.flip()
+        startup_timer.mark("first_frame")
         clock.tick(30)
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+
+
+class Leaderboard(ABC):
+    def __init__(self, path: str):
+        """
+        Base class for a persistent store of each player's best score.
+
+        Scores of 0 or less are never stored.
+
+        :param path: Location of the backing file
+        """
+        self.path = path
+
+    @abstractmethod
+    def load(self):
+        """
+        Loads the stored scores. A missing or corrupted store loads as empty.
+        """
+        pass
+
+    @abstractmethod
+    def upsert(self, name: str, score: int) -> bool:
+        """
+        Records a score for a player, keeping only their best.
+
+        :param name: The player's name
+        :param score: The score reached in a finished game
+        :return: True if the stored best score changed
+        """
+        pass
+
+    def save(self):
+        """
+        Persists changes made by upsert(). Stores that write on every upsert do nothing here.
+        """
+        pass
+
+    @abstractmethod
+    def top_k(self, k: int):
+        """
+        Returns the k best entries as a list of {"name", "score"} dicts, best first.
+        """
+        pass
+
+    @abstractmethod
+    def rank(self, name: str):
+        """
+        Returns the 1-based position of a player on the leaderboard, or None if they have no score.
+        """
+        pass
+
+    @abstractmethod
+    def personal_best(self, name: str) -> int:
+        """
+        Returns the player's best stored score, or 0 if they have none.
+        """
+        pass
+
+    def close(self):
+        """
+        Releases any resources held by the store.
+        """
+        pass
@@ -0,0 +1,92 @@
+import os
+import json
+import tempfile
+
+from game.leaderboard.base_leaderboard import Leaderboard
+
+
+class JsonLeaderboard(Leaderboard):
+    def __init__(self, path: str, capacity: int = 3):
+        """
+        Leaderboard kept in memory and saved as a JSON list of {"name", "score"} entries.
+        Only the best `capacity` players are kept, which is what highscore.json has always held.
+
+        :param path: Path of the JSON file
+        :param capacity: Number of entries to keep (default is 3)
+        """
+        super().__init__(path)
+        self.capacity = capacity
+        self.entries = []
+
+    def load(self):
+        """
+        Loads the entries from the JSON file, dropping malformed entries and scores of 0.
+        """
+        self.entries = []
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            self.entries = [
+                entry for entry in data
+                if isinstance(entry, dict) and "name" in entry and "score" in entry and entry["score"] > 0
+            ]
+            self._sort()
+        except (json.JSONDecodeError, IOError, OSError, KeyError, ValueError, TypeError):
+            self.entries = []
+
+    def _sort(self):
+        self.entries.sort(key=lambda entry: entry["score"], reverse=True)
+        del self.entries[self.capacity:]
+
+    def upsert(self, name: str, score: int) -> bool:
+        if score <= 0:
+            return False
+        for entry in self.entries:
+            if entry["name"] == name:
+                if score <= entry["score"]:
+                    return False
+                entry["score"] = score
+                break
+        else:
+            if len(self.entries) >= self.capacity and score <= self.entries[-1]["score"]:
+                return False
+            self.entries.append({"name": name, "score": score})
+        self._sort()
+        return True
+
+    def save(self):
+        """
+        Saves the entries to the JSON file.
+
+        The data is written to a temporary file in the same directory and then renamed over
+        the save file, so a crash mid-write never leaves a truncated file behind.
+        If the directory doesn't exist, it will be created before attempting to write.
+        """
+        save_dir = os.path.dirname(self.path)
+        os.makedirs(save_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=save_dir, prefix=".highscore-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.entries, f, indent=4)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def top_k(self, k: int):
+        return [dict(entry) for entry in self.entries[:k]]
+
+    def rank(self, name: str):
+        for position, entry in enumerate(self.entries, start=1):
+            if entry["name"] == name:
+                return position
+        return None
+
+    def personal_best(self, name: str) -> int:
+        for entry in self.entries:
+            if entry["name"] == name:
+                return entry["score"]
+        return 0
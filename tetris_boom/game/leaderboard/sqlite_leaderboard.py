@@ -0,0 +1,84 @@
+import os
+import sqlite3
+import threading
+
+from game.leaderboard.base_leaderboard import Leaderboard
+
+
+class SqliteLeaderboard(Leaderboard):
+    def __init__(self, path: str):
+        """
+        Leaderboard stored in a local SQLite database, for any number of players.
+
+        Names are the primary key and scores are indexed, so upserts, personal bests and
+        top-k queries are B-tree lookups instead of scans. Ties are ordered by name.
+        Every upsert is committed immediately.
+        The connection is guarded by a lock so it can be used from a background writer thread.
+
+        :param path: Path of the database file
+        """
+        super().__init__(path)
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Opens the database, creating the table and score index if needed.
+        """
+        self.close()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "name TEXT PRIMARY KEY NOT NULL, "
+                "score INTEGER NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, name)")
+        self._connection = connection
+
+    def _execute(self, query: str, params=()):
+        if self._connection is None:
+            self.load()
+        with self._lock:
+            return self._connection.execute(query, params).fetchall()
+
+    def upsert(self, name: str, score: int) -> bool:
+        if score <= 0:
+            return False
+        if self._connection is None:
+            self.load()
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO scores (name, score) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET score = excluded.score "
+                "WHERE excluded.score > scores.score",
+                (name, score)
+            )
+            return cursor.rowcount > 0
+
+    def top_k(self, k: int):
+        rows = self._execute("SELECT name, score FROM scores ORDER BY score DESC, name LIMIT ?", (k,))
+        return [{"name": name, "score": score} for name, score in rows]
+
+    def rank(self, name: str):
+        best = self.personal_best(name)
+        if best <= 0:
+            return None
+        rows = self._execute(
+            "SELECT COUNT(*) FROM scores WHERE score > ? OR (score = ? AND name < ?)",
+            (best, best, name)
+        )
+        return rows[0][0] + 1
+
+    def personal_best(self, name: str) -> int:
+        rows = self._execute("SELECT score FROM scores WHERE name = ?", (name,))
+        return rows[0][0] if rows else 0
+
+    def close(self):
+        if self._connection is not None:
+            with self._lock:
+                self._connection.close()
+            self._connection = None
@@ -3,9 +3,11 @@ import pygame
 
 class GameMode(ABC):
     @abstractmethod
-    def update(self):
+    def update(self, dt: float = None):
         """
-        Update the game state (called each frame).
+        Update the game state by one fixed logic step.
+
+        :param dt: Length of the step in seconds (default is UPDATE_STEP)
         """
         pass
 
@@ -32,6 +34,30 @@ class GameMode(ABC):
         """
         pass
 
+    def activate(self, dark_mode: bool = False):
+        """
+        Prepares a cached mode for being switched to, instead of building a new one.
+        Clears the per-mode state a fresh instance would start with and activates
+        the mode's renderer and input handler.
+
+        :param dark_mode: Whether dark mode is active
+        """
+        self.game_over = False
+        renderer = getattr(self, 'renderer', None)
+        if renderer is not None:
+            renderer.activate(dark_mode)
+        input_handler = getattr(self, 'input_handler', None)
+        if input_handler is not None:
+            input_handler.reset()
+
+    def close(self):
+        """
+        Releases the mode's resources, called once when the game exits.
+        """
+        input_handler = getattr(self, 'input_handler', None)
+        if input_handler is not None:
+            input_handler.close()
+
     def should_show_cursor(self) -> bool:
         """
         Returns whether the mouse cursor should be visible in this mode.
@@ -41,7 +67,8 @@ class GameMode(ABC):
     def _handle_game_over(self, is_game_over: bool=True):
         """
         Handle game over state transitions consistently across all modes.
-        Stops background music and plays game over sound when transitioning to game over.
+        Stops background music, plays game over sound and commits the score to the
+        leaderboard when transitioning to game over.
         
         :param new_game_over_state: The new game over state to set
         """
@@ -53,3 +80,7 @@ class GameMode(ABC):
             if sound_manager:
                 sound_manager.stop("music_1_loop")
                 sound_manager.play("game_over")
+
+            state = getattr(self, 'state', None)
+            if state is not None:
+                state.score_manager.commit_game()
@@ -15,17 +15,28 @@ class BlockBlastMode(GameMode):
         self.input_handler = None
         self.game_over = False
 
+        self._fill_next_blocks()
+
+    def _fill_next_blocks(self):
         if not self.state.next_blocks:
             for _ in range(NEXT_BLOCKS_COUNT):
                 self.state.next_blocks.append(self.state.block_factory.create_block())
 
-    def update(self):
+    def activate(self, dark_mode: bool = False):
+        super().activate(dark_mode)
+        self._fill_next_blocks()
+
+    def update(self, dt: float = None):
         """
         Update game logic.
-        For BlockBlast, blocks don't fall automatically. Only handle dragging.
+        For BlockBlast, blocks don't fall automatically. Only handle dragging
+        and pick up a hint once the solver has answered.
         """
+        if self.input_handler is not None:
+            self.input_handler.update_hint()
+
         has_space = any(
-            self.state.board.has_space_for_block(block.copy())
+            self.state.board.has_space_for_block(block)
             for block in self.state.next_blocks
         )
 
@@ -2,11 +2,8 @@ import pygame
 from game.modes.base_mode import GameMode
 from game.renderers.base_renderer import BaseRenderer
 from game.gamestate import GameState
-from game.data import BOMB_SPEED_MULTIPLIER
-
-DEFAULT_GRAVITY = 1.5
-SOFT_DROP_SPEED_MULTIPLIER = 5
-FPS = 30
+from game.data import DEFAULT_GRAVITY, UPDATE_STEP
+from game.rules import drop_interval, place_block
 
 class TetrisMode(GameMode):
     def __init__(self, screen: pygame.Surface, state: GameState, renderer: BaseRenderer, dark_mode=False):
@@ -21,28 +18,75 @@ class TetrisMode(GameMode):
         self.gravity = DEFAULT_GRAVITY
         self.fall_timer = 0.0
         self.pressing_down = False
+        self._last_drop_interval = None
+
+    def activate(self, dark_mode: bool = False):
+        super().activate(dark_mode)
+        self.fall_timer = 0.0
+        self.pressing_down = False
+
+    def update(self, dt: float = None):
+        """
+        Advances gravity by dt seconds of game time. The block falls one row per elapsed
+        drop interval, so the fall speed does not depend on how often update() is called.
 
-    def update(self):
+        :param dt: Elapsed game time in seconds (default is UPDATE_STEP)
+        """
         if self.game_over:
             return
 
-        dt = 1 / FPS
-        self.fall_timer += dt
-
-        speed_multiplier = SOFT_DROP_SPEED_MULTIPLIER if getattr(self, "pressing_down", False) else 1
-        if self.state.current_block.is_bomb:
-            speed_multiplier *= BOMB_SPEED_MULTIPLIER
-        
-        drop_interval = 1.0 / (self.gravity * speed_multiplier)
+        interval = self._rescaled_drop_interval()
+        self.fall_timer += UPDATE_STEP if dt is None else dt
 
-        if self.fall_timer >= drop_interval:
-            self.fall_timer = 0.0
+        while self.fall_timer >= interval:
+            self.fall_timer -= interval
 
             self.state.current_block.move(0, 1)
 
             if not self.state.board.is_valid_position(self.state.current_block):
                 self.state.current_block.move(0, -1)
+                self.fall_timer = 0.0
                 self._lock_block()
+                break
+
+    def _drop_interval(self):
+        return drop_interval(
+            self.gravity,
+            pressing_down=getattr(self, "pressing_down", False),
+            is_bomb=self.state.current_block.is_bomb
+        )
+
+    def _rescaled_drop_interval(self):
+        """
+        Returns the current drop interval. If it changed since the last call (soft drop pressed
+        or released, a bomb spawned), fall_timer is rescaled to keep the same fraction of a row,
+        so time saved up at one speed never pays out several rows at a faster one.
+        """
+        interval = self._drop_interval()
+        last_interval = self._last_drop_interval
+        if last_interval is not None and interval != last_interval:
+            self.fall_timer *= interval / last_interval
+        self._last_drop_interval = interval
+        return interval
+
+    def get_fall_offset(self, alpha: float = 0.0) -> float:
+        """
+        Returns how far the falling block has progressed towards the next row, as a fraction
+        of a cell, for drawing it between logic steps.
+
+        :param alpha: Fraction of a logic step elapsed since the last update() (0 to 1)
+        :return: A value from 0.0 (at its row) to 1.0 (at the next row), 0.0 if the block cannot fall
+        """
+        if self.game_over:
+            return 0.0
+        block = self.state.current_block
+        interval = self._rescaled_drop_interval()
+        progress = (self.fall_timer + alpha * UPDATE_STEP) / interval
+        if progress <= 0.0:
+            return 0.0
+        if not self.state.board.fits(block.shape, block.rotation, block.x, block.y + 1):
+            return 0.0
+        return min(progress, 1.0)
 
     def _drop_block(self):
         """
@@ -55,14 +99,10 @@ class TetrisMode(GameMode):
         Locks the block in place and clears any full lines.
         """
         block = self.state.current_block
-        
+
+        lines_cleared, _ = place_block(self.state.board, block)
         if block.is_bomb:
-            self.state.board.explode_bomb(block)
             self.state.sound_manager.play("bomb")
-        else:
-            self.state.board.freeze(block)
-
-        lines_cleared = self.state.board.break_lines()
         self.state.score_manager.add_points(lines_cleared)
 
         self.spawn_block()
@@ -0,0 +1,69 @@
+from game.shape_table import SHAPE_TABLE
+
+
+class PlacementIndex:
+    def __init__(self, board):
+        """
+        Caches whether each shape/rotation fits anywhere on a board.
+
+        Every entry remembers the board version it was computed at and, if the
+        shape fits, one position where it fits (the witness). When the board
+        changes the entry is revalidated cheaply instead of rescanning:
+        a witness that still fits keeps the answer True, and a False answer
+        stays False as long as no cell has been cleared since.
+
+        :param board: The Board to index
+        """
+        self.board = board
+        self._entries = {}
+
+    def clear(self):
+        """
+        Drops every cached entry.
+        """
+        self._entries.clear()
+
+    def find_position(self, shape: int, rotation: int):
+        """
+        Returns an (x, y) position where the shape fits entirely on the board,
+        or None if there is no such position.
+        """
+        board = self.board
+        key = (shape, rotation)
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            version, witness = entry
+            if version == board.version:
+                return witness
+            if witness is None:
+                if board.last_clear_version <= version:
+                    self._entries[key] = (board.version, None)
+                    return None
+            elif board.backend.fits(shape, rotation, witness[0], witness[1]):
+                self._entries[key] = (board.version, witness)
+                return witness
+
+        witness = self._search(shape, rotation)
+        self._entries[key] = (board.version, witness)
+        return witness
+
+    def has_space(self, shape: int, rotation: int) -> bool:
+        """
+        Returns True if the shape in the given rotation fits anywhere on the board.
+        """
+        return self.find_position(shape, rotation) is not None
+
+    def _search(self, shape: int, rotation: int):
+        """
+        Scans every position that keeps the shape inside the board.
+        """
+        board = self.board
+        info = SHAPE_TABLE[shape][rotation]
+        fits = board.backend.fits
+        xs = range(-info.min_x, board.cols - info.max_x)
+        for y in range(-info.min_y, board.rows - info.max_y):
+            for x in xs:
+                if fits(shape, rotation, x, y):
+                    return (x, y)
+        return None
@@ -2,6 +2,13 @@ import pygame
 
 from game.data import *
 from game.modes.base_mode import GameMode
+from game.renderers.text_cache import TextCache
+from game.renderers.font_cache import get_font
+from game.renderers.tile_atlas import TileAtlas, BOARD_TILE, TRAY_TILE, BOMB_RED, BOMB_WHITE
+
+SCORE_TEXT_POS = (10, 10)
+HIGH_SCORE_TEXT_POS = (10, 35)
+
 
 class BaseRenderer:
     def __init__(self, screen: pygame.Surface, game_mode: GameMode, dark_mode=False):
@@ -15,8 +22,24 @@ class BaseRenderer:
         SCORE_AREA_HEIGHT = 70
         self.offset_y = SCORE_AREA_HEIGHT + (screen.get_height() - SCORE_AREA_HEIGHT - self.board.rows * BLOCK_SIZE) // 2
 
-        self.font = pygame.font.SysFont('Calibri', 20, True)
-        self.large_font = pygame.font.SysFont('Calibri', 35, True)
+        self.font = get_font('Calibri', 20, True)
+        self.large_font = get_font('Calibri', 35, True)
+        self.text_cache = TextCache()
+        self._score_line_key = None
+        self._score_line_surfaces = None
+        self._overlay = None
+        self._tile_atlas = None
+        self._board_background = None
+
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self._full_redraw = True
+        self._frame_sprites = []
+        self._drawn_sprites = {}
+        self._drawn_board = None
+        self._drawn_board_version = 0
+        self._drawn_game_over = False
+        self._pending_rects = None
+        self.alpha = 0.0
 
         self.dark_mode = dark_mode
         self.theme = DARK_THEME if dark_mode else LIGHT_THEME
@@ -25,11 +48,187 @@ class BaseRenderer:
         self._load_theme()
 
     def _load_theme(self):
-        """Load color them based on settings"""
+        """Load color them based on settings. Drops the tiles and board background drawn for the old theme."""
         if self.dark_mode:
             self.theme = DARK_THEME
         else:
             self.theme = LIGHT_THEME
+        self._tile_atlas = None
+        self._board_background = None
+        self.invalidate()
+
+    def activate(self, dark_mode: bool):
+        """
+        Prepares a cached renderer for being shown again after a mode switch.
+        The screen holds the other mode's frame, so the next frame is drawn in full.
+
+        :param dark_mode: Whether dark mode is active
+        """
+        if dark_mode != self.dark_mode:
+            self.set_theme(dark_mode)
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Forces the next frame to be redrawn and presented in full, e.g. after
+        something else has drawn over the screen.
+        """
+        self._full_redraw = True
+
+    def render(self):
+        """
+        Draws the frame and presents it. With dirty_rendering on, only the regions that
+        changed since the last frame (board cells, moved or flashing sprites and the HUD)
+        are redrawn and pushed with pygame.display.update().
+        """
+        self.draw()
+        self.present()
+
+    def draw(self, alpha: float = 0.0):
+        """
+        Draws the frame to the screen surface without presenting it.
+
+        :param alpha: Fraction of a logic step elapsed since the last update, for interpolating motion
+        """
+        self.alpha = alpha
+        self._frame_sprites = self._get_sprite_tiles()
+        dirty_rects = self._collect_dirty_rects()
+
+        if dirty_rects is None:
+            self.screen.set_clip(None)
+            self._draw_frame()
+        else:
+            for rect in dirty_rects:
+                self.screen.set_clip(rect)
+                self._draw_frame()
+            self.screen.set_clip(None)
+        self._pending_rects = dirty_rects
+
+    def present(self, extra_rects=()):
+        """
+        Pushes the frame drawn by draw() to the display.
+
+        :param extra_rects: Regions drawn on top of the frame by someone else (e.g. an overlay)
+                            that must be presented as well
+        """
+        if self._pending_rects is None:
+            pygame.display.flip()
+        else:
+            rects = self._pending_rects + list(extra_rects)
+            if rects:
+                pygame.display.update(rects)
+        self._pending_rects = []
+
+    def _draw_frame(self):
+        """
+        Draws every layer of the frame, bottom to top. Drawing is limited to the
+        screen's clip rect, so this also repaints a single dirty region.
+        """
+        self._draw_background()
+        self._draw_game_board()
+        self._draw_sprites()
+        self._draw_score()
+        if self.game_mode.game_over:
+            self._draw_game_over_message()
+
+    def _get_sprite_tiles(self):
+        """
+        Returns the blocks drawn over the board this frame as a list of (name, tiles) groups
+        in drawing order, where tiles is a tuple of (style, key, screen_x, screen_y).
+        Modes override this to add their falling, queued or dragged blocks.
+        """
+        return []
+
+    def _draw_sprites(self):
+        atlas = self._get_tile_atlas()
+        self.screen.blits([
+            atlas.blit_item(*tile) for _, tiles in self._frame_sprites for tile in tiles
+        ], False)
+
+    def _collect_dirty_rects(self):
+        """
+        Works out which screen regions changed since the last frame and records the
+        state being drawn now.
+
+        :return: A list of rects to redraw, or None if the whole frame must be redrawn
+        """
+        board = self.state.board
+        game_over = self.game_mode.game_over
+        score_rects = self._get_score_line_rects()
+        score_changed = self._update_score_line()
+
+        full = (
+            not self.dirty_rendering
+            or self._full_redraw
+            or board is not self._drawn_board
+            or game_over != self._drawn_game_over
+        )
+
+        rects = []
+        if not full:
+            changes = board.changes_since(self._drawn_board_version)
+            if changes is None or any(change.full_refresh for change in changes):
+                full = True
+            else:
+                cells = set()
+                for change in changes:
+                    cells |= change.dirty_cells()
+                if cells:
+                    rects.append(self._get_cells_rect(cells))
+
+        if not full:
+            new_sprites = dict(self._frame_sprites)
+            for name in set(new_sprites) | set(self._drawn_sprites):
+                old_tiles = self._drawn_sprites.get(name, ())
+                new_tiles = new_sprites.get(name, ())
+                if old_tiles != new_tiles:
+                    rects.extend(self._get_tiles_rect(tiles) for tiles in (old_tiles, new_tiles) if tiles)
+            if score_changed:
+                rects.extend(score_rects)
+                rects.extend(self._get_score_line_rects())
+
+        self._full_redraw = False
+        self._drawn_board = board
+        self._drawn_board_version = board.version
+        self._drawn_game_over = game_over
+        self._drawn_sprites = dict(self._frame_sprites)
+
+        if full:
+            return None
+        screen_rect = self.screen.get_rect()
+        return [rect.clip(screen_rect) for rect in rects if rect.colliderect(screen_rect)]
+
+    def _get_cells_rect(self, cells):
+        """
+        Returns the screen rect covering a set of (x, y) board cells.
+        """
+        xs = [x for x, _ in cells]
+        ys = [y for _, y in cells]
+        min_x, min_y = min(xs), min(ys)
+        return pygame.Rect(
+            self.offset_x + min_x * BLOCK_SIZE,
+            self.offset_y + min_y * BLOCK_SIZE,
+            (max(xs) - min_x + 1) * BLOCK_SIZE,
+            (max(ys) - min_y + 1) * BLOCK_SIZE
+        )
+
+    def _get_tiles_rect(self, tiles):
+        """
+        Returns the screen rect covering a group of sprite tiles.
+        """
+        rects = [pygame.Rect(x, y, BLOCK_SIZE, BLOCK_SIZE) for _, _, x, y in tiles]
+        return rects[0].unionall(rects[1:])
+
+    def _get_block_tiles(self, style, block, screen_x, screen_y):
+        """
+        Returns a block's tiles as (style, key, x, y) tuples, with (screen_x, screen_y)
+        as the screen position of the block's (0, 0) cell.
+        """
+        key = self._get_bomb_tile_key() if block.is_bomb else block.color_index
+        return tuple(
+            (style, key, screen_x + dx * BLOCK_SIZE, screen_y + dy * BLOCK_SIZE)
+            for dx, dy in block.get_shape_info().cells
+        )
 
     def toggle_theme(self):
         self.dark_mode = not self.dark_mode
@@ -48,6 +247,46 @@ class BaseRenderer:
         time_ms = pygame.time.get_ticks()
         return RED if (time_ms // flash_rate) % 2 == 0 else WHITE
     
+    def _get_bomb_tile_key(self):
+        """
+        Returns the atlas key for the current bomb flash frame.
+        """
+        return BOMB_RED if self._get_bomb_color() == RED else BOMB_WHITE
+
+    def _get_tile_atlas(self):
+        """
+        Returns the tile atlas for the current theme, building it on first use.
+        """
+        if self._tile_atlas is None:
+            self._tile_atlas = TileAtlas(self.dark_mode, self.theme)
+        return self._tile_atlas
+
+    def _get_board_background(self):
+        """
+        Returns the empty board with its grid lines, rendered once per theme.
+        """
+        if self._board_background is None:
+            board = self.state.board
+            background = pygame.Surface((board.cols * BLOCK_SIZE, board.rows * BLOCK_SIZE))
+            background.fill(self.theme["background"])
+            for row in range(board.rows):
+                for col in range(board.cols):
+                    pygame.draw.rect(
+                        background,
+                        self.theme["grid"],
+                        [col * BLOCK_SIZE, row * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE],
+                        1
+                    )
+            self._board_background = background
+        return self._board_background
+
+    def draw_block_at_screen_coords(self, block, screen_x, screen_y):
+        """Draw a block at arbitrary screen coordinates (for next blocks / drag-and-drop)."""
+        atlas = self._get_tile_atlas()
+        self.screen.blits([
+            atlas.blit_item(*tile) for tile in self._get_block_tiles(TRAY_TILE, block, screen_x, screen_y)
+        ], False)
+
     def _draw_background(self):
         """
         Fill screen with background color
@@ -56,58 +295,85 @@ class BaseRenderer:
 
     def _draw_game_board(self):
         """
-        Draws the board grid and frozen blocks (no falling block)
+        Draws the board grid and frozen blocks (no falling block).
+        The grid comes from the cached background, the frozen cells from the tile atlas.
         """
         board = self.state.board
-        colors = DARK_BLOCK_COLORS if self.dark_mode else LIGHT_BLOCK_COLORS
-        outline_color = DARK_BLOCK_OUTLINE if self.dark_mode else LIGHT_BLOCK_OUTLINE
-        for row in range(board.rows):
-            for col in range(board.cols):
-                block_value = board.grid[row][col]
+        self.screen.blit(self._get_board_background(), (self.offset_x, self.offset_y))
+
+        clip = self.screen.get_clip()
+        first_row = max(0, (clip.top - self.offset_y) // BLOCK_SIZE)
+        last_row = min(board.rows, (clip.bottom - self.offset_y + BLOCK_SIZE - 1) // BLOCK_SIZE)
+
+        atlas = self._get_tile_atlas()
+        row_counts = board.row_counts
+        items = []
+        for row in range(first_row, last_row):
+            if not row_counts[row]:
+                continue
+            screen_y = self.offset_y + row * BLOCK_SIZE
+            for col, block_value in enumerate(board.grid[row]):
                 if block_value > 0:
-                    pygame.draw.rect(
-                        self.screen,
-                        colors[block_value],
-                        [
-                            self.offset_x + col * BLOCK_SIZE + 1,
-                            self.offset_y + row * BLOCK_SIZE + 1,
-                            BLOCK_SIZE - 2,
-                            BLOCK_SIZE - 2
-                        ]
-                    )
-                pygame.draw.rect(
-                    self.screen,
-                    self.theme["grid"],
-                    [
-                        self.offset_x + col * BLOCK_SIZE,
-                        self.offset_y + row * BLOCK_SIZE,
-                        BLOCK_SIZE,
-                        BLOCK_SIZE
-                    ],
-                    1
-                )
+                    items.append(atlas.blit_item(BOARD_TILE, block_value, self.offset_x + col * BLOCK_SIZE, screen_y))
+        self.screen.blits(items, False)
     
     def _draw_score(self):
         """
         Draw score and high score
         """
+        self._update_score_line()
+        score_text, high_score_text = self._score_line_surfaces
+        self.screen.blit(score_text, SCORE_TEXT_POS)
+        self.screen.blit(high_score_text, HIGH_SCORE_TEXT_POS)
+
+    def _update_score_line(self):
+        """
+        Re-renders the score line surfaces if the score, high score or text color changed.
+
+        :return: True if the surfaces were re-rendered
+        """
         score_manager = self.state.score_manager
         score = score_manager.get_score()
         high_score = score_manager.get_highscore()
         high_score_player = score_manager.get_highscore_player()
 
-        score_text = self.font.render(f"Score: {score}", True, self.theme["text"])
-        self.screen.blit(score_text, [10, 10])
+        key = (score, high_score, high_score_player, self.theme["text"])
+        if key == self._score_line_key:
+            return False
+        self._score_line_key = key
+        self._score_line_surfaces = (
+            self.text_cache.render(self.font, f"Score: {score}", self.theme["text"]),
+            self.text_cache.render(self.font, f"High Score: {high_score_player} - {high_score}", self.theme["text"])
+        )
+        return True
 
-        high_score_text = self.font.render(f"High Score: {high_score_player} - {high_score}", True, self.theme["text"])
-        self.screen.blit(high_score_text, [10, 35])
+    def _get_score_line_rects(self):
+        """
+        Returns the screen rects of the score line as last rendered.
+        """
+        if self._score_line_surfaces is None:
+            return []
+        score_text, high_score_text = self._score_line_surfaces
+        return [
+            score_text.get_rect(topleft=SCORE_TEXT_POS),
+            high_score_text.get_rect(topleft=HIGH_SCORE_TEXT_POS)
+        ]
 
-    def _draw_game_over_message(self):
+    def _get_overlay(self):
         """
-        Draw "Game Over" message
+        Returns the translucent game-over overlay, creating it once per screen size.
         """
-        self.state.score_manager.update_leaderboard()
+        size = self.screen.get_size()
+        if self._overlay is None or self._overlay.get_size() != size:
+            self._overlay = pygame.Surface(size, pygame.SRCALPHA)
+            self._overlay.fill((128, 128, 128, 200))
+        return self._overlay
 
+    def _draw_game_over_message(self):
+        """
+        Draw "Game Over" message. The leaderboard was already committed when the game ended,
+        so this only reads the score manager's state.
+        """
         center_x = self.screen.get_width() // 2
         score_manager = self.state.score_manager
         player_name = score_manager.player_name
@@ -115,16 +381,14 @@ class BaseRenderer:
         highscore = score_manager.get_highscore()
         highscore_name = score_manager.get_highscore_player()
 
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()), pygame.SRCALPHA)
-        overlay.fill((128, 128, 128, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(), (0, 0))
 
-        game_over_text = self.large_font.render("Game Over", True, self.theme["game_over"])
+        game_over_text = self.text_cache.render(self.large_font, "Game Over", self.theme["game_over"])
         self.screen.blit(game_over_text, game_over_text.get_rect(center=(center_x, 160)))
 
         if score_manager.player_name == highscore_name and current_score == highscore and current_score > 0:
-            congrats_text = self.font.render(f"Congrats {score_manager.player_name}!", True, self.theme["highlight"])
-            points_text = self.font.render(f"New High Score: {current_score} points!", True, self.theme["highlight"])
+            congrats_text = self.text_cache.render(self.font, f"Congrats {score_manager.player_name}!", self.theme["highlight"])
+            points_text = self.text_cache.render(self.font, f"New High Score: {current_score} points!", self.theme["highlight"])
             self.screen.blit(congrats_text, congrats_text.get_rect(center=(center_x, 210)))
             self.screen.blit(points_text, points_text.get_rect(center=(center_x, 240)))
             quit_y = 275
@@ -135,12 +399,12 @@ class BaseRenderer:
             restart_y = 225
             leaderboard_start_y = 280
         
-        quit_text = self.font.render("Press Q to quit", True, self.theme["highlight"])
-        restart_text = self.font.render("Press R to restart", True, self.theme["highlight"])
+        quit_text = self.text_cache.render(self.font, "Press Q to quit", self.theme["highlight"])
+        restart_text = self.text_cache.render(self.font, "Press R to restart", self.theme["highlight"])
         self.screen.blit(quit_text, quit_text.get_rect(center=(center_x, quit_y)))
         self.screen.blit(restart_text, restart_text.get_rect(center=(center_x, restart_y)))
 
-        leaderboard_header = self.font.render("Leaderboard:", True, BLACK)
+        leaderboard_header = self.text_cache.render(self.font, "Leaderboard:", BLACK)
         self.screen.blit(leaderboard_header, leaderboard_header.get_rect(center=(center_x, leaderboard_start_y)))
 
         for i, entry in enumerate(score_manager.get_leaderboard(), start=1):
@@ -149,5 +413,5 @@ class BaseRenderer:
             else:
                 color = BLACK
 
-            entry_text = self.font.render(f"{i}. {entry['name']} - {entry['score']}", True, color)
+            entry_text = self.text_cache.render(self.font, f"{i}. {entry['name']} - {entry['score']}", color)
             self.screen.blit(entry_text, entry_text.get_rect(center=(center_x, leaderboard_start_y + 25 * i)))
@@ -0,0 +1,30 @@
+import pygame
+
+_fonts = {}
+
+
+def get_font(name: str, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    """
+    Returns a system font, creating it only the first time it is requested.
+    pygame.font.SysFont walks the system font list on every call, so renderers
+    and overlays share the instances from this process-wide cache instead.
+
+    :param name: The font family name
+    :param size: The font size in points
+    :param bold: Whether the font is bold (default is False)
+    :param italic: Whether the font is italic (default is False)
+    :return: The shared Font instance
+    """
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold, italic)
+        _fonts[key] = font
+    return font
+
+
+def clear_fonts():
+    """
+    Drops every cached font, e.g. before pygame.font is shut down and re-initialized.
+    """
+    _fonts.clear()
@@ -0,0 +1,76 @@
+import pygame
+
+from game.data import BLACK, WHITE, YELLOW, RED, GREEN
+from game.frame_profiler import FrameProfiler
+from game.renderers.font_cache import get_font
+from game.renderers.text_cache import TextCache
+
+OVERLAY_WIDTH = 180
+OVERLAY_HEIGHT = 110
+GRAPH_HEIGHT = 40
+OVERLAY_TEXT_CACHE_SIZE = 16   # Enough for the three lines to be reused while the numbers hold still
+
+
+class ProfilerOverlay:
+    def __init__(self, profiler: FrameProfiler):
+        """
+        On-screen panel showing a frame time graph, p50/p95/p99 and dropped frames.
+        The panel is opaque, so it can be drawn on top of a dirty-rect frame without
+        repainting what is underneath. Text lines are only re-rendered when their numbers change.
+
+        :param profiler: The profiler whose frames are shown
+        """
+        self.profiler = profiler
+        self.visible = False
+        self.font = get_font('Consolas', 14)
+        self.text_cache = TextCache(max_size=OVERLAY_TEXT_CACHE_SIZE)
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def get_rect(self, screen: pygame.Surface) -> pygame.Rect:
+        """
+        Returns the screen area covered by the panel (bottom right corner).
+        """
+        return pygame.Rect(
+            screen.get_width() - OVERLAY_WIDTH,
+            screen.get_height() - OVERLAY_HEIGHT,
+            OVERLAY_WIDTH,
+            OVERLAY_HEIGHT
+        )
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        """
+        Draws the panel and returns its rect, so the caller can present it.
+        """
+        rect = self.get_rect(screen)
+        pygame.draw.rect(screen, BLACK, rect)
+
+        profiler = self.profiler
+        lines = [
+            f"p50 {profiler.percentile(50):5.1f}  p95 {profiler.percentile(95):5.1f} ms",
+            f"p99 {profiler.percentile(99):5.1f}  dropped {profiler.dropped_frames()}",
+            f"frames {len(profiler.frames)}  budget {profiler.frame_budget_ms:.1f} ms"
+        ]
+        for index, line in enumerate(lines):
+            screen.blit(self.text_cache.render(self.font, line, WHITE), (rect.x + 4, rect.y + 4 + index * 16))
+
+        self._draw_graph(screen, pygame.Rect(rect.x + 4, rect.bottom - GRAPH_HEIGHT - 4, rect.width - 8, GRAPH_HEIGHT))
+        return rect
+
+    def _draw_graph(self, screen: pygame.Surface, area: pygame.Rect):
+        """
+        Draws the most recent frame times as bars, scaled so twice the frame budget fills the graph.
+        """
+        profiler = self.profiler
+        scale = area.height / (2 * profiler.frame_budget_ms)
+        budget_y = area.bottom - int(profiler.frame_budget_ms * scale)
+
+        frames = list(profiler.frames)[-area.width:]
+        for offset, frame in enumerate(frames):
+            height = min(area.height, int(frame["total"] * scale))
+            color = RED if profiler.is_dropped(frame) else GREEN
+            x = area.x + offset
+            pygame.draw.line(screen, color, (x, area.bottom - 1), (x, area.bottom - height))
+
+        pygame.draw.line(screen, YELLOW, (area.x, budget_y), (area.right - 1, budget_y))
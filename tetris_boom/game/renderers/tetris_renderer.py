@@ -1,51 +1,60 @@
 import pygame
 from game.renderers.base_renderer import BaseRenderer
-from game.data import WHITE, RED, BLOCK_SIZE, DARK_BLOCK_OUTLINE, DARK_BLOCK_COLORS, LIGHT_BLOCK_COLORS, LIGHT_BLOCK_OUTLINE
+from game.renderers.tile_atlas import FALLING_TILE, TRAY_TILE, GHOST_TILE
+from game.data import BLOCK_SIZE, NEXT_BLOCKS_COUNT
 from game.modes.base_mode import GameMode
 
 class TetrisRenderer(BaseRenderer):
     def __init__(self, screen: pygame.Surface, game_mode: GameMode, dark_mode=False):
         super().__init__(screen, game_mode, dark_mode)
 
-    def render(self):
-        self.screen.fill(self.theme["background"])
-        self._draw_game_board()
-        self._draw_current_block()
-        self._draw_score()
+    def _get_sprite_tiles(self):
+        return [
+            ("ghost", self._get_ghost_tiles()),
+            ("current_block", self._get_current_block_tiles()),
+            ("next_pieces", self._get_next_piece_tiles())
+        ]
 
+    def _get_next_piece_tiles(self):
+        """
+        Returns the tiles of the upcoming blocks from the block factory's preview queue.
+        """
+        start_x = self.offset_x + self.state.board.cols * BLOCK_SIZE + 50
+        start_y = self.offset_y
+        tiles = ()
+        for index, block in enumerate(self.state.block_factory.peek(NEXT_BLOCKS_COUNT)):
+            tiles += self._get_block_tiles(TRAY_TILE, block, start_x, start_y + index * 100)
+        return tiles
+
+    def _get_ghost_tiles(self):
+        """
+        Returns the tiles of the ghost piece, an outline of the current block where a
+        hard drop would land it. Nothing is drawn once the block is resting.
+        """
         if self.game_mode.game_over:
-            self._draw_game_over_message()
-
-        pygame.display.flip()
-
-    def _draw_current_block(self):
+            return ()
+        current_block = self.state.current_block
+        distance = self.state.board.drop_distance(current_block)
+        if distance == 0:
+            return ()
+        return self._get_block_tiles(
+            GHOST_TILE,
+            current_block,
+            self.offset_x + current_block.x * BLOCK_SIZE,
+            self.offset_y + (current_block.y + distance) * BLOCK_SIZE
+        )
+
+    def _get_current_block_tiles(self):
         """
-        Draws the current falling block at its position on the board.
-        Works with flat-index SHAPES (0-15 for 4x4 grid or larger for bigger shapes).
+        Returns the tiles of the current falling block at its position on the board.
+        Cell offsets come from the precompiled shape table. Between gravity steps the
+        block is drawn part of the way towards the next row.
         """
         current_block = self.state.current_block
-        shape_indices = current_block.get_shape()
-        colors = DARK_BLOCK_COLORS if self.dark_mode else LIGHT_BLOCK_COLORS
-
-        for idx in shape_indices:
-            r = idx // 4
-            c = idx % 4
-
-            x = current_block.x + c
-            y = current_block.y + r
-            
-            if current_block.is_bomb:
-                color = self._get_bomb_color()
-            else:
-                color = current_block.get_color(colors)
-
-            rect = pygame.Rect(
-                self.offset_x + x * BLOCK_SIZE + 1,
-                self.offset_y + y * BLOCK_SIZE + 1,
-                BLOCK_SIZE - 2,
-                BLOCK_SIZE - 2
-            )
-            pygame.draw.rect(self.screen, color, rect)
-            
-            if current_block.is_bomb:
-                pygame.draw.rect(self.screen, RED, rect, 3)
+        fall_offset = int(self.game_mode.get_fall_offset(self.alpha) * BLOCK_SIZE)
+        return self._get_block_tiles(
+            FALLING_TILE,
+            current_block,
+            self.offset_x + current_block.x * BLOCK_SIZE,
+            self.offset_y + current_block.y * BLOCK_SIZE + fall_offset
+        )
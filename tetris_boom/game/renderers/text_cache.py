@@ -0,0 +1,55 @@
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_SIZE = 128
+
+
+class TextCache:
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE):
+        """
+        LRU cache of rendered text surfaces, so strings that do not change between
+        frames are rasterized once instead of on every frame.
+
+        :param max_size: Maximum number of surfaces to keep (default is TEXT_CACHE_SIZE)
+        """
+        if max_size < 1:
+            raise ValueError("TextCache max_size must be at least 1")
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """
+        Returns the surface for the text, rendering it only if it is not cached yet.
+        The returned surface is shared and must not be drawn on.
+
+        :param font: The font to render with
+        :param text: The string to render
+        :param color: The text color
+        :param antialias: Whether to antialias the text (default is True)
+        :return: The rendered text surface
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """
+        Drops every cached surface.
+        """
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
@@ -0,0 +1,89 @@
+import pygame
+
+from game.data import BLOCK_SIZE, RED, WHITE, DARK_BLOCK_COLORS, LIGHT_BLOCK_COLORS, DARK_BLOCK_OUTLINE, LIGHT_BLOCK_OUTLINE
+
+# Tile styles, one atlas row each
+BOARD_TILE = 0      # Frozen cell on the board, drawn over the pre-rendered grid
+FALLING_TILE = 1    # The falling Tetris block
+TRAY_TILE = 2       # Next pieces and other blocks drawn off the board, with a grid outline
+DRAG_TILE = 3       # Dragged block and its snapped preview in BlockBlast mode
+GHOST_TILE = 4      # Outline showing where the falling Tetris block will land
+TILE_STYLES = (BOARD_TILE, FALLING_TILE, TRAY_TILE, DRAG_TILE, GHOST_TILE)
+
+# Tile keys for the two bomb flash frames, next to the color indices
+BOMB_RED = "bomb_red"
+BOMB_WHITE = "bomb_white"
+
+
+class TileAtlas:
+    def __init__(self, dark_mode: bool, theme: dict):
+        """
+        Pre-renders every block tile for one theme into a single atlas surface.
+
+        Each style gets one row, and each block color plus the two bomb flash colors
+        get one column. Frames are then composed by blitting areas of the atlas with
+        Surface.blits instead of drawing rectangles cell by cell.
+
+        :param dark_mode: Whether to use the dark block colors
+        :param theme: The renderer's theme dict (for the grid outline color)
+        """
+        self.colors = DARK_BLOCK_COLORS if dark_mode else LIGHT_BLOCK_COLORS
+        self.outline_color = DARK_BLOCK_OUTLINE if dark_mode else LIGHT_BLOCK_OUTLINE
+        self.grid_color = theme["grid"]
+        self.background_color = theme["background"]
+
+        keys = list(self.colors) + [BOMB_RED, BOMB_WHITE]
+        self._columns = {key: column for column, key in enumerate(keys)}
+        self.surface = pygame.Surface((len(keys) * BLOCK_SIZE, len(TILE_STYLES) * BLOCK_SIZE))
+        self._areas = {}
+
+        for key, column in self._columns.items():
+            for style in TILE_STYLES:
+                self._areas[(style, key)] = self._draw_tile(style, key, column * BLOCK_SIZE, style * BLOCK_SIZE)
+
+    def _draw_tile(self, style: int, key, x: int, y: int):
+        """
+        Draws one tile into its atlas slot and returns (area, inset), where area is the
+        part of the slot to blit and inset the offset of that area within a board cell.
+        """
+        is_bomb = key in (BOMB_RED, BOMB_WHITE)
+        if is_bomb:
+            color = RED if key == BOMB_RED else WHITE
+        else:
+            color = self.colors[key]
+
+        cell = pygame.Rect(x, y, BLOCK_SIZE, BLOCK_SIZE)
+        inner = cell.inflate(-2, -2)
+        if style == GHOST_TILE:
+            pygame.draw.rect(self.surface, self.background_color, inner)
+            pygame.draw.rect(self.surface, RED if is_bomb else color, inner, 1)
+            return inner, 1
+        pygame.draw.rect(self.surface, color, inner)
+
+        if style == FALLING_TILE:
+            if is_bomb:
+                pygame.draw.rect(self.surface, RED, inner, 3)
+        elif style == TRAY_TILE:
+            pygame.draw.rect(self.surface, self.grid_color, cell, 1)
+            if is_bomb:
+                pygame.draw.rect(self.surface, RED, cell, 2)
+            return cell, 0
+        elif style == DRAG_TILE:
+            pygame.draw.rect(self.surface, self.outline_color, inner, 1)
+            if is_bomb:
+                pygame.draw.rect(self.surface, RED, inner, 2)
+
+        return inner, 1
+
+    def blit_item(self, style: int, key, x: int, y: int):
+        """
+        Returns a (source, dest, area) tuple for Surface.blits that draws the tile
+        into the board cell whose top-left corner is (x, y).
+
+        :param style: One of TILE_STYLES
+        :param key: A block color index, or BOMB_RED / BOMB_WHITE
+        :param x: Screen x of the cell
+        :param y: Screen y of the cell
+        """
+        area, inset = self._areas[(style, key)]
+        return self.surface, (x + inset, y + inset), area
@@ -0,0 +1,57 @@
+"""
+Pure game rules shared by the pygame modes and the headless engine.
+
+Nothing in this module may import pygame, so the same rules can run
+without a display or audio device.
+"""
+from game.data import BOMB_SPEED_MULTIPLIER, SOFT_DROP_SPEED_MULTIPLIER, SCORE_CHECKPOINT_INTERVAL
+
+
+def points_for_lines(lines_cleared: int) -> int:
+    """
+    Returns the points awarded for clearing the given number of lines in one move.
+    """
+    return lines_cleared ** 2
+
+
+def drop_interval(gravity: float, pressing_down: bool = False, is_bomb: bool = False) -> float:
+    """
+    Returns the time in seconds between two gravity steps of the falling block.
+
+    :param gravity: Base fall speed in rows per second
+    :param pressing_down: True while the player holds soft drop
+    :param is_bomb: True if the falling block is a bomb
+    """
+    speed_multiplier = SOFT_DROP_SPEED_MULTIPLIER if pressing_down else 1
+    if is_bomb:
+        speed_multiplier *= BOMB_SPEED_MULTIPLIER
+    return 1.0 / (gravity * speed_multiplier)
+
+
+def place_block(board, block):
+    """
+    Places a block on the board: bombs explode, other blocks freeze.
+    Full lines are cleared afterwards in both cases.
+
+    :param board: The Board to place the block on
+    :param block: The block, already at its final position
+    :return: Tuple of (lines_cleared, cells_exploded)
+    """
+    cells_exploded = 0
+    if block.is_bomb:
+        cells_exploded = board.explode_bomb(block)
+    else:
+        board.freeze(block)
+    lines_cleared = board.break_lines()
+    return lines_cleared, cells_exploded
+
+
+def next_checkpoint(score: int, last_checkpoint: int, interval: int = SCORE_CHECKPOINT_INTERVAL):
+    """
+    Returns the new score checkpoint if the score crossed one since last_checkpoint,
+    otherwise None. Crossing a checkpoint switches between game modes.
+    """
+    checkpoint = score // interval
+    if checkpoint > last_checkpoint:
+        return checkpoint
+    return None
@@ -1,18 +1,47 @@
 import os
-import json
 import copy
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from game.sound_manager import SoundManager
 from game.resource_path import resource_path
+from game.rules import points_for_lines
+from game.data import LEADERBOARD_BACKEND
+from game.leaderboard.json_leaderboard import JsonLeaderboard
+
+LEADERBOARD_SIZE = 3
+
+
+def _sqlite_leaderboard(path: str):
+    """
+    Creates a SqliteLeaderboard, importing sqlite3 only when that store is actually chosen.
+    """
+    from game.leaderboard.sqlite_leaderboard import SqliteLeaderboard
+    return SqliteLeaderboard(path)
+
+
+LEADERBOARD_BACKENDS = {
+    "json": JsonLeaderboard,
+    "sqlite": _sqlite_leaderboard
+}
 
 class ScoreManager:
-    def __init__(self, sound_manager: SoundManager):
+    def __init__(self, sound_manager: SoundManager, leaderboard_backend: str = LEADERBOARD_BACKEND,
+                 record_scores: bool = True):
         """
         Initializes the score manager, loading the highscore from a file if it exists.
 
         :param sound_manager: The sound manager instance for playing sounds.
+        :param leaderboard_backend: Name of the leaderboard store, one of LEADERBOARD_BACKENDS.
+                                    "json" keeps the top 3 in highscore.json, "sqlite" keeps every
+                                    player's best in highscore.db next to it.
+        :param record_scores: If False, finished games are never written to the leaderboard
+                              (used when the bot is playing).
         """
+        if leaderboard_backend not in LEADERBOARD_BACKENDS:
+            available = ", ".join(sorted(LEADERBOARD_BACKENDS))
+            raise ValueError(f"Unknown leaderboard backend '{leaderboard_backend}' (available: {available})")
+
         if getattr(sys, 'frozen', False):
             home_dir = os.path.expanduser("~")
             save_dir = os.path.join(home_dir, ".tetris_boom")
@@ -24,6 +53,19 @@ class ScoreManager:
         self.score = 0
         self.player_name = ""
         self.save_path = save_path
+        # Errors a failed background write may raise; sqlite3 is only imported with its store
+        self._store_errors = (OSError,)
+        if leaderboard_backend == "sqlite":
+            import sqlite3
+            self._store_errors = (OSError, sqlite3.Error)
+            store_path = os.path.splitext(save_path)[0] + ".db"
+        else:
+            store_path = save_path
+        self.store = LEADERBOARD_BACKENDS[leaderboard_backend](store_path)
+        self.record_scores = record_scores
+        self._game_committed = False
+        self._save_executor = None
+        self._pending_save = None
         self._load_leaderboard()
 
         self.sound_manager = sound_manager
@@ -44,7 +86,7 @@ class ScoreManager:
 
         :param lines_cleared: The number of lines cleared by the player in the current move.
         """
-        self.score += lines_cleared ** 2
+        self.score += points_for_lines(lines_cleared)
 
         self.sound_manager.play("place_block")
 
@@ -79,6 +121,7 @@ class ScoreManager:
         self.score = 0
         self.initial_highscore = self.get_highscore()
         self.highscore_sound_played = False
+        self._game_committed = False
 
     def get_highscore(self):
         """
@@ -100,41 +143,103 @@ class ScoreManager:
 
     def _load_leaderboard(self):
         """
-        Loads the leaderboard from a JSON file, if it exists.
+        Loads the leaderboard store and caches its top entries for display.
 
-        The highscore will be set to 0 if the file doesn't exist or the data is corrupted.
+        The highscore will be set to 0 if the store doesn't exist or the data is corrupted.
         Scores of 0 are filtered out.
         """
-        if os.path.exists(self.save_path):
+        self.store.load()
+        self.leaderboard = self.store.top_k(LEADERBOARD_SIZE)
+
+    def _record_score(self, player_name: str, player_score: int):
+        """
+        Writes a finished game's score to the leaderboard store.
+        """
+        if self.store.upsert(player_name, player_score):
+            self.store.save()
+
+    def _record_score_async(self, player_name: str, player_score: int):
+        """
+        Queues a write to the leaderboard store on a background thread.
+        Writes run one at a time in submission order.
+        """
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="leaderboard")
+        self._pending_save = self._save_executor.submit(self._record_score, player_name, player_score)
+
+    def commit_game(self):
+        """
+        Records the finished game's score in the leaderboard. Call this once when the game ends;
+        repeated calls are ignored until reset(). The cached leaderboard is updated right away
+        and the store is written in the background.
+        """
+        if self._game_committed:
+            return
+        self._game_committed = True
+        if not self.record_scores:
+            return
+        if self._merge_score():
+            self._record_score_async(self._leaderboard_name(), self.get_score())
+
+    def flush(self):
+        """
+        Blocks until any pending background write has finished.
+        Errors from the write are swallowed, a failed write only loses the leaderboard update.
+        """
+        pending = self._pending_save
+        if pending is not None:
             try:
-                with open(self.save_path, "r") as f:
-                    self.leaderboard = json.load(f)
-                self.leaderboard = [
-                    entry for entry in self.leaderboard 
-                    if isinstance(entry, dict) and "name" in entry and "score" in entry and entry["score"] > 0
-                ]
-                self.leaderboard.sort(key=lambda x: x["score"], reverse=True)
-            except (json.JSONDecodeError, IOError, OSError, KeyError, ValueError):
-                self.leaderboard = []
-        else:
-            self.leaderboard = []
+                pending.result()
+            except self._store_errors:
+                pass
+            self._pending_save = None
 
-    def _save_leaderboard(self):
+    def close(self):
         """
-        Saves the current leaderboard to a JSON file.
-        
-        If the directory doesn't exist, it will be created before attempting to write.
+        Flushes pending writes, stops the background writer and closes the store.
+        Call this before the game exits.
         """
-        os.makedirs(os.path.dirname(self.save_path), exist_ok=True)
-        with open(self.save_path, "w") as f:
-            json.dump(self.leaderboard, f, indent=4)
+        self.flush()
+        if self._save_executor is not None:
+            self._save_executor.shutdown(wait=True)
+            self._save_executor = None
+        self.store.close()
 
     def update_leaderboard(self):
-        player_name = self.player_name.strip() or "Player"
+        """
+        Merges the current score into the leaderboard and writes it to the store synchronously.
+        """
+        if self._merge_score():
+            self._record_score(self._leaderboard_name(), self.get_score())
+
+    def get_player_rank(self):
+        """
+        Returns the current player's position on the full leaderboard, or None if they are not on it.
+        """
+        self.flush()
+        return self.store.rank(self._leaderboard_name())
+
+    def get_personal_best(self):
+        """
+        Returns the current player's best stored score, or 0 if they have none.
+        """
+        self.flush()
+        return self.store.personal_best(self._leaderboard_name())
+
+    def _leaderboard_name(self):
+        return self.player_name.strip() or "Player"
+
+    def _merge_score(self):
+        """
+        Merges the current player's score into the cached leaderboard, keeping the top entries.
+
+        :return: True if the score should be written to the store, otherwise False
+        """
+        player_name = self._leaderboard_name()
         player_score = self.get_score()
 
         if player_score == 0:
-            return
+            return False
 
         leaderboard = copy.deepcopy(self.leaderboard)
 
@@ -156,13 +261,13 @@ class ScoreManager:
             leaderboard.append({"name": player_name, "score": player_score})
 
         leaderboard.sort(key=lambda x: x["score"], reverse=True)
-        leaderboard = leaderboard[:3]
+        leaderboard = leaderboard[:LEADERBOARD_SIZE]
 
         self.leaderboard = leaderboard
-        self._save_leaderboard()
+        return True
 
     def get_leaderboard(self):
         """
-        Returns the current top 3 scores as a list of dicts
+        Returns the current top LEADERBOARD_SIZE scores as a list of dicts
         """
         return self.leaderboard
@@ -0,0 +1,66 @@
+"""
+Precompiled lookup table for every shape and rotation in SHAPES.
+
+The flat 4x4 indices in game.data.SHAPES are decoded once at import time,
+so hot paths (collision checks, freezing, rendering, drag handling) can read
+offsets, bounds and bitmasks instead of recomputing them on every call.
+"""
+from game.data import SHAPES, BLOCK_GRID_SIZE
+
+
+class ShapeInfo:
+    """
+    Decoded form of a single shape rotation.
+
+    :ivar cells: Tuple of (dx, dy) offsets inside the 4x4 box
+    :ivar cell_set: Frozenset of the same offsets, for membership tests
+    :ivar cell_count: Number of cells in the shape
+    :ivar min_x: Leftmost occupied column of the box
+    :ivar min_y: Topmost occupied row of the box
+    :ivar max_x: Rightmost occupied column of the box
+    :ivar max_y: Bottommost occupied row of the box
+    :ivar row_masks: Tuple of (dy, mask) pairs, bit dx set if (dx, dy) is occupied
+    :ivar bottom_profile: Tuple of (dx, dy) pairs, the lowest occupied row of each occupied column
+    """
+    __slots__ = (
+        "cells", "cell_set", "cell_count",
+        "min_x", "min_y", "max_x", "max_y",
+        "width", "height", "row_masks", "bottom_profile"
+    )
+
+    def __init__(self, indices):
+        self.cells = tuple((idx % BLOCK_GRID_SIZE, idx // BLOCK_GRID_SIZE) for idx in indices)
+        self.cell_set = frozenset(self.cells)
+        self.cell_count = len(self.cells)
+
+        xs = [dx for dx, _ in self.cells]
+        ys = [dy for _, dy in self.cells]
+        self.min_x = min(xs)
+        self.min_y = min(ys)
+        self.max_x = max(xs)
+        self.max_y = max(ys)
+        self.width = self.max_x - self.min_x + 1
+        self.height = self.max_y - self.min_y + 1
+
+        masks = {}
+        for dx, dy in self.cells:
+            masks[dy] = masks.get(dy, 0) | (1 << dx)
+        self.row_masks = tuple(sorted(masks.items()))
+
+        bottoms = {}
+        for dx, dy in self.cells:
+            bottoms[dx] = max(bottoms.get(dx, dy), dy)
+        self.bottom_profile = tuple(sorted(bottoms.items()))
+
+
+SHAPE_TABLE = tuple(
+    tuple(ShapeInfo(indices) for indices in rotations)
+    for rotations in SHAPES
+)
+
+
+def get_shape_info(shape: int, rotation: int) -> ShapeInfo:
+    """
+    Returns the precompiled ShapeInfo for a shape index and rotation.
+    """
+    return SHAPE_TABLE[shape][rotation]
@@ -0,0 +1,202 @@
+"""
+Plays many seeded headless games across a process pool and streams
+per-game statistics to CSV or JSONL, for tuning SHAPE_WEIGHTS and BOMB_CHANCE.
+
+Run from the tetris_boom directory, for example:
+
+    python -m game.simulation.batch_runner --games 2000 --output results.jsonl
+    python -m game.simulation.batch_runner --games 2000 --bomb-chance 0.05 --format csv --output bombs.csv
+    python -m game.simulation.batch_runner --games 200 --policy bot --output soak.jsonl
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+from functools import partial
+
+from game.block_factory import BlockFactory
+from game.data import SCORE_CHECKPOINT_INTERVAL
+from game.simulation.headless_engine import HeadlessEngine, TETRIS
+from game.simulation.policies import RandomPolicy, POLICIES
+
+STEP_DT = 1 / 30
+MAX_STEPS = 20000
+
+RESULT_FIELDS = [
+    "game_id", "seed", "score", "lines_cleared", "bombs_triggered",
+    "blocks_placed", "steps", "duration_s", "mode_switches", "final_mode", "finished"
+]
+
+
+def play_game(game_id: int, base_seed: int = 0, policy_factory=RandomPolicy,
+              shape_weights=None, bomb_chance=None, rows=20, cols=10,
+              checkpoint_interval=SCORE_CHECKPOINT_INTERVAL, max_steps=MAX_STEPS,
+              board_backend="bitboard"):
+    """
+    Plays a single headless game and returns its statistics as a dict.
+
+    :param game_id: Index of the game in the batch; the game's seed is base_seed + game_id
+    :param policy_factory: Picklable callable returning a fresh Policy
+    :param max_steps: Safety limit; games stopped by it are reported with finished=False
+    """
+    seed = base_seed + game_id
+
+    engine = HeadlessEngine(
+        rows=rows,
+        cols=cols,
+        board_backend=board_backend,
+        block_factory=BlockFactory(seed=seed, shape_weights=shape_weights, bomb_chance=bomb_chance),
+        start_mode=TETRIS,
+        checkpoint_interval=checkpoint_interval
+    )
+    policy = policy_factory()
+    policy.reset(seed)
+
+    steps = 0
+    while not engine.game_over and steps < max_steps:
+        engine.step(policy.choose_action(engine), dt=STEP_DT)
+        steps += 1
+
+    return {
+        "game_id": game_id,
+        "seed": seed,
+        "score": engine.score,
+        "lines_cleared": engine.lines_cleared,
+        "bombs_triggered": engine.bombs_triggered,
+        "blocks_placed": engine.blocks_placed,
+        "steps": steps,
+        "duration_s": round(engine.elapsed, 3),
+        "mode_switches": engine.mode_switches,
+        "final_mode": engine.mode,
+        "finished": engine.game_over
+    }
+
+
+class ResultWriter:
+    def __init__(self, stream, fmt: str = "jsonl"):
+        """
+        Writes one line per finished game and flushes it immediately.
+
+        :param stream: Text stream to write to
+        :param fmt: "jsonl" or "csv"
+        """
+        if fmt not in ("jsonl", "csv"):
+            raise ValueError(f"Unknown output format '{fmt}'")
+        self.stream = stream
+        self.fmt = fmt
+        self._csv_writer = None
+        if fmt == "csv":
+            self._csv_writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+            self._csv_writer.writeheader()
+
+    def write(self, result: dict):
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(result)
+        else:
+            self.stream.write(json.dumps(result) + "\n")
+        self.stream.flush()
+
+
+def summarize(results: list) -> dict:
+    """
+    Aggregates per-game results into batch-level statistics.
+    """
+    if not results:
+        return {"games": 0}
+
+    scores = [result["score"] for result in results]
+    return {
+        "games": len(results),
+        "score_mean": statistics.fmean(scores),
+        "score_median": statistics.median(scores),
+        "score_max": max(scores),
+        "lines_mean": statistics.fmean(result["lines_cleared"] for result in results),
+        "bombs_mean": statistics.fmean(result["bombs_triggered"] for result in results),
+        "blocks_mean": statistics.fmean(result["blocks_placed"] for result in results),
+        "duration_mean_s": statistics.fmean(result["duration_s"] for result in results),
+        "mode_switches_mean": statistics.fmean(result["mode_switches"] for result in results),
+        "unfinished": sum(1 for result in results if not result["finished"])
+    }
+
+
+def run_batch(games: int, base_seed: int = 0, workers: int = None, writer: ResultWriter = None,
+              chunksize: int = None, **game_options) -> dict:
+    """
+    Plays `games` seeded games, spread over `workers` processes, streaming each
+    result to `writer` as soon as it finishes.
+
+    :param games: Number of games to play
+    :param base_seed: Seed of game 0; game i uses base_seed + i
+    :param workers: Number of worker processes (default: os.cpu_count(); 1 runs in-process)
+    :param writer: Optional ResultWriter for per-game results
+    :param chunksize: Games handed to a worker at once (default: spread evenly in small chunks)
+    :param game_options: Extra keyword arguments for play_game()
+    :return: The summary from summarize()
+    """
+    workers = workers or os.cpu_count() or 1
+    play = partial(play_game, base_seed=base_seed, **game_options)
+    results = []
+
+    def collect(result):
+        results.append(result)
+        if writer is not None:
+            writer.write(result)
+
+    if workers == 1:
+        for game_id in range(games):
+            collect(play(game_id))
+    else:
+        chunksize = chunksize or max(1, games // (workers * 8))
+        with multiprocessing.Pool(processes=workers) as pool:
+            for result in pool.imap_unordered(play, range(games), chunksize=chunksize):
+                collect(result)
+
+    return summarize(results)
+
+
+def _parse_weights(value: str):
+    return [float(weight) for weight in value.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch self-play for Tetris BOOM balancing.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default=None, help="File for per-game results (default: stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--shape-weights", type=_parse_weights, default=None,
+                        help="Comma separated weight per shape in SHAPES")
+    parser.add_argument("--bomb-chance", type=float, default=None)
+    parser.add_argument("--checkpoint-interval", type=int, default=SCORE_CHECKPOINT_INTERVAL)
+    parser.add_argument("--max-steps", type=int, default=MAX_STEPS)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random",
+                        help="Who plays: random moves or the placement-search bot")
+    args = parser.parse_args(argv)
+
+    stream = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        summary = run_batch(
+            args.games,
+            base_seed=args.seed,
+            workers=args.workers,
+            writer=ResultWriter(stream, args.format),
+            shape_weights=args.shape_weights,
+            bomb_chance=args.bomb_chance,
+            checkpoint_interval=args.checkpoint_interval,
+            max_steps=args.max_steps,
+            policy_factory=POLICIES[args.policy]
+        )
+    finally:
+        if args.output:
+            stream.close()
+
+    print(json.dumps(summary, indent=4), file=sys.stderr)
+    return summary
+
+
+if __name__ == "__main__":
+    main()
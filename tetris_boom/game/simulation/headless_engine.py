@@ -0,0 +1,258 @@
+"""
+Headless simulation of Tetris BOOM.
+
+Runs the same rules as the pygame modes (see game.rules) without importing
+pygame, a renderer, a sound manager or a score manager. Time only advances
+through the dt passed to step(), and the player is replaced by abstract
+actions, which makes it suitable for bots and bulk simulation.
+"""
+from game.board import Board
+from game.block_factory import BlockFactory
+from game.data import NEXT_BLOCKS_COUNT, DEFAULT_GRAVITY, SCORE_CHECKPOINT_INTERVAL
+from game.rules import drop_interval, place_block, points_for_lines, next_checkpoint
+
+TETRIS = "tetris"
+BLOCKBLAST = "blockblast"
+
+MOVE_LEFT = ("move", -1)
+MOVE_RIGHT = ("move", 1)
+ROTATE = ("rotate",)
+SOFT_DROP = ("soft_drop",)
+HARD_DROP = ("hard_drop",)
+
+
+def place(index: int, x: int, y: int):
+    """
+    Builds a BlockBlast action that places next_blocks[index] with its 4x4 box at (x, y).
+    """
+    return ("place", index, x, y)
+
+
+class StepResult:
+    """
+    Outcome of a single HeadlessEngine.step() call.
+    """
+    __slots__ = (
+        "action_applied", "blocks_placed", "lines_cleared", "bombs_triggered",
+        "cells_exploded", "points", "mode_switched", "mode", "game_over"
+    )
+
+    def __init__(self, mode: str):
+        self.action_applied = False
+        self.blocks_placed = 0
+        self.lines_cleared = 0
+        self.bombs_triggered = 0
+        self.cells_exploded = 0
+        self.points = 0
+        self.mode_switched = False
+        self.mode = mode
+        self.game_over = False
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"StepResult({fields})"
+
+
+class HeadlessEngine:
+    def __init__(self, rows=20, cols=10, board_backend="list", block_factory=None, seed=None,
+                 start_mode=TETRIS, switch_modes=True,
+                 checkpoint_interval=SCORE_CHECKPOINT_INTERVAL, gravity=DEFAULT_GRAVITY):
+        """
+        The same seed and the same sequence of step() calls always replay the same game.
+
+        :param rows: Board height
+        :param cols: Board width
+        :param board_backend: Board backend name (see game.board.BOARD_BACKENDS)
+        :param block_factory: Factory for new blocks (default: BlockFactory(seed=seed))
+        :param seed: Seed for the default block factory
+        :param start_mode: TETRIS or BLOCKBLAST
+        :param switch_modes: Switch modes on score checkpoints like GameController does
+        :param checkpoint_interval: Points between two mode switches
+        :param gravity: Tetris fall speed in rows per second
+        """
+        self.rows = rows
+        self.cols = cols
+        self.board_backend = board_backend
+        self.block_factory = block_factory or BlockFactory(seed=seed)
+        self.start_mode = start_mode
+        self.switch_modes = switch_modes
+        self.checkpoint_interval = checkpoint_interval
+        self.gravity = gravity
+        self.reset()
+
+    def reset(self, seed=None):
+        """
+        Starts a new game on an empty board.
+
+        :param seed: If given, reseeds the block factory first
+        """
+        if seed is not None:
+            self.block_factory.seed(seed)
+        self.board = Board(self.rows, self.cols, backend=self.board_backend)
+        self.mode = self.start_mode
+        self.current_block = self.block_factory.create_block()
+        self.next_blocks = [self.block_factory.create_block() for _ in range(NEXT_BLOCKS_COUNT)]
+        self.fall_timer = 0.0
+        self.elapsed = 0.0
+        self.score = 0
+        self.lines_cleared = 0
+        self.bombs_triggered = 0
+        self.blocks_placed = 0
+        self.mode_switches = 0
+        self.last_checkpoint = 0
+        self.game_over = False
+        if self.mode == TETRIS:
+            self.game_over = not self.board.is_valid_position(self.current_block)
+        else:
+            self._check_blockblast_game_over()
+
+    def step(self, action=None, dt: float = 0.0) -> StepResult:
+        """
+        Applies one action (or None), then advances Tetris gravity by dt seconds.
+
+        :param action: One of the action constants or a place(...) tuple
+        :param dt: Simulated time in seconds
+        :return: A StepResult describing what happened
+        """
+        result = StepResult(self.mode)
+        if self.game_over:
+            result.game_over = True
+            return result
+
+        if action is not None:
+            if self.mode == TETRIS:
+                result.action_applied = self._apply_tetris_action(action, result)
+            else:
+                result.action_applied = self._apply_blockblast_action(action, result)
+
+        if self.mode == TETRIS and not self.game_over and dt > 0:
+            self._advance_gravity(dt, result)
+
+        result.mode = self.mode
+        result.game_over = self.game_over
+        return result
+
+    def legal_placements(self, index: int):
+        """
+        Returns every (x, y) where next_blocks[index] can be placed in BlockBlast mode.
+        """
+        block = self.next_blocks[index]
+        info = block.get_shape_info()
+        fits = self.board.backend.fits
+        return [
+            (x, y)
+            for y in range(-info.min_y, self.rows - info.max_y)
+            for x in range(-info.min_x, self.cols - info.max_x)
+            if fits(block.shape, block.rotation, x, y)
+        ]
+
+    def _apply_tetris_action(self, action, result: StepResult) -> bool:
+        kind = action[0]
+        block = self.current_block
+        board = self.board
+
+        if kind == "move":
+            block.move(action[1], 0)
+            if not board.is_valid_position(block):
+                block.move(-action[1], 0)
+                return False
+            return True
+
+        if kind == "rotate":
+            block.rotate()
+            if not board.is_valid_position(block):
+                block.undo_rotate()
+                return False
+            return True
+
+        if kind == "soft_drop":
+            self._fall_one_row(result)
+            return True
+
+        if kind == "hard_drop":
+            block.move(0, board.drop_distance(block))
+            self._lock_current_block(result)
+            return True
+
+        raise ValueError(f"Unknown Tetris action {action!r}")
+
+    def _apply_blockblast_action(self, action, result: StepResult) -> bool:
+        if action[0] != "place":
+            raise ValueError(f"Unknown BlockBlast action {action!r}")
+
+        _, index, x, y = action
+        block = self.next_blocks[index]
+        info = block.get_shape_info()
+        on_board = 0 <= y + info.min_y and y + info.max_y < self.rows
+        if not on_board or not self.board.fits(block.shape, block.rotation, x, y):
+            return False
+
+        block.x = x
+        block.y = y
+        self._place(block, result)
+        self.next_blocks.pop(index)
+        self.next_blocks.append(self.block_factory.create_block())
+        self._check_blockblast_game_over()
+        self._check_mode_switch(result)
+        return True
+
+    def _advance_gravity(self, dt: float, result: StepResult):
+        self.elapsed += dt
+        self.fall_timer += dt
+        while self.mode == TETRIS and not self.game_over:
+            interval = drop_interval(self.gravity, is_bomb=self.current_block.is_bomb)
+            if self.fall_timer < interval:
+                break
+            self.fall_timer -= interval
+            self._fall_one_row(result)
+
+    def _fall_one_row(self, result: StepResult):
+        block = self.current_block
+        block.move(0, 1)
+        if not self.board.is_valid_position(block):
+            block.move(0, -1)
+            self._lock_current_block(result)
+
+    def _lock_current_block(self, result: StepResult):
+        self._place(self.current_block, result)
+        self.fall_timer = 0.0
+        self.current_block = self.block_factory.create_block()
+        if not self.board.is_valid_position(self.current_block):
+            self.game_over = True
+        self._check_mode_switch(result)
+
+    def _place(self, block, result: StepResult):
+        lines_cleared, cells_exploded = place_block(self.board, block)
+        points = points_for_lines(lines_cleared)
+
+        self.score += points
+        self.lines_cleared += lines_cleared
+        self.blocks_placed += 1
+        result.blocks_placed += 1
+        result.lines_cleared += lines_cleared
+        result.cells_exploded += cells_exploded
+        result.points += points
+        if block.is_bomb:
+            self.bombs_triggered += 1
+            result.bombs_triggered += 1
+
+    def _check_mode_switch(self, result: StepResult):
+        if not self.switch_modes or self.game_over:
+            return
+        checkpoint = next_checkpoint(self.score, self.last_checkpoint, self.checkpoint_interval)
+        if checkpoint is None:
+            return
+
+        self.last_checkpoint = checkpoint
+        self.mode = BLOCKBLAST if self.mode == TETRIS else TETRIS
+        self.mode_switches += 1
+        self.fall_timer = 0.0
+        result.mode_switched = True
+        if self.mode == BLOCKBLAST:
+            self._check_blockblast_game_over()
+
+    def _check_blockblast_game_over(self):
+        if self.mode != BLOCKBLAST:
+            return
+        if not any(self.board.has_space_for_block(block) for block in self.next_blocks):
+            self.game_over = True
@@ -0,0 +1,154 @@
+"""
+Policies that play the headless engine.
+
+A policy only needs two methods: reset(seed) at the start of every game and
+choose_action(engine), which returns the next action for engine.step().
+Policies are created inside worker processes, so pass the class (or another
+picklable callable) to the batch runner rather than an instance.
+"""
+import random
+from abc import ABC, abstractmethod
+
+from game.shape_table import SHAPE_TABLE
+from game.bots.tetris_bot import TetrisBot
+from game.bots.blockblast_solver import BlockBlastSolver, move_fits
+from game.data import NEXT_BLOCKS_COUNT
+from game.simulation.headless_engine import (
+    TETRIS, MOVE_LEFT, MOVE_RIGHT, ROTATE, HARD_DROP, place
+)
+
+
+def plan_tetris_moves(board, block, rotations: int, target_x: int):
+    """
+    Builds the action list that rotates a falling block `rotations` times and
+    slides it towards column target_x, stopping early where the board blocks it,
+    followed by a hard drop.
+
+    :return: List of actions for HeadlessEngine.step()
+    """
+    fits = board.backend.fits
+    shape_rotations = len(SHAPE_TABLE[block.shape])
+    rotation = block.rotation
+    x = block.x
+    actions = []
+
+    for _ in range(rotations % shape_rotations):
+        next_rotation = (rotation + 1) % shape_rotations
+        if not fits(block.shape, next_rotation, x, block.y):
+            break
+        rotation = next_rotation
+        actions.append(ROTATE)
+
+    step, move = (1, MOVE_RIGHT) if target_x > x else (-1, MOVE_LEFT)
+    while x != target_x and fits(block.shape, rotation, x + step, block.y):
+        x += step
+        actions.append(move)
+
+    actions.append(HARD_DROP)
+    return actions
+
+
+class Policy(ABC):
+    def reset(self, seed: int = None):
+        """
+        Called before every game with the game's seed.
+        """
+        pass
+
+    @abstractmethod
+    def choose_action(self, engine):
+        """
+        Returns the next action for the engine, or None to only let time pass.
+        """
+        pass
+
+
+class RandomPolicy(Policy):
+    """
+    Baseline player: in Tetris it picks a random rotation and column for each
+    piece and hard drops it, in BlockBlast it places a random tray piece at a
+    random legal position.
+    """
+
+    def __init__(self):
+        self.rng = random.Random()
+        self._block = None
+        self._plan = []
+
+    def reset(self, seed: int = None):
+        self.rng.seed(seed)
+        self._block = None
+        self._plan = []
+
+    def choose_action(self, engine):
+        if engine.mode == TETRIS:
+            return self._choose_tetris_action(engine)
+        return self._choose_blockblast_action(engine)
+
+    def _choose_tetris_action(self, engine):
+        block = engine.current_block
+        if block is not self._block or not self._plan:
+            self._block = block
+            self._plan = plan_tetris_moves(
+                engine.board,
+                block,
+                rotations=self.rng.randrange(4),
+                target_x=self.rng.randrange(-3, engine.cols)
+            )
+        return self._plan.pop(0)
+
+    def _choose_blockblast_action(self, engine):
+        self._block = None
+        candidates = [index for index in range(len(engine.next_blocks))]
+        self.rng.shuffle(candidates)
+        for index in candidates:
+            positions = engine.legal_placements(index)
+            if positions:
+                x, y = self.rng.choice(positions)
+                return place(index, x, y)
+        return None
+
+
+class BotPolicy(RandomPolicy):
+    """
+    Plays Tetris with the placement-search TetrisBot and BlockBlast with the
+    lookahead BlockBlastSolver, placing the solved tray one piece per step.
+    """
+
+    def __init__(self, weights: dict = None, solver: BlockBlastSolver = None):
+        super().__init__()
+        self.bot = TetrisBot(weights)
+        self.solver = solver or BlockBlastSolver()
+        self._placement = None
+        self._tray_moves = []
+
+    def reset(self, seed: int = None):
+        super().reset(seed)
+        self._placement = None
+        self._tray_moves = []
+
+    def _choose_tetris_action(self, engine):
+        self._tray_moves = []
+        block = engine.current_block
+        if block is not self._block:
+            self._block = block
+            self._placement = self.bot.choose_placement(engine.board, block)
+        if self._placement is None:
+            return HARD_DROP
+        return self.bot.next_action(engine.board, block, self._placement)
+
+    def _choose_blockblast_action(self, engine):
+        self._block = None
+        tray = engine.next_blocks[:NEXT_BLOCKS_COUNT]
+        if not self._tray_moves or not move_fits(engine.board, tray, self._tray_moves[0]):
+            solution = self.solver.solve(engine.board, tray)
+            self._tray_moves = list(solution.moves)
+        if not self._tray_moves:
+            return None
+        return place(*self._tray_moves.pop(0))
+
+
+POLICIES = {
+    "random": RandomPolicy,
+    "bot": BotPolicy
+}
@@ -1,58 +1,115 @@
 import os
 import pygame
+from concurrent.futures import ThreadPoolExecutor
 from game.resource_path import resource_path
 
+NO_AUDIO_ENV = "TETRIS_BOOM_NO_AUDIO"
+
+SOUND_EFFECTS = (
+    "game_start",
+    "game_over",
+    "rotate_block",
+    "place_block",
+    "line_clear_1",
+    "line_clear_2",
+    "bomb",
+    "switch_modes",
+    "highscore",
+    "easter_egg",
+)
+
+MUSIC_TRACKS = ("music_1", "music_1_loop")
+MUSIC_VOLUME = 0.4
+
+
+def audio_disabled_by_env() -> bool:
+    """
+    Returns True if the TETRIS_BOOM_NO_AUDIO environment variable asks for no audio.
+    """
+    return os.environ.get(NO_AUDIO_ENV, "").strip().lower() not in ("", "0", "false", "no")
+
+
 class SoundManager:
-    def __init__(self):
+    def __init__(self, enabled: bool = True, preload: bool = True):
         """
-        Initializes the sound manager and loads all necessary sounds.
+        Initializes the sound manager.
+
+        Sound effects are decoded on a background thread (or on first play if preload is off),
+        so constructing the manager does not hold up the first frame. Music tracks are not
+        decoded at all, they are streamed through pygame.mixer.music when played.
+
+        :param enabled: If False, every method is a no-op and the mixer is never touched.
+                        Audio is also disabled if the mixer could not be initialized.
+        :param preload: Whether to start decoding the sound effects in the background right away.
         """
         self.sound_path = resource_path("assets/sounds")
+        self.enabled = enabled and pygame.mixer.get_init() is not None
         self.sounds = {}
+        self.current_music = None
+        self._pending = {}
+        self._executor = None
 
-        self._load_sounds()
-        self._set_default_volumes()
+        if self.enabled and preload:
+            self._load_sounds()
 
     def _load_sounds(self):
         """
-        Loads all required sound files from the given sound directory.
-        """
-        def load(name):
-            return pygame.mixer.Sound(os.path.join(self.sound_path, f"{name}.ogg"))
-
-        self.sounds = {
-            "game_start": load("game_start"),
-            "game_over": load("game_over"),
-            "music_1": load("music_1"),
-            "music_1_loop": load("music_1_loop"),
-            "rotate_block": load("rotate_block"),
-            "place_block": load("place_block"),
-            "line_clear_1": load("line_clear_1"),
-            "line_clear_2": load("line_clear_2"),
-            "bomb": load("bomb"),
-            "switch_modes": load("switch_modes"),
-            "highscore": load("highscore"),
-            "easter_egg": load("easter_egg"),
-        }
+        Queues every sound effect for decoding on a background thread.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sound-loader")
+        for name in SOUND_EFFECTS:
+            self._pending[name] = self._executor.submit(self._load_sound, name)
+
+    def _load_sound(self, name: str):
+        """
+        Decodes a single sound effect and applies its default volume.
+        """
+        sound = pygame.mixer.Sound(os.path.join(self.sound_path, f"{name}.ogg"))
+        sound.set_volume(self._default_volume(name))
+        return sound
+
+    def _get_sound(self, name: str):
+        """
+        Returns a decoded sound effect, waiting for the background load or
+        loading it now if needed. Returns None for unknown names.
+        """
+        sound = self.sounds.get(name)
+        if sound is None and name in SOUND_EFFECTS:
+            pending = self._pending.pop(name, None)
+            sound = pending.result() if pending is not None else self._load_sound(name)
+            self.sounds[name] = sound
+        return sound
 
     def play(self, sound_name: str, loop=False):
         """
-        Plays a sound effect by its identifier.
+        Plays a sound effect or music track by its identifier.
 
-        :param sound_name: The key of the sound to play (as defined in self.sounds).
+        :param sound_name: The name of the sound to play (one of SOUND_EFFECTS or MUSIC_TRACKS).
         """
-        if sound_name not in self.sounds:
-            print(f"[SoundManager] Sound '{sound_name}' not found.")
+        if not self.enabled:
             return
 
-        sound = self.sounds[sound_name]
         loops = -1 if loop else 0
-        
-        if sound_name in ["music_1", "music_1_loop"] and loop:
-            self._stop_all_music()
-            sound.play(loops=-1)
-        else:
-            sound.play(loops=loops)
+
+        if sound_name in MUSIC_TRACKS:
+            self._play_music(sound_name, loops)
+            return
+
+        sound = self._get_sound(sound_name)
+        if sound is None:
+            print(f"[SoundManager] Sound '{sound_name}' not found.")
+            return
+
+        sound.play(loops=loops)
+
+    def _play_music(self, track_name: str, loops: int):
+        """
+        Streams a music track, replacing whatever track is playing.
+        """
+        pygame.mixer.music.load(os.path.join(self.sound_path, f"{track_name}.ogg"))
+        pygame.mixer.music.set_volume(MUSIC_VOLUME)
+        pygame.mixer.music.play(loops=loops)
+        self.current_music = track_name
 
     def stop(self, sound_name: str):
         """
@@ -60,34 +117,38 @@ class SoundManager:
 
         :param sound_name: The key of the sound to stop.
         """
-        if sound_name in self.sounds:
+        if not self.enabled:
+            return
+        if sound_name in MUSIC_TRACKS:
+            if self.current_music == sound_name:
+                self._stop_all_music()
+        elif sound_name in self.sounds:
             self.sounds[sound_name].stop()
 
     def stop_all(self):
         """
         Stops all currently playing sounds.
         """
+        if not self.enabled:
+            return
         pygame.mixer.stop()
+        self._stop_all_music()
 
     def _stop_all_music(self):
         """
-        Stops all music tracks to prevent duplication.
+        Stops the streamed music track.
         """
-        for name in ["music_1", "music_1_loop"]:
-            if name in self.sounds:
-                self.sounds[name].stop()
+        pygame.mixer.music.stop()
+        self.current_music = None
 
-    def _set_default_volumes(self):
-        """Set default volumes for different sound types."""
-        for sfx_name, sound in self.sounds.items():
-            if "music" in sfx_name:
-                sound.set_volume(0.4)
-            elif "line_clear" in sfx_name:
-                sound.set_volume(0.6)
-            elif "game_over" in sfx_name or "highscore" in sfx_name:
-                sound.set_volume(0.8)
-            else:
-                sound.set_volume(0.5)
+    def _default_volume(self, sfx_name: str) -> float:
+        """Returns the default volume for a sound type."""
+        if "line_clear" in sfx_name:
+            return 0.6
+        elif "game_over" in sfx_name or "highscore" in sfx_name:
+            return 0.8
+        else:
+            return 0.5
 
     def set_master_volume(self, volume: float):
         """
@@ -95,4 +156,15 @@ class SoundManager:
 
         :param volume: A float between 0.0 and 1.0.
         """
-        pygame.mixer.music.set_volume(volume)
\ No newline at end of file
+        if not self.enabled:
+            return
+        pygame.mixer.music.set_volume(volume)
+
+    def close(self):
+        """
+        Stops the background loader. Call this before pygame.quit().
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
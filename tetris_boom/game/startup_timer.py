@@ -0,0 +1,74 @@
+import json
+import time
+
+STARTUP_PHASES = ("import", "pygame_init", "sound_load", "font_load", "first_frame")
+STARTUP_REPORT_ENV = "TETRIS_BOOM_STARTUP_REPORT"
+
+
+class StartupTimer:
+    def __init__(self, clock=time.perf_counter):
+        """
+        Measures how long each step of a cold start takes, from the moment the timer is
+        created up to the first frame on screen.
+
+        Each phase is marked once, right after it finishes, and is attributed the time since
+        the previous mark. Marking a phase again is ignored, so the first frame can be marked
+        from every place that may show it first. Times are kept in milliseconds.
+
+        :param clock: Function returning the current time in seconds (default is time.perf_counter)
+        """
+        self._clock = clock
+        self.started = clock()
+        self.phases = {}
+        self._last_mark = self.started
+        self._listeners = []
+
+    def mark(self, phase: str):
+        """
+        Ends the given startup phase. Listeners are notified once the first frame is marked.
+
+        :param phase: One of STARTUP_PHASES
+        """
+        if phase not in STARTUP_PHASES:
+            raise ValueError(f"Unknown startup phase '{phase}' (available: {', '.join(STARTUP_PHASES)})")
+        if phase in self.phases:
+            return
+        now = self._clock()
+        self.phases[phase] = (now - self._last_mark) * 1000.0
+        self._last_mark = now
+
+        if phase == "first_frame":
+            for callback in list(self._listeners):
+                callback(self)
+
+    def subscribe(self, callback):
+        """
+        Registers a callback(timer) called when the first frame is marked.
+        """
+        self._listeners.append(callback)
+
+    def total(self) -> float:
+        """
+        Returns the time from the timer's creation to the last mark, in milliseconds.
+        """
+        return (self._last_mark - self.started) * 1000.0
+
+    def report(self):
+        """
+        Returns the time of every marked phase, in STARTUP_PHASES order, plus the total.
+        """
+        report = {phase: round(self.phases[phase], 3) for phase in STARTUP_PHASES if phase in self.phases}
+        report["total"] = round(self.total(), 3)
+        return report
+
+    def dump(self, stream):
+        """
+        Writes the report to a stream as a single JSON line.
+
+        :param stream: A writable text stream
+        """
+        stream.write(json.dumps(self.report()) + "\n")
+
+
+# Process-wide timer, started as soon as this module is first imported
+startup_timer = StartupTimer()
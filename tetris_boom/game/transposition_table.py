@@ -0,0 +1,106 @@
+import sys
+from collections import OrderedDict
+
+TRANSPOSITION_TABLE_SIZE = 10000   # Entries kept before the least recently used ones are evicted
+
+
+class TranspositionTable:
+    def __init__(self, max_entries: int = TRANSPOSITION_TABLE_SIZE):
+        """
+        Bounded cache of search results for board positions, so a lookahead that reaches
+        the same board with the same pieces left along different move orders evaluates it once.
+
+        Entries are keyed on (board hash, pieces): the board's zobrist_hash and any hashable
+        description of the pieces still to place, e.g. a sorted tuple of (shape, rotation, is_bomb).
+        When full, the least recently used entry is evicted. Hit, miss and eviction counters
+        and a memory estimate are kept so the table can be sized from real runs (see stats()).
+
+        :param max_entries: Maximum number of entries
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._entry_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, board_hash: int, pieces):
+        """
+        Returns the value stored for this board and pieces, or None, and counts the lookup.
+        """
+        key = (board_hash, pieces)
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, board_hash: int, pieces, value):
+        """
+        Stores a value for this board and pieces, evicting the least recently used entry if full.
+        """
+        key = (board_hash, pieces)
+        old_value = self._entries.pop(key, None)
+        if old_value is not None:
+            self._entry_bytes -= self._size_of(key, old_value)
+        elif len(self._entries) >= self.max_entries:
+            old_key, old_value = self._entries.popitem(last=False)
+            self._entry_bytes -= self._size_of(old_key, old_value)
+            self.evictions += 1
+        self._entries[key] = value
+        self._entry_bytes += self._size_of(key, value)
+
+    def clear(self):
+        """
+        Drops every entry. The counters are kept; use reset_stats() to zero them.
+        """
+        self._entries.clear()
+        self._entry_bytes = 0
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def hit_rate(self) -> float:
+        """
+        Returns the share of lookups that found an entry, 0.0 before the first lookup.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def memory_usage(self) -> int:
+        """
+        Returns an estimate in bytes of the table and its keys and values, counting
+        one level of nesting inside each (the tuples, not the ints shared between them).
+        """
+        return sys.getsizeof(self._entries) + self._entry_bytes
+
+    def stats(self) -> dict:
+        """
+        Returns the counters as a dict, for logging or sizing the table.
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate(), 4),
+            "memory_bytes": self.memory_usage()
+        }
+
+    @staticmethod
+    def _size_of(key, value) -> int:
+        size = sys.getsizeof(key) + sum(sys.getsizeof(part) for part in key)
+        size += sys.getsizeof(value)
+        if isinstance(value, tuple):
+            size += sum(sys.getsizeof(part) for part in value)
+        return size
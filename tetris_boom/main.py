@@ -1,8 +1,68 @@
-from game.controller import GameController
+import argparse
+import multiprocessing
 import os
+import sys
+from game.startup_timer import startup_timer, STARTUP_REPORT_ENV
+from game.controller import GameController
+
+startup_timer.mark("import")
+
+
+def _default_startup_report_path():
+    """
+    Returns where the startup report goes when there is no stdout to print it to.
+    """
+    return os.path.join(os.path.expanduser("~"), ".tetris_boom", "startup.jsonl")
+
+
+def _write_startup_report(path, exit_after=False):
+    """
+    Returns a startup timer callback that writes the report to `path` ("-" for stdout)
+    and, if exit_after is set, ends the process right after. Builds without a console
+    (e.g. PyInstaller --noconsole) have no stdout; there "-" appends to
+    ~/.tetris_boom/startup.jsonl instead.
+    """
+    def write_report(timer):
+        target = path
+        if target == "-" and sys.stdout is None:
+            target = _default_startup_report_path()
+        if target == "-":
+            timer.dump(sys.stdout)
+            sys.stdout.flush()
+        else:
+            directory = os.path.dirname(target)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(target, "a") as f:
+                timer.dump(f)
+        if exit_after:
+            raise SystemExit(0)
+    return write_report
+
+
 def main():
-    controller = GameController()
+    parser = argparse.ArgumentParser(description="Tetris BOOM!")
+    parser.add_argument("--no-audio", action="store_true",
+                        help="Run without sound and never open the audio mixer")
+    parser.add_argument("--bot", action="store_true",
+                        help="Let the built-in bots play both modes (attract mode, soak testing)")
+    parser.add_argument("--startup-report", nargs="?", const="-", metavar="PATH",
+                        default=os.environ.get(STARTUP_REPORT_ENV),
+                        help="Append startup timings as a JSON line to PATH (stdout if omitted, "
+                             "~/.tetris_boom/startup.jsonl without a console) once the first frame is shown")
+    parser.add_argument("--exit-after-startup", action="store_true",
+                        help="Quit as soon as the first frame is shown, for measuring cold start")
+    args = parser.parse_args()
+
+    if args.startup_report or args.exit_after_startup:
+        startup_timer.subscribe(_write_startup_report(args.startup_report or "-", args.exit_after_startup))
+
+    controller = GameController(audio_enabled=False if args.no_audio else None, bot=args.bot)
     controller.run_game_loop()
 
 if __name__ == "__main__":
+    # The BlockBlast hint and bot solve in worker processes. A frozen build (e.g. PyInstaller
+    # onefile) starts those workers by re-running this executable; freeze_support() turns
+    # such a launch into the worker instead of a second game.
+    multiprocessing.freeze_support()
     main()